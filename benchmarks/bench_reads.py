@@ -0,0 +1,118 @@
+"""
+Read path benchmarks: balances, trust lines, order books and transaction history, sequential and threaded.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from xrpl.wallet import Wallet
+
+
+# Accounts read by the multi-account benchmarks.
+_ACCOUNTS = 20
+
+# Trust lines of the account read by the trust line benchmarks (several account_lines pages).
+_TRUSTLINES = 1000
+
+# Transactions in the history read by the account_tx benchmarks (several pages).
+_HISTORY = 2000
+
+# Offers in the mock order book.
+_BOOK_DEPTH = 200
+
+# Threads of the threaded benchmarks.
+_THREADS = 16
+
+
+@pytest.fixture(scope='module')
+def addresses(rippled):
+    addresses = [Wallet.create().classic_address for _ in range(_ACCOUNTS)]
+    for address in addresses:
+        rippled.add_account(address, lines=4)
+    return addresses
+
+
+@pytest.fixture(scope='module')
+def trustline_holder(rippled):
+    address = Wallet.create().classic_address
+    rippled.add_account(address, lines=_TRUSTLINES)
+    return address
+
+
+@pytest.fixture(scope='module')
+def history_holder(rippled):
+    address = Wallet.create().classic_address
+    rippled.add_account(address)
+    rippled.add_history(address, _HISTORY)
+    return address
+
+
+@pytest.fixture(scope='module')
+def book(rippled, destination):
+    rippled.add_book(_BOOK_DEPTH)
+    return 'USD', destination
+
+
+def bench_get_balance(benchmark, make_xrpy, addresses):
+    client = make_xrpy()
+    benchmark(client.get_balance, addresses[0])
+
+
+def bench_get_balance_without_reserve(benchmark, make_xrpy, addresses):
+    client = make_xrpy()
+    benchmark(client.get_balance, addresses[0], False)
+
+
+def bench_get_balance_sequential(benchmark, make_xrpy, addresses):
+    client = make_xrpy()
+    benchmark.extra_info['accounts'] = len(addresses)
+    benchmark(lambda: [client.get_balance(address) for address in addresses])
+
+
+def bench_get_balance_threaded(benchmark, make_xrpy, addresses):
+    client = make_xrpy()
+    benchmark.extra_info['accounts'] = len(addresses)
+    with ThreadPoolExecutor(max_workers=_THREADS) as thread_pool:
+        benchmark(lambda: list(thread_pool.map(client.get_balance, addresses)))
+
+
+def bench_get_balances(benchmark, make_xrpy, addresses):
+    client = make_xrpy()
+    benchmark.extra_info['accounts'] = len(addresses)
+    benchmark(lambda: list(client.get_balances(addresses, max_workers=_THREADS)))
+
+
+def bench_get_account_trustlines(benchmark, make_xrpy, trustline_holder):
+    client = make_xrpy()
+    benchmark.extra_info['lines'] = _TRUSTLINES
+    response = benchmark(client.get_account_trustlines, trustline_holder)
+    assert len(response.result['lines']) == _TRUSTLINES
+
+
+def bench_get_account_trustlines_threaded(benchmark, make_xrpy, addresses):
+    client = make_xrpy()
+    benchmark.extra_info['accounts'] = len(addresses)
+    with ThreadPoolExecutor(max_workers=_THREADS) as thread_pool:
+        benchmark(lambda: list(thread_pool.map(client.get_account_trustlines, addresses)))
+
+
+def bench_order_book_buy(benchmark, make_xrpy, addresses, book):
+    client = make_xrpy()
+    response = benchmark(client.order_book_buy, addresses[0], *book)
+    assert len(response.result['offers']) == _BOOK_DEPTH
+
+
+def bench_order_book_buy_threaded(benchmark, make_xrpy, addresses, book):
+    client = make_xrpy()
+    benchmark.extra_info['requests'] = len(addresses)
+    with ThreadPoolExecutor(max_workers=_THREADS) as thread_pool:
+        benchmark(lambda: list(thread_pool.map(lambda address: client.order_book_buy(address, *book), addresses)))
+
+
+@pytest.mark.parametrize('prefetch', [False, True], ids=['sequential', 'prefetch'])
+def bench_iter_account_transactions(benchmark, make_xrpy, history_holder, prefetch):
+    client = make_xrpy()
+    benchmark.extra_info['transactions'] = _HISTORY
+    transactions = benchmark(lambda: list(client.iter_account_transactions(history_holder, prefetch=prefetch)))
+    assert len(transactions) == _HISTORY
@@ -0,0 +1,107 @@
+"""
+Write path benchmarks: transfer_xrp bursts and advanced_delete_account, sequential and threaded.
+
+Bursts are submitted without waiting for validation, so they measure signing and submission; the ``validated``
+benchmarks include the wait for the next mock ledger close.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from xrpl.wallet import Wallet
+
+from xrpy.tickets import TicketPool
+
+
+# Payments per burst.
+_BURST = 20
+
+# Threads of the threaded benchmarks.
+_THREADS = 16
+
+# Rounds of the write benchmarks, which change ledger state and are too slow for calibration.
+_ROUNDS = 3
+
+# Trust lines and offers of an account deleted by advanced_delete_account.
+_DELETE_LINES = 6
+_DELETE_OFFERS = 4
+
+
+# Preliminary results of payments that will apply: threads can submit Sequences out of order, and the server holds
+# those until the gap is filled.
+_ACCEPTED = frozenset({'tesSUCCESS', 'terQUEUED', 'terPRE_SEQ'})
+
+
+def _accepted(responses) -> bool:
+    return all(response.result.get('engine_result') in _ACCEPTED for response in responses)
+
+
+def bench_transfer_xrp_validated(benchmark, make_xrpy, funded_wallet, destination):
+    client = make_xrpy()
+    response = benchmark.pedantic(client.transfer_xrp, (funded_wallet, 1, destination), rounds=_ROUNDS)
+    assert response.result['meta']['TransactionResult'] == 'tesSUCCESS'
+
+
+def bench_transfer_xrp_burst_sequential(benchmark, make_xrpy, funded_wallet, destination):
+    client = make_xrpy()
+    benchmark.extra_info['transactions'] = _BURST
+
+    def burst():
+        return [client.transfer_xrp(funded_wallet, 1, destination, wait_for_validation=False) for _ in range(_BURST)]
+
+    assert _accepted(benchmark.pedantic(burst, rounds=_ROUNDS))
+
+
+@pytest.mark.parametrize('local_sequences', [False, True], ids=['autofill', 'local-sequences'])
+def bench_transfer_xrp_burst_threaded(benchmark, make_xrpy, funded_wallet, destination, local_sequences):
+    client = make_xrpy(local_sequences=local_sequences)
+    benchmark.extra_info['transactions'] = _BURST
+
+    def burst():
+        with ThreadPoolExecutor(max_workers=_THREADS) as thread_pool:
+            return list(thread_pool.map(
+                lambda _: client.transfer_xrp(funded_wallet, 1, destination, wait_for_validation=False), range(_BURST)
+            ))
+
+    # Without local sequences, threads race for the same Sequence and some payments are rejected; that cost is
+    # what this benchmark shows, so the results are not asserted.
+    responses = benchmark.pedantic(burst, rounds=_ROUNDS)
+    if local_sequences:
+        assert _accepted(responses)
+
+
+def bench_transfer_xrp_burst_tickets(benchmark, make_xrpy, funded_wallet, destination):
+    client = make_xrpy(ticket_pool=TicketPool(size=2 * _BURST, low_water=_BURST))
+    benchmark.extra_info['transactions'] = _BURST
+
+    def burst():
+        with ThreadPoolExecutor(max_workers=_THREADS) as thread_pool:
+            return list(thread_pool.map(
+                lambda _: client.transfer_xrp(funded_wallet, 1, destination, wait_for_validation=False), range(_BURST)
+            ))
+
+    assert _accepted(benchmark.pedantic(burst, rounds=_ROUNDS, warmup_rounds=1))
+
+
+def bench_transfer_xrp_many(benchmark, make_xrpy, funded_wallet, destination):
+    client = make_xrpy()
+    benchmark.extra_info['transactions'] = _BURST
+
+    payments = [(destination, 1)] * _BURST
+    responses = benchmark.pedantic(client.transfer_xrp_many, (funded_wallet, payments), rounds=_ROUNDS)
+    assert all(response.result['meta']['TransactionResult'] == 'tesSUCCESS' for response in responses)
+
+
+@pytest.mark.parametrize('threaded', [False, True], ids=['sequential', 'threaded'])
+def bench_advanced_delete_account(benchmark, make_xrpy, rippled, destination, threaded):
+    client = make_xrpy()
+    benchmark.extra_info['transactions'] = _DELETE_OFFERS + _DELETE_LINES + _DELETE_LINES // 2 + 1
+
+    def setup():
+        wallet = Wallet.create()
+        rippled.add_account(wallet.classic_address, lines=_DELETE_LINES, offers=_DELETE_OFFERS)
+        return (wallet, destination), {'threaded': threaded}
+
+    result = benchmark.pedantic(client.advanced_delete_account, setup=setup, rounds=_ROUNDS)
+    assert result['DeleteAccount'].result['meta']['TransactionResult'] == 'tesSUCCESS'
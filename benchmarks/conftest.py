@@ -0,0 +1,97 @@
+"""
+Fixtures for the benchmark suite.
+
+Run from the repository root with::
+
+    python -m pytest benchmarks [--rippled-latency 0.02] [--rippled-transport ws]
+
+pytest-benchmark must be installed (``pip install xrpy[benchmarks]``); without it no benchmark is collected.
+
+Every benchmark talks to a :class:`MockRippled` started in-process, so results measure xrpy's own overhead plus the
+configured latency, not a public server.
+"""
+
+import sys
+
+from pathlib import Path
+
+import pytest
+
+try:
+    import pytest_benchmark
+except ImportError:
+    # Nothing to measure with; collect no benchmarks instead of failing on the missing fixture.
+    collect_ignore_glob = ['bench_*.py']
+
+# Benchmark the working copy rather than an installed xrpy.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import xrpl.asyncio.transaction.reliable_submission
+
+from xrpl.clients import WebsocketClient
+from xrpl.wallet import Wallet
+
+import xrpy.main
+
+from mock_rippled import MockRippled
+
+
+def pytest_addoption(parser) -> None:
+    group = parser.getgroup('rippled', 'mock rippled')
+    group.addoption('--rippled-latency', type=float, default=0.0, help='seconds every request waits (default: 0)')
+    group.addoption('--rippled-close-interval', type=float, default=0.1,
+                    help='seconds between two ledger closes (default: 0.1)')
+    group.addoption('--rippled-transport', choices=('http', 'ws'), default='http',
+                    help='client transport (default: http)')
+
+
+@pytest.fixture(scope='session')
+def rippled(request) -> MockRippled:
+    with MockRippled(
+            latency=request.config.getoption('--rippled-latency'),
+            close_interval=request.config.getoption('--rippled-close-interval'),
+    ) as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def ledger_close_polling(rippled, monkeypatch) -> None:
+    # Poll for outcomes once per mock ledger close instead of once per second, as against a real ledger.
+    monkeypatch.setattr(xrpy.main, '_POLL_INTERVAL', rippled.close_interval)
+    monkeypatch.setattr(xrpl.asyncio.transaction.reliable_submission, '_LEDGER_CLOSE_TIME', rippled.close_interval)
+
+
+@pytest.fixture
+def make_xrpy(rippled, request):
+    """
+    Build XRPY instances connected to the mock over the configured transport
+    """
+
+    clients = []
+
+    def make(**kwargs) -> xrpy.main.XRPY:
+        if request.config.getoption('--rippled-transport') == 'ws':
+            client = WebsocketClient(rippled.ws_url)
+            client.open()
+            clients.append(client)
+            return xrpy.main.XRPY(client, **kwargs)
+        return xrpy.main.XRPY(rippled.http_url, **kwargs)
+
+    yield make
+
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def funded_wallet(rippled) -> Wallet:
+    wallet = Wallet.create()
+    rippled.add_account(wallet.classic_address)
+    return wallet
+
+
+@pytest.fixture(scope='session')
+def destination(rippled) -> str:
+    address = Wallet.create().classic_address
+    rippled.add_account(address)
+    return address
@@ -0,0 +1,102 @@
+"""
+Import-time benchmark.
+
+Every scenario runs in a fresh interpreter, so nothing is cached in ``sys.modules``. ``eager`` imports the submodules
+``xrpy/__init__.py`` used to import (``deprecated`` and ``main``); ``lazy`` is a plain ``import xrpy``; the other
+scenarios show what first use of a name costs on top of it.
+
+``--baseline`` times the same scenarios against another source tree, e.g. a checkout of an older commit::
+
+    git worktree add /tmp/xrpy-baseline <commit>
+    python benchmarks/import_time.py --baseline /tmp/xrpy-baseline/src
+
+Usage::
+
+    python benchmarks/import_time.py [--runs 20] [--baseline SRC]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+from pathlib import Path
+
+
+# Source tree, so the benchmark measures the working copy rather than an installed xrpy.
+_SRC = str(Path(__file__).resolve().parent.parent / 'src')
+
+# Statements timed in each scenario.
+_SCENARIOS = {
+    'eager': 'import xrpy.deprecated, xrpy.main',
+    'lazy': 'import xrpy',
+    'from xrpy import XRPY': 'from xrpy import XRPY',
+    'lazy + XRPY': 'import xrpy; xrpy.XRPY',
+    'lazy + TicketPool': 'import xrpy; xrpy.TicketPool',
+}
+
+_TIMER = '''
+import sys, time
+sys.path.insert(0, {src!r})
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+'''
+
+
+def measure(statement: str, runs: int, src: str = _SRC) -> list:
+    """
+    Time a statement in ``runs`` fresh interpreters
+
+    :param statement: Statement to time
+    :type statement: str
+
+    :param runs: Number of interpreters
+    :type runs: int
+
+    :param src: Source tree to import xrpy from
+    :type src: str
+
+    :return: Seconds per run
+    :rtype: list
+    """
+
+    code = _TIMER.format(src=src, statement=statement)
+    return [
+        float(subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout)
+        for _ in range(runs)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure how long importing xrpy takes.')
+    parser.add_argument('--runs', type=int, default=20, help='fresh interpreters per scenario')
+    parser.add_argument('--baseline', help='source tree to compare against, e.g. a checkout of an older commit')
+    args = parser.parse_args()
+
+    trees = {'working copy': _SRC}
+    if args.baseline is not None:
+        trees['baseline'] = args.baseline
+
+    print(f'{"scenario":<24}{"tree":<16}{"min ms":>10}{"median ms":>12}')
+    for name, statement in _SCENARIOS.items():
+        # Alternate between the trees run by run, so load on the machine affects them alike.
+        timings = {tree: [] for tree in trees}
+        for _ in range(args.runs):
+            for tree, src in trees.items():
+                if timings[tree] is not None:
+                    try:
+                        timings[tree].extend(measure(statement, 1, src))
+                    except subprocess.CalledProcessError:
+                        # The baseline may not have every name, e.g. TicketPool.
+                        timings[tree] = None
+
+        for tree, values in timings.items():
+            if values is None:
+                print(f'{name:<24}{tree:<16}{"-":>10}{"-":>12}')
+            else:
+                print(f'{name:<24}{tree:<16}{min(values) * 1000:>10.1f}{statistics.median(values) * 1000:>12.1f}')
+
+
+if __name__ == '__main__':
+    main()
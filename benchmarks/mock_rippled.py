@@ -0,0 +1,685 @@
+"""
+In-process fake rippled for the benchmarks.
+
+Serves the JSON-RPC and WebSocket methods XRPY uses from an in-memory ledger. Submitted transactions are checked
+for their Sequence (or Ticket) and LastLedgerSequence, applied to the account state at once and validated when the
+next ledger closes, every ``close_interval`` seconds. Signatures are not checked. Every request waits ``latency``
+seconds before it is answered, to stand in for the network.
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+from typing import Optional, Dict, List, Tuple, Callable
+
+
+import websockets
+
+from xrpl.core.addresscodec import encode_classic_address
+from xrpl.core.binarycodec import decode
+
+
+# Index of the first ledger.
+_GENESIS = 1000
+
+# Prefix of the data hashed into a transaction id ("TXN\0").
+_HASH_PREFIX = '54584E00'
+
+# Items per page of the paginated account methods when no limit is asked for, same as rippled.
+_PAGE_LIMIT = 200
+
+# Default account balance in drops.
+_BALANCE = 1000_000000
+
+# Reserves in drops.
+_RESERVE_BASE = 10_000000
+_RESERVE_INC = 2_000000
+
+# Transactions per ledger of the history added by add_history.
+_HISTORY_PER_LEDGER = 20
+
+# Currencies used for generated trust lines and offers.
+_CURRENCIES = ('USD', 'EUR', 'BTC', 'ETH', 'SOL')
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    # Bursts of concurrent requests must not overflow the listen backlog.
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+class MockRippled:
+    """
+    Fake rippled serving JSON-RPC over HTTP and WebSocket, with a configurable per-request latency.
+    """
+
+    def __init__(self, latency: float = 0.0, close_interval: float = 0.2):
+        """
+        Fake rippled.
+
+        :param latency: Seconds every request waits before it is answered
+        :type latency: float
+
+        :param close_interval: Seconds between two ledger closes
+        :type close_interval: float
+        """
+
+        self.latency = latency
+        self.close_interval = close_interval
+
+        self.http_url: Optional[str] = None
+        self.ws_url: Optional[str] = None
+        self.counts: Dict[str, int] = {}
+
+        self._lock = threading.Lock()
+        self._accounts: Dict[str, Dict] = {}
+        self._lines: Dict[str, List[Dict]] = {}
+        self._offers: Dict[str, List[Dict]] = {}
+        self._tickets: Dict[str, List[int]] = {}
+        self._book: List[Dict] = []
+
+        self._validated_index = _GENESIS
+        self._open: List[Tuple[Dict, str]] = []
+        self._held: List[Tuple[Dict, str]] = []
+        self._transactions: Dict[str, Tuple[Dict, Optional[int]]] = {}
+        self._ledgers: Dict[int, List[str]] = {_GENESIS: []}
+        self._listeners: List[Callable[[Dict], None]] = []
+
+        self._running = False
+        self._http_server: Optional[_HTTPServer] = None
+        self._ws_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ws_server = None
+
+    # Ledger state
+
+    def add_account(self, address: str, balance: int = _BALANCE, lines: int = 0, offers: int = 0) -> None:
+        """
+        Create a funded account, optionally with trust lines and offers
+
+        :param address: Classic address
+        :type address: str
+
+        :param balance: Balance in drops
+        :type balance: int
+
+        :param lines: Number of trust lines, every other one holding a balance
+        :type lines: int
+
+        :param offers: Number of open offers
+        :type offers: int
+
+        :return: None
+        """
+
+        with self._lock:
+            self._accounts[address] = {
+                'Account': address,
+                'Balance': str(balance),
+                'Sequence': 1,
+                'OwnerCount': lines + offers,
+                'Flags': 0,
+                'LedgerEntryType': 'AccountRoot',
+            }
+            self._lines[address] = [
+                {
+                    'account': _issuer(i),
+                    'balance': str(i % 7 + 1) if i % 2 else '0',
+                    'currency': _CURRENCIES[i % len(_CURRENCIES)],
+                    'limit': '1000000',
+                    'limit_peer': '0',
+                    'quality_in': 0,
+                    'quality_out': 0,
+                }
+                for i in range(lines)
+            ]
+            self._offers[address] = [
+                {
+                    'flags': 0,
+                    'seq': 1_000_000 + i,
+                    'taker_gets': '1000000',
+                    'taker_pays': {'currency': 'USD', 'issuer': _issuer(0), 'value': str(i + 1)},
+                    'quality': str((i + 1) / 1000000),
+                }
+                for i in range(offers)
+            ]
+            self._tickets[address] = []
+
+    def add_book(self, depth: int) -> None:
+        """
+        Fill the order book returned by ``book_offers``
+
+        :param depth: Number of offers
+        :type depth: int
+
+        :return: None
+        """
+
+        with self._lock:
+            self._book = [
+                {
+                    'Account': _issuer(i),
+                    'BookDirectory': '0' * 64,
+                    'Flags': 0,
+                    'LedgerEntryType': 'Offer',
+                    'Sequence': i + 1,
+                    'TakerGets': str(1_000000 * (i + 1)),
+                    'TakerPays': {'currency': 'USD', 'issuer': _issuer(0), 'value': str(0.5 * (i + 1))},
+                    'index': f'{i:064X}',
+                    'owner_funds': '1000000000',
+                    'quality': '0.0000005',
+                }
+                for i in range(depth)
+            ]
+
+    def add_history(self, address: str, count: int, destination: Optional[str] = None) -> None:
+        """
+        Put validated payments from an account into the ledgers before the first one, for ``account_tx``
+
+        :param address: Sending account
+        :type address: str
+
+        :param count: Number of payments
+        :type count: int
+
+        :param destination: Receiving account (default: a generated address)
+        :type destination: Optional[str]
+
+        :return: None
+        """
+
+        destination = destination or _issuer(0)
+
+        with self._lock:
+            for i in range(count):
+                index = _GENESIS - 1 - i // _HISTORY_PER_LEDGER
+                tx = {
+                    'TransactionType': 'Payment',
+                    'Account': address,
+                    'Destination': destination,
+                    'Amount': str(i + 1),
+                    'Fee': '10',
+                    'Sequence': i + 1,
+                    'date': 700_000_000 + index,
+                }
+                transaction_hash = hashlib.sha256(f'{address}{i}'.encode()).hexdigest().upper()
+                self._transactions[transaction_hash] = (tx, index)
+                self._ledgers.setdefault(index, []).append(transaction_hash)
+
+    def handle(self, method: str, params: Dict) -> Dict:
+        """
+        Answer one request
+
+        :param method: rippled method
+        :type method: str
+
+        :param params: Request parameters
+        :type params: Dict
+
+        :return: Result
+        :rtype: Dict
+        """
+
+        handler = getattr(self, f'_{method}', None)
+        with self._lock:
+            self.counts[method] = self.counts.get(method, 0) + 1
+            if handler is None:
+                return {'error': 'unknownCmd', 'status': 'error'}
+            return handler(params)
+
+    def _close_ledger(self) -> None:
+        with self._lock:
+            self._validated_index += 1
+            index = self._validated_index
+            closed, self._open = self._open, []
+
+            hashes = []
+            for tx, transaction_hash in closed:
+                self._transactions[transaction_hash] = (tx, index)
+                hashes.append(transaction_hash)
+            self._ledgers[index] = hashes
+
+            messages = [{'type': 'ledgerClosed', 'ledger_index': index, 'txn_count': len(closed)}]
+            messages.extend(
+                {
+                    'type': 'transaction',
+                    'validated': True,
+                    'ledger_index': index,
+                    'engine_result': 'tesSUCCESS',
+                    'transaction': dict(tx, hash=transaction_hash),
+                    'meta': {'TransactionResult': 'tesSUCCESS'},
+                }
+                for tx, transaction_hash in closed
+            )
+            listeners = list(self._listeners)
+
+        for listener in listeners:
+            for message in messages:
+                listener(message)
+
+    # Methods. Called with the lock held.
+
+    def _page(self, items: List, params: Dict, key: str) -> Dict:
+        limit = params.get('limit') or _PAGE_LIMIT
+        start = int(params.get('marker') or 0)
+
+        ledger_index = params.get('ledger_index')
+        result = {key: items[start:start + limit], 'account': params['account'], 'status': 'success'}
+        if ledger_index in (None, 'current'):
+            result.update(ledger_current_index=self._validated_index + 1, validated=False)
+        else:
+            result.update(ledger_index=self._validated_index if ledger_index == 'validated' else ledger_index,
+                          validated=True)
+        if start + limit < len(items):
+            result['marker'] = str(start + limit)
+        return result
+
+    def _account_tx(self, params: Dict) -> Dict:
+        address = params['account']
+        ledger_min = params.get('ledger_index_min', -1)
+        ledger_max = params.get('ledger_index_max', -1)
+        ledger_min = min(self._ledgers) if ledger_min in (None, -1) else ledger_min
+        ledger_max = self._validated_index if ledger_max in (None, -1) else ledger_max
+
+        transactions = [
+            (index, transaction_hash)
+            for index in sorted(self._ledgers, reverse=not params.get('forward'))
+            if ledger_min <= index <= ledger_max
+            for transaction_hash in self._ledgers[index]
+            if address in (self._transactions[transaction_hash][0].get('Account'),
+                           self._transactions[transaction_hash][0].get('Destination'))
+        ]
+
+        limit = params.get('limit') or _PAGE_LIMIT
+        start = (params.get('marker') or {}).get('seq', 0)
+
+        result = {
+            'account': address,
+            'ledger_index_min': ledger_min,
+            'ledger_index_max': ledger_max,
+            'limit': limit,
+            'transactions': [
+                {
+                    'tx': dict(self._transactions[transaction_hash][0], hash=transaction_hash, ledger_index=index),
+                    'meta': {'TransactionResult': 'tesSUCCESS', 'TransactionIndex': 0},
+                    'validated': True,
+                }
+                for index, transaction_hash in transactions[start:start + limit]
+            ],
+            'validated': True,
+            'status': 'success',
+        }
+        if start + limit < len(transactions):
+            result['marker'] = {'ledger': transactions[start + limit][0], 'seq': start + limit}
+        return result
+
+    def _account_info(self, params: Dict) -> Dict:
+        account = self._accounts.get(params['account'])
+        if account is None:
+            return {'error': 'actNotFound', 'error_message': 'Account not found.', 'status': 'error'}
+
+        ledger_index = params.get('ledger_index')
+        result = {'account_data': dict(account), 'status': 'success'}
+        if ledger_index == 'current':
+            result['ledger_current_index'] = self._validated_index + 1
+        else:
+            result.update(ledger_index=self._validated_index, validated=True)
+        return result
+
+    def _account_lines(self, params: Dict) -> Dict:
+        if params['account'] not in self._accounts:
+            return {'error': 'actNotFound', 'status': 'error'}
+        return self._page(self._lines[params['account']], params, 'lines')
+
+    def _account_offers(self, params: Dict) -> Dict:
+        if params['account'] not in self._accounts:
+            return {'error': 'actNotFound', 'status': 'error'}
+        return self._page(self._offers[params['account']], params, 'offers')
+
+    def _account_objects(self, params: Dict) -> Dict:
+        if params['account'] not in self._accounts:
+            return {'error': 'actNotFound', 'status': 'error'}
+
+        tickets = [
+            {'Account': params['account'], 'LedgerEntryType': 'Ticket', 'TicketSequence': ticket}
+            for ticket in self._tickets[params['account']]
+        ]
+        return self._page(tickets if params.get('type') in (None, 'ticket') else [], params, 'account_objects')
+
+    def _book_offers(self, params: Dict) -> Dict:
+        limit = params.get('limit') or len(self._book)
+        return {'offers': self._book[:limit], 'ledger_current_index': self._validated_index + 1, 'status': 'success'}
+
+    def _ledger(self, params: Dict) -> Dict:
+        ledger_index = params.get('ledger_index')
+        if ledger_index in (None, 'validated', 'closed'):
+            ledger_index = self._validated_index
+        elif ledger_index == 'current':
+            ledger_index = self._validated_index + 1
+
+        if ledger_index > self._validated_index + 1:
+            return {'error': 'lgrNotFound', 'status': 'error'}
+
+        ledger = {'ledger_index': str(ledger_index), 'closed': ledger_index <= self._validated_index, 'close_time': 0}
+        if params.get('transactions'):
+            ledger['transactions'] = list(self._ledgers.get(ledger_index, []))
+
+        return {
+            'ledger': ledger,
+            'ledger_index': ledger_index,
+            'validated': ledger_index <= self._validated_index,
+            'status': 'success',
+        }
+
+    def _ledger_current(self, params: Dict) -> Dict:
+        return {'ledger_current_index': self._validated_index + 1, 'status': 'success'}
+
+    def _fee(self, params: Dict) -> Dict:
+        return {
+            'current_ledger_size': str(len(self._open)),
+            'current_queue_size': '0',
+            'drops': {
+                'base_fee': '10',
+                'median_fee': '5000',
+                'minimum_fee': '10',
+                'open_ledger_fee': '10',
+            },
+            'expected_ledger_size': '1000',
+            'ledger_current_index': self._validated_index + 1,
+            'levels': {
+                'median_level': '128000',
+                'minimum_level': '256',
+                'open_ledger_level': '256',
+                'reference_level': '256',
+            },
+            'max_queue_size': '20000',
+            'status': 'success',
+        }
+
+    def _server_state(self, params: Dict) -> Dict:
+        return {
+            'state': {
+                'load_base': 256,
+                'load_factor': 256,
+                'validated_ledger': {
+                    'base_fee': 10,
+                    'reserve_base': _RESERVE_BASE,
+                    'reserve_inc': _RESERVE_INC,
+                    'seq': self._validated_index,
+                },
+            },
+            'status': 'success',
+        }
+
+    def _server_info(self, params: Dict) -> Dict:
+        return {
+            'info': {
+                'load_factor': 1,
+                'validated_ledger': {
+                    'base_fee_xrp': 0.00001,
+                    'reserve_base_xrp': _RESERVE_BASE / 1000000,
+                    'reserve_inc_xrp': _RESERVE_INC / 1000000,
+                    'seq': self._validated_index,
+                },
+            },
+            'status': 'success',
+        }
+
+    def _tx(self, params: Dict) -> Dict:
+        transaction_hash = params['transaction']
+        if transaction_hash in self._transactions:
+            tx, ledger_index = self._transactions[transaction_hash]
+            return dict(
+                tx, hash=transaction_hash, ledger_index=ledger_index, validated=True,
+                meta={'TransactionResult': 'tesSUCCESS'}, status='success'
+            )
+
+        for tx, open_hash in self._open:
+            if open_hash == transaction_hash:
+                return dict(tx, hash=transaction_hash, validated=False, status='success')
+
+        return {'error': 'txnNotFound', 'error_message': 'Transaction not found.', 'status': 'error'}
+
+    def _submit(self, params: Dict) -> Dict:
+        blob = params['tx_blob']
+        tx = decode(blob)
+        transaction_hash = hashlib.sha512(bytes.fromhex(_HASH_PREFIX + blob)).hexdigest()[:64].upper()
+
+        engine_result = self._check(tx)
+        if engine_result == 'tesSUCCESS':
+            self._apply(tx)
+            self._open.append((tx, transaction_hash))
+            self._release_held(tx['Account'])
+        elif engine_result == 'terPRE_SEQ':
+            # Like rippled, keep it and apply it once the Sequences before it are used.
+            self._held.append((tx, transaction_hash))
+
+        return {
+            'accepted': engine_result == 'tesSUCCESS',
+            'engine_result': engine_result,
+            'engine_result_code': 0 if engine_result == 'tesSUCCESS' else -1,
+            'engine_result_message': engine_result,
+            'tx_blob': blob,
+            'tx_json': dict(tx, hash=transaction_hash),
+            'status': 'success',
+        }
+
+    def _release_held(self, address: str) -> None:
+        released = True
+        while released and address in self._accounts:
+            released = False
+            for tx, transaction_hash in list(self._held):
+                if tx['Account'] == address and tx['Sequence'] == self._accounts[address]['Sequence']:
+                    self._held.remove((tx, transaction_hash))
+                    self._apply(tx)
+                    self._open.append((tx, transaction_hash))
+                    released = True
+
+    def _check(self, tx: Dict) -> str:
+        account = self._accounts.get(tx['Account'])
+        if account is None:
+            return 'terNO_ACCOUNT'
+
+        last_ledger_sequence = tx.get('LastLedgerSequence')
+        if last_ledger_sequence is not None and last_ledger_sequence <= self._validated_index:
+            return 'tefMAX_LEDGER'
+
+        if tx.get('Sequence') == 0 and 'TicketSequence' in tx:
+            return 'tesSUCCESS' if tx['TicketSequence'] in self._tickets[tx['Account']] else 'tefNO_TICKET'
+        if tx['Sequence'] < account['Sequence']:
+            return 'tefPAST_SEQ'
+        if tx['Sequence'] > account['Sequence']:
+            return 'terPRE_SEQ'
+        return 'tesSUCCESS'
+
+    def _apply(self, tx: Dict) -> None:
+        address = tx['Account']
+        account = self._accounts[address]
+
+        if tx.get('Sequence') == 0:
+            self._tickets[address].remove(tx['TicketSequence'])
+        else:
+            account['Sequence'] += 1
+        account['Balance'] = str(int(account['Balance']) - int(tx['Fee']))
+
+        transaction_type = tx['TransactionType']
+        if transaction_type == 'Payment' and isinstance(tx['Amount'], str):
+            account['Balance'] = str(int(account['Balance']) - int(tx['Amount']))
+            destination = self._accounts.get(tx['Destination'])
+            if destination is not None:
+                destination['Balance'] = str(int(destination['Balance']) + int(tx['Amount']))
+        elif transaction_type == 'OfferCancel':
+            self._offers[address] = [offer for offer in self._offers[address] if offer['seq'] != tx['OfferSequence']]
+        elif transaction_type == 'TrustSet' and tx['LimitAmount']['value'] == '0':
+            limit = tx['LimitAmount']
+            self._lines[address] = [
+                line for line in self._lines[address]
+                if (line['currency'], line['account']) != (limit['currency'], limit['issuer'])
+            ]
+        elif transaction_type == 'TicketCreate':
+            first = account['Sequence']
+            self._tickets[address].extend(range(first, first + tx['TicketCount']))
+            account['Sequence'] += tx['TicketCount']
+        elif transaction_type == 'AccountDelete':
+            destination = self._accounts.get(tx['Destination'])
+            if destination is not None:
+                destination['Balance'] = str(int(destination['Balance']) + int(account['Balance']))
+            for table in (self._accounts, self._lines, self._offers, self._tickets):
+                del table[address]
+            return
+
+        account['OwnerCount'] = len(self._lines[address]) + len(self._offers[address]) + len(self._tickets[address])
+
+    # Servers
+
+    def start(self) -> 'MockRippled':
+        """
+        Start the HTTP and WebSocket servers and the ledger close timer, on background threads
+
+        :return: self
+        :rtype: MockRippled
+        """
+
+        self._running = True
+
+        self._http_server = _HTTPServer(('127.0.0.1', 0), self._http_handler())
+        threading.Thread(target=self._http_server.serve_forever, daemon=True).start()
+        self.http_url = f'http://127.0.0.1:{self._http_server.server_address[1]}/'
+
+        async def serve_ws() -> websockets.WebSocketServer:
+            # Created inside a coroutine so the server binds to this loop rather than the calling thread's.
+            return await websockets.serve(self._ws_handler, '127.0.0.1', 0)
+
+        self._ws_loop = asyncio.new_event_loop()
+        self._ws_server = self._ws_loop.run_until_complete(serve_ws())
+        threading.Thread(target=self._ws_loop.run_forever, daemon=True).start()
+        self.ws_url = f'ws://127.0.0.1:{self._ws_server.sockets[0].getsockname()[1]}/'
+
+        threading.Thread(target=self._close_ledgers, daemon=True).start()
+
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop the servers and the ledger close timer
+
+        :return: None
+        """
+
+        self._running = False
+        self._http_server.shutdown()
+        self._http_server.server_close()
+
+        async def close_ws() -> None:
+            self._ws_server.close()
+            await self._ws_server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(close_ws(), self._ws_loop).result()
+        self._ws_loop.call_soon_threadsafe(self._ws_loop.stop)
+
+    def __enter__(self) -> 'MockRippled':
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def _close_ledgers(self) -> None:
+        while self._running:
+            time.sleep(self.close_interval)
+            self._close_ledger()
+
+    def _http_handler(self) -> type:
+        rippled = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def do_POST(self) -> None:
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                if rippled.latency:
+                    time.sleep(rippled.latency)
+
+                params = body['params'][0] if body.get('params') else {}
+                result = rippled.handle(body['method'], params)
+
+                data = json.dumps({'result': result}).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        return Handler
+
+    async def _ws_handler(self, websocket, path: str = None) -> None:
+        loop = asyncio.get_running_loop()
+        accounts = set()
+        streams = set()
+
+        def publish(message: Dict) -> None:
+            if message['type'] == 'ledgerClosed':
+                wanted = 'ledger' in streams
+            else:
+                tx = message['transaction']
+                wanted = 'transactions' in streams or tx['Account'] in accounts or tx.get('Destination') in accounts
+            if wanted:
+                asyncio.run_coroutine_threadsafe(websocket.send(json.dumps(message)), loop)
+
+        async def answer(raw: str) -> None:
+            request = json.loads(raw)
+            if self.latency:
+                await asyncio.sleep(self.latency)
+
+            method = request.pop('command')
+            request_id = request.pop('id', None)
+
+            if method == 'subscribe':
+                streams.update(request.get('streams', []))
+                accounts.update(request.get('accounts', []))
+                result = {'ledger_index': self._validated_index} if 'ledger' in request.get('streams', []) else {}
+            elif method == 'unsubscribe':
+                streams.difference_update(request.get('streams', []))
+                accounts.difference_update(request.get('accounts', []))
+                result = {}
+            else:
+                result = self.handle(method, request)
+
+            message = {'id': request_id, 'type': 'response'}
+            if result.get('status') == 'error':
+                message.update(result)
+            else:
+                result.pop('status', None)
+                message.update(status='success', result=result)
+            await websocket.send(json.dumps(message))
+
+        with self._lock:
+            self._listeners.append(publish)
+        try:
+            async for raw in websocket:
+                asyncio.ensure_future(answer(raw))
+        finally:
+            with self._lock:
+                self._listeners.remove(publish)
+
+
+def _issuer(i: int) -> str:
+    """
+    A distinct, valid classic address per index, used as trust line issuer and book owner
+
+    :param i: Index
+    :type i: int
+
+    :return: Classic address
+    :rtype: str
+    """
+
+    return encode_classic_address(hashlib.sha256(str(i).encode()).digest()[:20])
@@ -1,4 +1,4 @@
-from distutils.core import setup
+from setuptools import setup
 
 setup(
     name='xrpy',
@@ -13,7 +13,15 @@ setup(
     install_requires=[
         'xrpl-py',
         'deprecation',
+        'httpx',
+        'websockets',
     ],
+    extras_require={
+        'analytics': ['numpy'],
+        'parquet': ['pyarrow'],
+        'opentelemetry': ['opentelemetry-api'],
+        'benchmarks': ['pytest-benchmark'],
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',
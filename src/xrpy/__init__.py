@@ -1,25 +1,95 @@
-from .deprecated import create_wallet
-from .deprecated import send_transaction
-from .deprecated import set_trust_line
-from .deprecated import create_offer_buy
-from .deprecated import create_offer_sell
-from .deprecated import cancel_offer
-from .deprecated import get_account_info
-from .deprecated import order_book_buy
-from .deprecated import order_book_sell
-from .deprecated import get_balance
-from .deprecated import get_account_trustlines
-from .deprecated import get_reserved_balance
-from .deprecated import get_account_offers
+from importlib import import_module
+
+from typing import TYPE_CHECKING
 
 from . import constants
 
-from .main import XRPY
-from .main import JsonRpcClient
-from .main import WebsocketClient
-from .main import XRP
-from .main import Wallet
-from .main import __version__ as main_version
+
+if TYPE_CHECKING:
+    from .deprecated import create_wallet, send_transaction, set_trust_line, create_offer_buy, create_offer_sell, \
+        cancel_offer, get_account_info, order_book_buy, order_book_sell, get_balance, get_account_trustlines, \
+        get_reserved_balance, get_account_offers
+    from .main import XRPY, JsonRpcClient, WebsocketClient, XRP, Wallet
+    from .pool import ClientPool
+    from .cache import ReadCache
+    from .orderbook import OrderBook
+    from .analytics import BookAnalytics
+    from .fees import FeeOracle
+    from .ratelimit import RateLimiter, request_priority
+    from .tickets import TicketPool
+    from .validation import ValidationTracker
+    from .instrumentation import Instrumentation, Metrics, OpenTelemetryInstrumentation
+    from .records import TrustLine, Offer
+    from .async_main import AsyncXRPY, AsyncJsonRpcClient, AsyncWebsocketClient
+    from .signing import prepare_and_sign
+
+
+# Public names and the submodule each one is loaded from on first use. Importing xrpy itself loads none of them, so
+# the xrpl model and client tree is only imported once something that needs it is used.
+_LAZY = {
+    'create_wallet': '.deprecated',
+    'send_transaction': '.deprecated',
+    'set_trust_line': '.deprecated',
+    'create_offer_buy': '.deprecated',
+    'create_offer_sell': '.deprecated',
+    'cancel_offer': '.deprecated',
+    'get_account_info': '.deprecated',
+    'order_book_buy': '.deprecated',
+    'order_book_sell': '.deprecated',
+    'get_balance': '.deprecated',
+    'get_account_trustlines': '.deprecated',
+    'get_reserved_balance': '.deprecated',
+    'get_account_offers': '.deprecated',
+    'XRPY': '.main',
+    'JsonRpcClient': '.main',
+    'WebsocketClient': '.main',
+    'XRP': '.main',
+    'Wallet': '.main',
+    'ClientPool': '.pool',
+    'ReadCache': '.cache',
+    'OrderBook': '.orderbook',
+    'BookAnalytics': '.analytics',
+    'FeeOracle': '.fees',
+    'RateLimiter': '.ratelimit',
+    'request_priority': '.ratelimit',
+    'TicketPool': '.tickets',
+    'ValidationTracker': '.validation',
+    'Instrumentation': '.instrumentation',
+    'Metrics': '.instrumentation',
+    'OpenTelemetryInstrumentation': '.instrumentation',
+    'TrustLine': '.records',
+    'Offer': '.records',
+    'AsyncXRPY': '.async_main',
+    'AsyncJsonRpcClient': '.async_main',
+    'AsyncWebsocketClient': '.async_main',
+    'prepare_and_sign': '.signing',
+    '__version__': '.main',
+}
+
+
+def __getattr__(name: str):
+    """
+    Import a public name from its submodule on first access
+
+    :param name: Attribute name
+    :type name: str
+
+    :raises AttributeError: If the name is not exported by xrpy
+
+    :return: The attribute
+    """
+
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 
 __all__ = [
@@ -40,10 +110,27 @@ __all__ = [
     'XRPY',
     'JsonRpcClient',
     'WebsocketClient',
+    'ClientPool',
+    'ReadCache',
+    'OrderBook',
+    'BookAnalytics',
+    'FeeOracle',
+    'RateLimiter',
+    'request_priority',
+    'TicketPool',
+    'ValidationTracker',
+    'Instrumentation',
+    'Metrics',
+    'OpenTelemetryInstrumentation',
+    'TrustLine',
+    'Offer',
     'Wallet',
+    'AsyncXRPY',
+    'AsyncJsonRpcClient',
+    'AsyncWebsocketClient',
+    'prepare_and_sign',
 ]
 
 
-__version__ = main_version
 __author__ = "amiwrpremium"
 __reason__ = 'OK'
@@ -0,0 +1,208 @@
+from typing import Dict, List, Union, Iterable
+
+
+from xrpl.models.response import Response
+
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+__all__ = [
+    'BookAnalytics',
+]
+
+
+# Drops per XRP; XRP amounts are analysed in XRP.
+_DROPS_PER_XRP = 1_000_000
+
+
+def _amount(amount: Union[str, Dict]) -> float:
+    if type(amount) is str:
+        return int(amount) / _DROPS_PER_XRP
+    return float(amount['value'])
+
+
+class BookAnalytics:
+    """
+    One side of an order book loaded into NumPy arrays, for vectorized market order estimates.
+
+    The offers of a ``book_offers`` response (best first, as rippled returns them) are parsed once into per-offer
+    prices and cumulative sizes. Every query then takes a scalar or an array of sizes or percentages and is answered
+    with ``searchsorted`` over those arrays, so thousands of candidate sizes cost about as much as one.
+
+    Sizes are in the currency the taker gets (``TakerGets``), prices in the currency the taker pays per unit of it
+    (``TakerPays / TakerGets``); XRP is in XRP, not drops. Funded amounts (``taker_gets_funded``) are used where the
+    server reports an offer as partly funded. Values are float64, which is fine for estimates but not for amounts to
+    sign.
+    """
+
+    def __init__(self, prices: Iterable[float], sizes: Iterable[float]):
+        """
+        One side of an order book as arrays.
+
+        :param prices: Price of every offer, best (lowest) first
+        :type prices: Iterable[float]
+
+        :param sizes: Size of every offer, in the same order
+        :type sizes: Iterable[float]
+
+        :raises ImportError: If numpy is not installed
+        """
+
+        if numpy is None:
+            raise ImportError('BookAnalytics needs the numpy package: pip install xrpy[analytics]')
+
+        self.prices = numpy.asarray(prices, dtype=numpy.float64)
+        self.sizes = numpy.asarray(sizes, dtype=numpy.float64)
+
+        self.cumulative_sizes = numpy.cumsum(self.sizes)
+        self.cumulative_costs = numpy.cumsum(self.sizes * self.prices)
+
+    @classmethod
+    def from_offers(cls, offers: List[Dict]) -> 'BookAnalytics':
+        """
+        Load the offers of a ``book_offers`` result. Offers with nothing funded are skipped.
+
+        :param offers: ``offers`` of a ``book_offers`` result, best first
+        :type offers: List[Dict]
+
+        :return: BookAnalytics
+        :rtype: BookAnalytics
+        """
+
+        prices, sizes = [], []
+        for offer in offers:
+            gets = _amount(offer.get('taker_gets_funded', offer['TakerGets']))
+            pays = _amount(offer.get('taker_pays_funded', offer['TakerPays']))
+            if gets > 0:
+                prices.append(pays / gets)
+                sizes.append(gets)
+
+        return cls(prices, sizes)
+
+    @classmethod
+    def from_response(cls, response: Response) -> 'BookAnalytics':
+        """
+        Load a :meth:`xrpy.XRPY.order_book_buy` or :meth:`xrpy.XRPY.order_book_sell` response
+
+        :param response: ``book_offers`` Response
+        :type response: Response
+
+        :return: BookAnalytics
+        :rtype: BookAnalytics
+        """
+
+        return cls.from_offers(response.result.get('offers', []))
+
+    @property
+    def best_price(self) -> float:
+        return float(self.prices[0]) if len(self.prices) else float('nan')
+
+    @property
+    def total_size(self) -> float:
+        return float(self.cumulative_sizes[-1]) if len(self.sizes) else 0.0
+
+    def cost(self, sizes: Union[float, Iterable[float]]) -> Union[float, 'numpy.ndarray']:
+        """
+        Total amount paid to take ``sizes`` from the book, walking offers from the best price outwards
+
+        :param sizes: Size or sizes to take
+        :type sizes: Union[float, Iterable[float]]
+
+        :return: Cost of every size, NaN where the book is too thin to fill it
+        :rtype: Union[float, numpy.ndarray]
+        """
+
+        sizes = numpy.asarray(sizes, dtype=numpy.float64)
+        if not len(self.sizes):
+            return self._shaped(numpy.full(sizes.shape, numpy.nan))
+
+        # Index of the offer each size ends in; the offers before it are taken whole.
+        last = numpy.searchsorted(self.cumulative_sizes, sizes, side='left')
+        filled = numpy.minimum(last, len(self.sizes) - 1)
+        before = filled - 1
+
+        taken_size = numpy.where(before >= 0, self.cumulative_sizes[before], 0.0)
+        taken_cost = numpy.where(before >= 0, self.cumulative_costs[before], 0.0)
+        cost = taken_cost + (sizes - taken_size) * self.prices[filled]
+
+        return self._shaped(numpy.where(last < len(self.sizes), cost, numpy.nan))
+
+    def fill_price(self, sizes: Union[float, Iterable[float]]) -> Union[float, 'numpy.ndarray']:
+        """
+        Volume-weighted average price of taking ``sizes`` from the book
+
+        :param sizes: Size or sizes to take
+        :type sizes: Union[float, Iterable[float]]
+
+        :return: Average price of every size, NaN where the book is too thin to fill it
+        :rtype: Union[float, numpy.ndarray]
+        """
+
+        sizes = numpy.asarray(sizes, dtype=numpy.float64)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            return self._shaped(numpy.asarray(self.cost(sizes)) / sizes)
+
+    def worst_price(self, sizes: Union[float, Iterable[float]]) -> Union[float, 'numpy.ndarray']:
+        """
+        Price of the last offer taking ``sizes`` reaches, the limit a market order of that size needs
+
+        :param sizes: Size or sizes to take
+        :type sizes: Union[float, Iterable[float]]
+
+        :return: Price of every size, NaN where the book is too thin to fill it
+        :rtype: Union[float, numpy.ndarray]
+        """
+
+        sizes = numpy.asarray(sizes, dtype=numpy.float64)
+        last = numpy.searchsorted(self.cumulative_sizes, sizes, side='left')
+        prices = numpy.append(self.prices, numpy.nan)
+
+        return self._shaped(prices[last])
+
+    def slippage(self, sizes: Union[float, Iterable[float]]) -> Union[float, 'numpy.ndarray']:
+        """
+        How much worse than the best price the average fill price of ``sizes`` is, as a fraction (0.01 is 1%)
+
+        :param sizes: Size or sizes to take
+        :type sizes: Union[float, Iterable[float]]
+
+        :return: Slippage of every size, NaN where the book is too thin to fill it
+        :rtype: Union[float, numpy.ndarray]
+        """
+
+        return self._shaped(numpy.asarray(self.fill_price(sizes)) / self.best_price - 1)
+
+    def depth(self, percents: Union[float, Iterable[float]]) -> Union[float, 'numpy.ndarray']:
+        """
+        Size available at prices within ``percents`` percent of the best price
+
+        :param percents: Percent or percents above the best price (1 is 1%)
+        :type percents: Union[float, Iterable[float]]
+
+        :return: Size of every percent
+        :rtype: Union[float, numpy.ndarray]
+        """
+
+        percents = numpy.asarray(percents, dtype=numpy.float64)
+        if not len(self.sizes):
+            return self._shaped(numpy.zeros(percents.shape))
+
+        limits = self.best_price * (1 + percents / 100)
+        within = numpy.searchsorted(self.prices, limits, side='right')
+        cumulative_sizes = numpy.insert(self.cumulative_sizes, 0, 0.0)
+
+        return self._shaped(cumulative_sizes[within])
+
+    @staticmethod
+    def _shaped(values: 'numpy.ndarray') -> Union[float, 'numpy.ndarray']:
+        return float(values) if values.ndim == 0 else values
+
+    def __len__(self):
+        return len(self.sizes)
+
+    def __repr__(self):
+        return f'BookAnalytics(offers={len(self.sizes)}, best_price={self.best_price}, total_size={self.total_size})'
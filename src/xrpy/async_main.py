@@ -0,0 +1,2507 @@
+import asyncio
+import copy
+import math
+
+from contextlib import asynccontextmanager, nullcontext
+from itertools import count, islice
+
+
+from typing import TYPE_CHECKING, Union, Optional, Dict, List, Tuple, Iterable, AsyncIterator, Awaitable, Callable, Any
+
+
+from xrpl.asyncio.clients import AsyncJsonRpcClient, AsyncWebsocketClient, XRPLRequestFailureException
+from xrpl.asyncio.wallet import generate_faucet_wallet
+from xrpl.wallet import Wallet
+from xrpl.core.addresscodec import is_valid_xaddress, xaddress_to_classic_address
+from xrpl.core.binarycodec import decode, encode
+
+
+from xrpl.models.transactions import Transaction
+from xrpl.models.transactions.types import TransactionType
+from xrpl.utils import drops_to_xrp, xrp_to_drops
+from xrpl.models.response import Response, ResponseStatus
+
+from xrpl.models.requests import AccountLines, AccountOffers, AccountInfo, AccountObjects, AccountObjectType, Ledger, \
+    AccountTx, Tx, Fee, ServerState, SubmitOnly, Request
+from xrpl.models.currencies import XRP
+
+from xrpl.asyncio.transaction import safe_sign_transaction, XRPLReliableSubmissionException
+
+from .cache import ReadCache, request_key
+from .fees import FeeOracle, _MAX_FEE
+from .instrumentation import Instrumentation, json_size
+# Settings are read through the module at call time, so patching them in xrpy.main applies to both clients.
+from . import main as _main
+from .main import __version__, _replace, _next_page, _consumes_sequence, _is_transient, _failure, \
+    _unknown_if_missing, _sell_book, _buy_book
+from .records import TrustLine, Offer
+from .reserves import Reserves
+from .sequence import SequenceManager, RESYNC_RESULTS
+from .tickets import TicketPool, MAX_TICKETS
+from .transactions import xrp_payment, token_payment, trust_set, buy_offer, sell_offer, offer_cancel, account_delete, \
+    ticket_create
+
+
+# Optional features are imported by the methods that use them, like in xrpy.main.
+if TYPE_CHECKING:
+    from .ratelimit import RateLimiter
+    from .validation import ValidationTracker
+
+
+__all__ = [
+    'AsyncXRPY',
+    'AsyncJsonRpcClient',
+    'AsyncWebsocketClient',
+]
+
+
+class AsyncXRPY:
+    """
+    AsyncXRPY is an asyncio wrapper for the XRPL API. It mirrors :class:`xrpy.XRPY` with coroutine methods.
+    """
+
+    def __init__(self, client: Optional[Union[AsyncJsonRpcClient, AsyncWebsocketClient, str]] = None,
+                 local_sequences: bool = False, cache: Optional[ReadCache] = None,
+                 fee_oracle: Optional[FeeOracle] = None, ticket_pool: Optional[TicketPool] = None,
+                 validation_tracker: Optional['ValidationTracker'] = None,
+                 instrumentation: Optional[Instrumentation] = None, coalesce: bool = True,
+                 rate_limiter: Optional['RateLimiter'] = None):
+        """
+        AsyncXRPY is an asyncio wrapper for the XRPL API.
+
+        You can initialize AsyncXRPY with a client, or you can initialize it with a url string.
+        An AsyncWebsocketClient must be opened by the caller.
+
+        :param client: XRPL async client
+        :type client: Optional[Union[AsyncJsonRpcClient, AsyncWebsocketClient, str]]
+
+        :param local_sequences: Hand out Sequence numbers locally instead of asking the server for every transaction
+        :type local_sequences: bool
+
+        :param cache: Serve account_info, account_lines, account_offers and book_offers from this cache
+        :type cache: Optional[ReadCache]
+
+        :param fee_oracle: Take transaction fees from this oracle instead of a ``fee`` request per transaction
+        :type fee_oracle: Optional[FeeOracle]
+
+        :param ticket_pool: Send payments, trust lines and offer cancellations with Tickets from this pool
+        :type ticket_pool: Optional[TicketPool]
+
+        :param validation_tracker: Wait for transactions on this opened tracker's stream instead of polling ``tx``
+        :type validation_tracker: Optional[ValidationTracker]
+
+        :param instrumentation: Report spans and counters of requests, autofill, signing, submits and waits to this
+        :type instrumentation: Optional[Instrumentation]
+
+        :param coalesce: Send identical reads made at the same time (e.g. by several tasks) as one request
+        :type coalesce: bool
+
+        :param rate_limiter: Limit the requests sent to the server with this
+        :type rate_limiter: Optional[RateLimiter]
+
+        :raises TypeError: If client is not an AsyncJsonRpcClient or AsyncWebsocketClient
+
+        :return: AsyncXRPY
+        """
+
+        if client is None:
+            client = AsyncJsonRpcClient('https://xrplcluster.com')
+        elif type(client) is str:
+            client = AsyncJsonRpcClient(client)
+        elif type(client) is AsyncJsonRpcClient or type(client) is AsyncWebsocketClient:
+            client = client
+        else:
+            raise Exception(f'Invalid client type: {type(client)}')
+
+        self._client = client
+
+        self.local_sequences = local_sequences
+        self._sequences = SequenceManager()
+        self._sequence_sync_lock = None
+
+        self._cache = cache
+        self._request_ids = count()
+
+        self._fees = fee_oracle
+        self._fee_lock = None
+
+        self._reserves = Reserves()
+        self._reserve_lock = None
+
+        self._tickets = ticket_pool
+        self._ticket_lock = None
+        self._ticket_top_up: Optional[asyncio.Future] = None
+
+        self._tracker = validation_tracker
+
+        self._instrumentation = instrumentation
+
+        self.coalesce = coalesce
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+        self._limiter = rate_limiter
+
+        self._snapshot_index: Optional[int] = None
+        self._snapshot: Optional[Dict[str, asyncio.Future]] = None
+
+    def set_client(self, client: Union[AsyncJsonRpcClient, AsyncWebsocketClient]) -> None:
+        """
+        Set the client for the AsyncXRPY instance.
+
+        :param client: XRPL async client
+        :type client: Union[AsyncJsonRpcClient, AsyncWebsocketClient]
+
+        :return: None
+        """
+
+        self._client = client
+        self._sequences = SequenceManager()
+
+    def set_local_sequences(self, local_sequences: bool) -> None:
+        """
+        Enable or disable local Sequence allocation.
+
+        :param local_sequences: Hand out Sequence numbers locally instead of asking the server for every transaction
+        :type local_sequences: bool
+
+        :return: None
+        """
+
+        self.local_sequences = local_sequences
+
+    def set_cache(self, cache: Optional[ReadCache]) -> None:
+        """
+        Set the read cache, or disable caching with None.
+
+        :param cache: Serve account_info, account_lines, account_offers and book_offers from this cache
+        :type cache: Optional[ReadCache]
+
+        :return: None
+        """
+
+        self._cache = cache
+
+    def set_fee_oracle(self, fee_oracle: Optional[FeeOracle]) -> None:
+        """
+        Set the fee oracle, or go back to a ``fee`` request per transaction with None.
+
+        :param fee_oracle: Take transaction fees from this oracle
+        :type fee_oracle: Optional[FeeOracle]
+
+        :return: None
+        """
+
+        self._fees = fee_oracle
+
+    def set_ticket_pool(self, ticket_pool: Optional[TicketPool]) -> None:
+        """
+        Set the ticket pool, or go back to sending every transaction with a Sequence with None.
+
+        :param ticket_pool: Send payments, trust lines and offer cancellations with Tickets from this pool
+        :type ticket_pool: Optional[TicketPool]
+
+        :return: None
+        """
+
+        self._tickets = ticket_pool
+
+    def set_validation_tracker(self, validation_tracker: Optional['ValidationTracker']) -> None:
+        """
+        Set the validation tracker, or go back to polling ``tx`` with None.
+
+        :param validation_tracker: Wait for transactions on this opened tracker's stream
+        :type validation_tracker: Optional[ValidationTracker]
+
+        :return: None
+        """
+
+        self._tracker = validation_tracker
+
+    def set_instrumentation(self, instrumentation: Optional[Instrumentation]) -> None:
+        """
+        Set the instrumentation, or turn it off with None.
+
+        :param instrumentation: Report spans and counters to this
+        :type instrumentation: Optional[Instrumentation]
+
+        :return: None
+        """
+
+        self._instrumentation = instrumentation
+
+    def set_coalesce(self, coalesce: bool) -> None:
+        """
+        Enable or disable coalescing of identical concurrent reads.
+
+        :param coalesce: Send identical reads made at the same time as one request
+        :type coalesce: bool
+
+        :return: None
+        """
+
+        self.coalesce = coalesce
+
+    def set_rate_limiter(self, rate_limiter: Optional['RateLimiter']) -> None:
+        """
+        Set the rate limiter, or send requests as fast as they come with None.
+
+        :param rate_limiter: Limit the requests sent to the server with this
+        :type rate_limiter: Optional[RateLimiter]
+
+        :return: None
+        """
+
+        self._limiter = rate_limiter
+
+    def _span(self, name: str, **attributes):
+        """
+        Open a span on the instrumentation. See :meth:`xrpy.XRPY._span`.
+
+        :param name: Span name
+        :type name: str
+
+        :param attributes: Attributes of the span
+        :type attributes: Any
+
+        :return: Context manager yielding the span's attributes
+        """
+
+        if self._instrumentation is None:
+            return nullcontext(attributes)
+        return self._instrumentation.span(name, **attributes)
+
+    def _count(self, name: str, value: int = 1, **attributes) -> None:
+        if self._instrumentation is not None:
+            self._instrumentation.count(name, value, **attributes)
+
+    def _count_request(self, request: Request, response: Response) -> None:
+        """
+        Count a request sent to the server. See :meth:`xrpy.XRPY._count_request`.
+
+        :param request: Request
+        :type request: Request
+
+        :param response: Its response
+        :type response: Response
+
+        :return: None
+        """
+
+        if self._instrumentation is None:
+            return
+
+        method = request.method.value
+        self._instrumentation.count('requests', method=method)
+        self._instrumentation.count('request_bytes', json_size(request.to_dict()), method=method)
+        self._instrumentation.count('response_bytes', json_size(response.result), method=method)
+        if not response.is_successful():
+            self._instrumentation.count('errors', method=method, error=str(response.result.get('error')))
+
+    async def _request(self, request: Request) -> Response:
+        """
+        Send a request through the client, using the read cache when one is set. See :meth:`xrpy.XRPY._request`.
+
+        :param request: Request to send
+        :type request: Request
+
+        :return: Response
+        :rtype: Response
+        """
+
+        request = self._pinned(request)
+        if self._in_snapshot(request):
+            return await self._single_flight(request, self._snapshot, keep=True)
+        if self.coalesce and request.method in _main._COALESCED_METHODS:
+            return await self._single_flight(request, self._in_flight, keep=False)
+
+        return await self._send(request)
+
+    async def _send(self, request: Request) -> Response:
+        """
+        Send a request through the client, or answer it from the read cache
+
+        :param request: Request to send
+        :type request: Request
+
+        :return: Response
+        :rtype: Response
+        """
+
+        cached = self._cached(request)
+        if cached is not None:
+            return cached
+
+        # Throttled reads are sent again once the rate limiter's backoff is over.
+        limiter = self._limiter
+        retries = limiter.max_retries if limiter is not None and request.method in _main._COALESCED_METHODS else 0
+
+        for attempt in range(retries + 1):
+            if limiter is not None:
+                await limiter.acquire_async(self._client.url)
+
+            with self._span('request', method=request.method.value):
+                try:
+                    response = await self._client.request(self._with_id(request))
+                except Exception:
+                    if limiter is not None:
+                        limiter.report(self._client.url, None)
+                    raise
+            self._count_request(request, response)
+
+            if limiter is None or not limiter.report(self._client.url, response) or attempt == retries:
+                break
+            self._count('retries', reason=response.result.get('error'), method=request.method.value)
+
+        self._store(request, response)
+
+        return response
+
+    async def _single_flight(self, request: Request, futures: Dict[str, asyncio.Future], keep: bool) -> Response:
+        """
+        Send a request once for every task asking for it at the same time. See :meth:`xrpy.XRPY._single_flight`.
+
+        :param request: Request to send
+        :type request: Request
+
+        :param futures: Futures of the requests in flight (and kept), by request key
+        :type futures: Dict[str, asyncio.Future]
+
+        :param keep: Keep successful responses after they arrive
+        :type keep: bool
+
+        :return: Response
+        :rtype: Response
+        """
+
+        key = request_key(request)
+        future = futures.get(key)
+        if future is not None:
+            self._count('cache_hits' if future.done() else 'coalesced', method=request.method.value)
+            return await asyncio.shield(future)
+
+        async def send() -> Response:
+            try:
+                response = await self._send(request)
+            except BaseException:
+                futures.pop(key, None)
+                raise
+
+            if not keep or not response.is_successful():
+                futures.pop(key, None)
+            return response
+
+        # The request runs in a task of its own that every caller only waits on, so cancelling the caller that
+        # started it does not cancel it for the others.
+        future = futures[key] = asyncio.ensure_future(send())
+        # Mark a failure retrieved, so a read nobody is still waiting for does not log 'exception was never retrieved'.
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+        return await asyncio.shield(future)
+
+    def _pinned(self, request: Request) -> Request:
+        """
+        Pin a read to the snapshot ledger inside :meth:`at_ledger`. See :meth:`xrpy.XRPY._pinned`.
+
+        :param request: Request
+        :type request: Request
+
+        :return: The request, or a copy of it reading the snapshot ledger
+        :rtype: Request
+        """
+
+        if self._snapshot_index is None or request.method not in _main._SNAPSHOT_METHODS:
+            return request
+        if getattr(request, 'ledger_hash', None) is not None or request.ledger_index not in (None, 'validated'):
+            return request
+        return _replace(request, ledger_index=self._snapshot_index)
+
+    def _in_snapshot(self, request: Request) -> bool:
+        """
+        Whether a read belongs to the snapshot of :meth:`at_ledger`. See :meth:`xrpy.XRPY._in_snapshot`.
+
+        :param request: Request, after :meth:`_pinned`
+        :type request: Request
+
+        :return: True if the request is answered from and kept in the snapshot
+        :rtype: bool
+        """
+
+        return self._snapshot is not None and request.method in _main._SNAPSHOT_METHODS and \
+            getattr(request, 'ledger_index', None) == self._snapshot_index
+
+    @property
+    def ledger_index(self) -> Optional[int]:
+        """
+        Ledger index reads are pinned to inside :meth:`at_ledger`, None outside of it
+        """
+
+        return self._snapshot_index
+
+    @asynccontextmanager
+    async def at_ledger(self, ledger_index: Union[str, int] = 'validated') -> AsyncIterator['AsyncXRPY']:
+        """
+        Read from one validated ledger. See :meth:`xrpy.XRPY.at_ledger`.
+
+        :param ledger_index: A validated ledger index, or 'validated' for the latest one
+        :type ledger_index: Union[str, int]
+
+        :raises ValueError: If ledger_index is another shortcut, like 'current' or 'closed'
+        :raises XRPLRequestFailureException: If the latest validated ledger can't be read
+
+        :return: Snapshot AsyncXRPY
+        :rtype: AsyncIterator[AsyncXRPY]
+        """
+
+        if type(ledger_index) is not int and ledger_index != 'validated':
+            raise ValueError(f'A snapshot needs a validated ledger, not {ledger_index!r}')
+
+        snapshot = copy.copy(self)
+        snapshot._snapshot_index = await self._pin_ledger_index(ledger_index)
+        snapshot._snapshot = {}
+
+        try:
+            yield snapshot
+        finally:
+            snapshot._snapshot.clear()
+
+    async def request_many(self, requests: List[Request]) -> List[Response]:
+        """
+        Send independent requests concurrently and return their responses in the same order.
+        See :meth:`xrpy.XRPY.request_many`.
+
+        :param requests: Requests to send
+        :type requests: List[Request]
+
+        :return: One Response per request, in the same order
+        :rtype: List[Response]
+        """
+
+        return list(await asyncio.gather(*(self._request(request) for request in requests)))
+
+    def _with_id(self, request: Request) -> Request:
+        """
+        Give a request a unique id, so concurrent requests on one WebSocket can't collide
+
+        :param request: Request
+        :type request: Request
+
+        :return: The request, or a copy of it with an id
+        :rtype: Request
+        """
+
+        if request.id is not None:
+            return request
+        return _replace(request, id=f'xrpy_{next(self._request_ids)}')
+
+    def _cached(self, request: Request) -> Optional[Response]:
+        """
+        Look up a cacheable read in the read cache
+
+        :param request: Request
+        :type request: Request
+
+        :return: Cached response, or None
+        :rtype: Optional[Response]
+        """
+
+        if self._in_snapshot(request):
+            future = self._snapshot.get(request_key(request))
+            if future is not None and future.done() and future.exception() is None:
+                self._count('cache_hits', method=request.method.value)
+                return future.result()
+
+        if self._cache is None or request.method not in _main._CACHED_METHODS:
+            return None
+
+        response = self._cache.get(request_key(request))
+        if response is not None:
+            self._count('cache_hits', method=request.method.value)
+        return response
+
+    def _store(self, request: Request, response: Response) -> None:
+        """
+        Report a response to the read cache. See :meth:`xrpy.XRPY._store`.
+
+        :param request: Request
+        :type request: Request
+
+        :param response: Its response
+        :type response: Response
+
+        :return: None
+        """
+
+        if not response.is_successful():
+            return
+
+        if response.result.get('validated') and 'ledger_index' in response.result:
+            if self._cache is not None:
+                self._cache.ledger_closed(response.result['ledger_index'])
+            if self._fees is not None:
+                self._fees.ledger_closed(response.result['ledger_index'])
+
+        if self._cache is not None and request.method in _main._CACHED_METHODS:
+            self._cache.put(request_key(request), response, getattr(request, 'account', None))
+
+        if self._in_snapshot(request) and request_key(request) not in self._snapshot:
+            stored = asyncio.get_running_loop().create_future()
+            stored.set_result(response)
+            self._snapshot[request_key(request)] = stored
+
+    def _discard_cached(self, transaction: Transaction) -> None:
+        """
+        Drop cached reads of the accounts a submitted transaction touches
+
+        :param transaction: Submitted transaction
+        :type transaction: Transaction
+
+        :return: None
+        """
+
+        if self._cache is None:
+            return
+
+        self._cache.discard_account(transaction.account)
+        if getattr(transaction, 'destination', None) is not None:
+            self._cache.discard_account(transaction.destination)
+
+    async def _fee(self) -> str:
+        """
+        Transaction fee in drops: from the fee oracle, refreshed when stale, or a ``fee`` request without one
+
+        :raises XRPLRequestFailureException: If the fee request fails
+
+        :return: Fee in drops
+        :rtype: str
+        """
+
+        if self._fees is None:
+            response = await self._request(Fee())
+            if not response.is_successful():
+                raise XRPLRequestFailureException(response.result)
+            return str(min(int(response.result['drops']['open_ledger_fee']), int(xrp_to_drops(_MAX_FEE))))
+
+        fee = self._fees.get()
+        if fee is not None:
+            return fee
+
+        if self._fee_lock is None:
+            self._fee_lock = asyncio.Lock()
+
+        async with self._fee_lock:
+            fee = self._fees.get()
+            if fee is None:
+                response = await self._request(Fee())
+                if not response.is_successful():
+                    raise XRPLRequestFailureException(response.result)
+                fee = self._fees.update(response.result)
+
+        return fee
+
+    async def _transaction_fee(self, transaction: Transaction) -> str:
+        """
+        Fee in drops of a transaction, with xrpl-py's special costs. See :meth:`xrpy.XRPY._transaction_fee`.
+
+        :param transaction: Unsigned transaction
+        :type transaction: Transaction
+
+        :return: Fee in drops
+        :rtype: str
+        """
+
+        if transaction.transaction_type == TransactionType.ACCOUNT_DELETE:
+            return str((await self.get_reserves())[1])
+
+        fee = await self._fee()
+        if transaction.transaction_type == TransactionType.ESCROW_FINISH and transaction.fulfillment is not None:
+            return str(math.ceil(int(fee) * (33 + len(transaction.fulfillment.encode('ascii')) / 16)))
+        return fee
+
+    async def _account_sequence(self, address: str) -> int:
+        """
+        Next Sequence of an account, from ``account_info`` on the current ledger
+
+        :param address: Wallet address
+        :type address: str
+
+        :raises XRPLRequestFailureException: If the account info request fails
+
+        :return: Sequence
+        :rtype: int
+        """
+
+        response = await self._request(AccountInfo(account=address, ledger_index='current'))
+        if not response.is_successful():
+            raise XRPLRequestFailureException(response.result)
+
+        return response.result['account_data']['Sequence']
+
+    async def _autofill(self, transaction: Transaction) -> Transaction:
+        """
+        Fill in the Sequence, fee and LastLedgerSequence of a transaction through :meth:`_request`, requesting them
+        concurrently. See :meth:`xrpy.XRPY._autofill`.
+
+        :param transaction: Unsigned transaction
+        :type transaction: Transaction
+
+        :return: The transaction, or a copy of it with the missing fields
+        :rtype: Transaction
+        """
+
+        async def last_ledger_sequence() -> int:
+            return await self._latest_validated_ledger_sequence() + _main._LEDGER_OFFSET
+
+        missing = {}
+        if transaction.sequence is None:
+            account = transaction.account
+            if is_valid_xaddress(account):
+                account = xaddress_to_classic_address(account)[0]
+            missing['sequence'] = self._account_sequence(account)
+        if transaction.fee is None:
+            missing['fee'] = self._transaction_fee(transaction)
+        if transaction.last_ledger_sequence is None:
+            missing['last_ledger_sequence'] = last_ledger_sequence()
+
+        if not missing:
+            return transaction
+        return _replace(transaction, **dict(zip(missing, await asyncio.gather(*missing.values()))))
+
+    async def _next_sequence(self, address: str, count: int = 1) -> int:
+        """
+        Reserve consecutive Sequence numbers for an account, reading ``account_info`` only when not synced yet
+
+        :param address: Wallet address
+        :type address: str
+
+        :param count: How many numbers to reserve
+        :type count: int
+
+        :raises XRPLRequestFailureException: If the account info request fails
+
+        :return: First reserved Sequence
+        :rtype: int
+        """
+
+        sequence = self._sequences.allocate(address, count)
+        if sequence is not None:
+            return sequence
+
+        if self._sequence_sync_lock is None:
+            self._sequence_sync_lock = asyncio.Lock()
+
+        async with self._sequence_sync_lock:
+            sequence = self._sequences.allocate(address, count)
+            if sequence is None:
+                self._sequences.sync(address, await self._account_sequence(address))
+                sequence = self._sequences.allocate(address, count)
+
+        return sequence
+
+    async def _latest_validated_ledger_sequence(self) -> int:
+        """
+        Get the index of the latest validated ledger
+
+        :raises XRPLRequestFailureException: If the ledger request fails
+
+        :return: Ledger index
+        :rtype: int
+        """
+
+        response = await self._request(Ledger(ledger_index='validated'))
+        if not response.is_successful():
+            raise XRPLRequestFailureException(response.result)
+
+        return response.result['ledger_index']
+
+    async def _wait_for_outcome(
+            self, transaction_hash: str, last_ledger_sequence: int, prelim_result: str,
+            resubmit: Optional[Transaction] = None
+    ) -> Response:
+        """
+        Wait until a submitted transaction is in a validated ledger or can no longer be included in one, submitting
+        the same blob again while it is missing. See :meth:`xrpy.XRPY._wait_for_outcome`.
+
+        :param transaction_hash: Hash of the submitted transaction
+        :type transaction_hash: str
+
+        :param last_ledger_sequence: LastLedgerSequence of the submitted transaction
+        :type last_ledger_sequence: int
+
+        :param prelim_result: Preliminary result returned by ``submit``, empty if it is unknown
+        :type prelim_result: str
+
+        :param resubmit: Signed transaction to submit again while waiting
+        :type resubmit: Optional[Transaction]
+
+        :raises XRPLReliableSubmissionException: If the transaction failed or expired
+        :raises XRPLRequestFailureException: If a request fails
+
+        :return: Validated transaction
+        :rtype: Response
+        """
+
+        with self._span('wait'):
+            if self._tracker is not None:
+                future = asyncio.wrap_future(self._tracker.track(transaction_hash, last_ledger_sequence))
+
+                # The stream reports the outcome; meanwhile the blob is submitted again for every ledger that closes
+                # without it, as in xrpy.XRPY._wait_for_outcome.
+                submitted_at = None if prelim_result else 0
+                while resubmit is not None and not (await asyncio.wait([future], timeout=_main._POLL_INTERVAL))[0]:
+                    ledger_index = self._tracker.ledger_index
+                    if ledger_index is None:
+                        continue
+                    if submitted_at is not None and ledger_index > submitted_at:
+                        self._count('resubmits', transaction_type=resubmit.transaction_type.value)
+                        await self._try_submit(resubmit)
+                    submitted_at = ledger_index
+
+                response = await future
+                if not response.is_successful():
+                    raise XRPLReliableSubmissionException(
+                        f'{response.result["error_message"]} in the transaction. Prelim result: {prelim_result}'
+                    )
+
+                return_code = response.result['meta']['TransactionResult']
+                if return_code != 'tesSUCCESS':
+                    raise XRPLReliableSubmissionException(f'Transaction failed: {return_code}')
+                return response
+
+            # Validated ledger the blob was last submitted in; unknown (0) makes the first poll submit it again.
+            submitted_at = None if prelim_result else 0
+            failures = 0
+
+            while True:
+                await asyncio.sleep(_main._POLL_INTERVAL)
+
+                try:
+                    latest_ledger_sequence = await self._latest_validated_ledger_sequence()
+
+                    response = await self._request(Tx(transaction=transaction_hash))
+                    if not response.is_successful() and response.result.get('error') != 'txnNotFound':
+                        raise XRPLRequestFailureException(response.result)
+                except Exception as e:
+                    failures += 1
+                    if not _is_transient(e) or failures > _main._MAX_POLL_FAILURES:
+                        raise
+                    continue
+                failures = 0
+
+                if response.is_successful() and response.result.get('validated'):
+                    return_code = response.result['meta']['TransactionResult']
+                    if return_code != 'tesSUCCESS':
+                        raise XRPLReliableSubmissionException(f'Transaction failed: {return_code}')
+                    return response
+
+                if latest_ledger_sequence >= last_ledger_sequence:
+                    raise XRPLReliableSubmissionException(
+                        f'The latest validated ledger sequence {latest_ledger_sequence} is greater than '
+                        f'LastLedgerSequence {last_ledger_sequence} in the transaction. Prelim result: {prelim_result}'
+                    )
+
+                if resubmit is not None:
+                    if submitted_at is not None and latest_ledger_sequence > submitted_at:
+                        self._count('resubmits', transaction_type=resubmit.transaction_type.value)
+                        await self._try_submit(resubmit)
+                    submitted_at = latest_ledger_sequence
+
+    async def _prepare_batch(self, transactions: List[Transaction], from_wallet: Wallet) -> List[Transaction]:
+        """
+        Give transactions consecutive Sequence numbers, fill in the fee and LastLedgerSequence once, and sign them.
+        Any Sequence already set on the transactions is replaced.
+
+        :param transactions: Unsigned transactions, in the order they must apply
+        :type transactions: List[Transaction]
+
+        :param from_wallet: Wallet to sign the transactions with
+        :type from_wallet: Wallet
+
+        :return: Signed transactions
+        :rtype: List[Transaction]
+        """
+
+        if not transactions:
+            return []
+
+        first_sequence, fee, latest_ledger_sequence = await asyncio.gather(
+            self._next_sequence(from_wallet.classic_address, len(transactions)),
+            self._fee(),
+            self._latest_validated_ledger_sequence(),
+        )
+
+        with self._span('sign', transactions=len(transactions)):
+            return [
+                await safe_sign_transaction(
+                    _replace(
+                        transaction,
+                        sequence=first_sequence + i,
+                        fee=fee,
+                        last_ledger_sequence=latest_ledger_sequence + _main._LEDGER_OFFSET,
+                    ),
+                    from_wallet,
+                    False,
+                )
+                for i, transaction in enumerate(transactions)
+            ]
+
+    async def _wait_for_outcomes(
+            self, account: str, hashes: List[str], last_ledger_sequence: int, submitted: List[Optional[Response]],
+            first_ledger: int = None
+    ) -> List[Response]:
+        """
+        Wait for a burst of submitted transactions with a single watcher. See :meth:`xrpy.XRPY._wait_for_outcomes`.
+
+        :param account: Account that sent the transactions
+        :type account: str
+
+        :param hashes: Hashes of the submitted transactions
+        :type hashes: List[str]
+
+        :param last_ledger_sequence: LastLedgerSequence shared by the transactions
+        :type last_ledger_sequence: int
+
+        :param submitted: ``submit`` responses, in the same order. None for a transaction whose submit failed
+            transiently and may still apply, an error Response for one that was not submitted.
+        :type submitted: List[Optional[Response]]
+
+        :param first_ledger: First ledger the transactions can be in (default: counted back from LastLedgerSequence)
+        :type first_ledger: int
+
+        :return: One Response per transaction, in the same order
+        :rtype: List[Response]
+        """
+
+        with self._span('wait', transactions=len(hashes)):
+            outcomes: Dict[str, Response] = {}
+            pending: Dict[str, int] = {}
+
+            for transaction_hash, response in zip(hashes, submitted):
+                if response is None:
+                    self._sequences.invalidate(account)
+                    pending[transaction_hash] = last_ledger_sequence
+                    continue
+                if not response.is_successful():
+                    self._sequences.invalidate(account)
+                    outcomes[transaction_hash] = response
+                    continue
+
+                engine_result = response.result.get('engine_result', '')
+                if _consumes_sequence(engine_result):
+                    pending[transaction_hash] = last_ledger_sequence
+                else:
+                    self._sequences.invalidate(account)
+                    outcomes[transaction_hash] = _failure(
+                        transaction_hash, engine_result, response.result.get('engine_result_message')
+                    )
+
+            if self._tracker is not None:
+                tracked = [
+                    (transaction_hash, asyncio.wrap_future(self._tracker.track(transaction_hash, last_ledger_sequence)))
+                    for transaction_hash, last_ledger_sequence in pending.items()
+                ]
+                outcomes.update(zip([transaction_hash for transaction_hash, _ in tracked],
+                                    await asyncio.gather(*(future for _, future in tracked))))
+                return [outcomes[transaction_hash] for transaction_hash in hashes]
+
+            next_ledger = first_ledger if first_ledger is not None else last_ledger_sequence - _main._LEDGER_OFFSET + 1
+
+            failures = 0
+
+            while pending:
+                await asyncio.sleep(_main._POLL_INTERVAL)
+
+                # Nothing is recorded until every request of the poll succeeded, so a failed poll is repeated from the
+                # same ledger.
+                try:
+                    latest_ledger_sequence = await self._latest_validated_ledger_sequence()
+
+                    ledgers = await asyncio.gather(*(
+                        self._request(Ledger(ledger_index=ledger_index, transactions=True))
+                        for ledger_index in range(next_ledger, latest_ledger_sequence + 1)
+                    ))
+
+                    validated = []
+                    for ledger in ledgers:
+                        if not ledger.is_successful():
+                            raise XRPLRequestFailureException(ledger.result)
+                        validated.extend(
+                            transaction_hash for transaction_hash in ledger.result['ledger'].get('transactions', [])
+                            if transaction_hash in pending
+                        )
+
+                    responses = await asyncio.gather(*(
+                        self._request(Tx(transaction=transaction_hash)) for transaction_hash in validated
+                    ))
+                    for response in responses:
+                        if not response.is_successful():
+                            raise XRPLRequestFailureException(response.result)
+                except Exception as e:
+                    failures += 1
+                    if _is_transient(e) and failures <= _main._MAX_POLL_FAILURES:
+                        continue
+                    # The whole batch was submitted: report what is known rather than drop every outcome.
+                    for transaction_hash, last_ledger_sequence in pending.items():
+                        outcomes[transaction_hash] = _failure(
+                            transaction_hash, 'unknown',
+                            f'Waiting failed ({e}); the transaction may still apply until ledger {last_ledger_sequence}'
+                        )
+                    break
+                failures = 0
+
+                for transaction_hash in validated:
+                    del pending[transaction_hash]
+                outcomes.update(zip(validated, responses))
+
+                next_ledger = latest_ledger_sequence + 1
+
+                for transaction_hash, last_ledger_sequence in list(pending.items()):
+                    if latest_ledger_sequence >= last_ledger_sequence:
+                        del pending[transaction_hash]
+                        outcomes[transaction_hash] = _failure(
+                            transaction_hash, 'expired',
+                            f'Not validated before LastLedgerSequence {last_ledger_sequence}'
+                        )
+
+            return [outcomes[transaction_hash] for transaction_hash in hashes]
+
+    async def _watch(self, address: str) -> None:
+        """
+        Have the validation tracker, if one is set, follow an account before it submits anything
+
+        :param address: Wallet address
+        :type address: str
+
+        :return: None
+        """
+
+        if self._tracker is not None:
+            # The tracker's client is synchronous; subscribing must not block the event loop.
+            await asyncio.get_running_loop().run_in_executor(None, self._tracker.watch, address)
+
+    async def _autofill_and_sign(self, transaction: Transaction, from_wallet: Wallet) -> Transaction:
+        """
+        Autofill and sign a transaction as two separately timed steps. See :meth:`xrpy.XRPY._autofill_and_sign`.
+
+        :param transaction: Unsigned transaction
+        :type transaction: Transaction
+
+        :param from_wallet: Wallet to sign the transaction with
+        :type from_wallet: Wallet
+
+        :return: Signed transaction
+        :rtype: Transaction
+        """
+
+        transaction_type = transaction.transaction_type.value
+        with self._span('autofill', transaction_type=transaction_type):
+            autofilled = await self._autofill(transaction)
+
+        with self._span('sign', transaction_type=transaction_type):
+            return await safe_sign_transaction(
+                autofilled, from_wallet, check_fee=self._fees is None and transaction.fee is not None
+            )
+
+    async def _submit(self, transaction: Union[Transaction, str]) -> Response:
+        """
+        Submit a signed transaction
+
+        :param transaction: Signed transaction, or its blob
+        :type transaction: Union[Transaction, str]
+
+        :raises XRPLRequestFailureException: If the submit request fails
+
+        :return: ``submit`` Response
+        :rtype: Response
+        """
+
+        if isinstance(transaction, str):
+            blob, transaction_type = transaction, decode(transaction)['TransactionType']
+        else:
+            blob, transaction_type = encode(transaction.to_xrpl()), transaction.transaction_type.value
+
+        with self._span('submit', transaction_type=transaction_type) as span:
+            response = await self._request(SubmitOnly(tx_blob=blob))
+            if not response.is_successful():
+                raise XRPLRequestFailureException(response.result)
+            span['engine_result'] = response.result.get('engine_result', '')
+
+        return response
+
+    async def _try_submit(self, transaction: Union[Transaction, str], attempts: int = 1) -> Optional[Response]:
+        """
+        Submit a signed transaction, sending the same blob again after transient failures. See
+        :meth:`xrpy.XRPY._try_submit`.
+
+        :param transaction: Signed transaction, or its blob
+        :type transaction: Union[Transaction, str]
+
+        :param attempts: Submits before giving up
+        :type attempts: int
+
+        :raises XRPLRequestFailureException: If the first submit request fails for another reason
+
+        :return: ``submit`` Response, or None if every attempt failed transiently and the outcome is unknown
+        :rtype: Optional[Response]
+        """
+
+        for attempt in range(attempts):
+            if attempt:
+                await asyncio.sleep(_main._POLL_INTERVAL)
+            try:
+                response = await self._submit(transaction)
+            except Exception as e:
+                if not _is_transient(e):
+                    # An earlier attempt that failed transiently may still have applied.
+                    if attempt:
+                        return None
+                    raise
+                self._count('retries', reason=getattr(e, 'error', type(e).__name__))
+                continue
+
+            # tefPAST_SEQ or tefALREADY after a failed attempt may mean that attempt applied.
+            if attempt and response.result.get('engine_result', '')[:3] == 'tef':
+                return None
+            return response
+
+        return None
+
+    async def _outcome(
+            self, transaction: Transaction, response: Optional[Response], wait_for_validation: bool
+    ) -> Response:
+        """
+        Finish sending a signed transaction. See :meth:`xrpy.XRPY._outcome`.
+
+        :param transaction: Signed transaction
+        :type transaction: Transaction
+
+        :param response: ``submit`` Response, or None if the outcome of submitting it is unknown
+        :type response: Optional[Response]
+
+        :param wait_for_validation: If False, return the ``submit`` response without waiting for a validated ledger
+        :type wait_for_validation: bool
+
+        :raises XRPLRequestFailureException: If the outcome is unknown and not waited for
+        :raises XRPLReliableSubmissionException: If the transaction failed or expired
+
+        :return: Response
+        :rtype: Response
+        """
+
+        if wait_for_validation is False:
+            if response is None:
+                raise XRPLRequestFailureException({
+                    'error': 'submitFailed',
+                    'error_message': f'Submitting {transaction.get_hash()} failed {_main._SUBMIT_ATTEMPTS} times; '
+                                     f'it may still apply until ledger {transaction.last_ledger_sequence}',
+                })
+            return response
+
+        engine_result = response.result.get('engine_result', '') if response is not None else ''
+        if engine_result[:3] in ('tem', 'tef'):
+            raise XRPLReliableSubmissionException(f'{engine_result}: {response.result.get("engine_result_message")}')
+
+        try:
+            return await self._wait_for_outcome(
+                transaction.get_hash(), transaction.last_ledger_sequence, engine_result, transaction
+            )
+        finally:
+            self._discard_cached(transaction)
+
+    async def _sign_and_send(
+            self, transaction: Transaction, from_wallet: Wallet, wait_for_validation: bool = True
+    ) -> Response:
+        """
+        Sign and send a transaction. See :meth:`xrpy.XRPY._sign_and_send`.
+
+        :param transaction: Transaction to sign and send
+        :type transaction: Transaction
+
+        :param from_wallet: Wallet to sign the transaction with
+        :type from_wallet: Wallet
+
+        :param wait_for_validation: If False, return the ``submit`` response without waiting for a validated ledger
+        :type wait_for_validation: bool
+
+        :return: Response
+        :rtype: Response
+        """
+
+        await self._watch(from_wallet.classic_address)
+
+        if self._tickets is not None and transaction.transaction_type in _main._TICKET_TYPES and \
+                transaction.sequence is None and transaction.ticket_sequence is None:
+            return await self._sign_and_send_ticketed(transaction, from_wallet, wait_for_validation)
+
+        if not self.local_sequences or transaction.sequence is not None:
+            safe_signed = await self._autofill_and_sign(transaction, from_wallet)
+            response = await self._try_submit(safe_signed, _main._SUBMIT_ATTEMPTS)
+            self._discard_cached(safe_signed)
+
+            return await self._outcome(safe_signed, response, wait_for_validation)
+
+        address = from_wallet.classic_address
+
+        for _ in range(_main._MAX_RESYNCS + 1):
+            sequenced = _replace(transaction, sequence=await self._next_sequence(address))
+            safe_signed = await self._autofill_and_sign(sequenced, from_wallet)
+            response = await self._try_submit(safe_signed, _main._SUBMIT_ATTEMPTS)
+            self._discard_cached(safe_signed)
+
+            # Whether a submit with an unknown outcome used its Sequence is only known once it validates or expires.
+            engine_result = response.result.get('engine_result', '') if response is not None else ''
+            if response is None or engine_result in RESYNC_RESULTS or not _consumes_sequence(engine_result):
+                self._sequences.invalidate(address)
+
+            if engine_result != 'tefPAST_SEQ':
+                break
+            self._count('retries', reason=engine_result)
+
+        return await self._outcome(safe_signed, response, wait_for_validation)
+
+    async def _sign_and_send_ticketed(
+            self, transaction: Transaction, from_wallet: Wallet, wait_for_validation: bool = True
+    ) -> Response:
+        """
+        Sign and send a transaction with a Ticket from the ticket pool. See :meth:`xrpy.XRPY._sign_and_send_ticketed`.
+
+        :param transaction: Transaction to sign and send
+        :type transaction: Transaction
+
+        :param from_wallet: Wallet to sign the transaction with
+        :type from_wallet: Wallet
+
+        :param wait_for_validation: If False, return the ``submit`` response without waiting for a validated ledger
+        :type wait_for_validation: bool
+
+        :return: Response
+        :rtype: Response
+        """
+
+        address = from_wallet.classic_address
+
+        for _ in range(_main._MAX_RESYNCS + 1):
+            ticket = await self._take_ticket(from_wallet)
+            ticketed = _replace(transaction, sequence=0, ticket_sequence=ticket)
+            try:
+                safe_signed = await self._autofill_and_sign(ticketed, from_wallet)
+                response = await self._try_submit(safe_signed, _main._SUBMIT_ATTEMPTS)
+            except Exception:
+                self._tickets.done(address, ticket)
+                raise
+            finally:
+                self._discard_cached(ticketed)
+
+            engine_result = response.result.get('engine_result', '') if response is not None else ''
+            if engine_result == 'tefNO_TICKET':
+                self._tickets.done(address, ticket)
+                await self._sync_tickets(address)
+                self._count('retries', reason=engine_result)
+                continue
+
+            # A Ticket whose transaction may still apply is never handed out again.
+            if response is None or _consumes_sequence(engine_result):
+                self._tickets.done(address, ticket)
+            else:
+                self._tickets.release(address, ticket)
+            break
+
+        return await self._outcome(safe_signed, response, wait_for_validation)
+
+    async def _take_ticket(self, from_wallet: Wallet) -> int:
+        """
+        Take a Ticket from the pool, topping it up first when empty or in a background task when running low
+
+        :param from_wallet: Wallet the Ticket is for
+        :type from_wallet: Wallet
+
+        :raises Exception: If no Ticket is available even after topping up
+
+        :return: TicketSequence
+        :rtype: int
+        """
+
+        if self._ticket_lock is None:
+            self._ticket_lock = asyncio.Lock()
+
+        address = from_wallet.classic_address
+
+        ticket = self._tickets.take(address)
+        if ticket is None:
+            await self._top_up_tickets(from_wallet)
+            ticket = self._tickets.take(address)
+            if ticket is None:
+                raise Exception(f'No Ticket available for {address}')
+
+        if self._tickets.needs_top_up(address) and not self._ticket_lock.locked():
+            self._ticket_top_up = asyncio.ensure_future(self._top_up_tickets(from_wallet, False))
+
+        return ticket
+
+    async def _top_up_tickets(self, from_wallet: Wallet, blocking: bool = True) -> None:
+        """
+        Create Tickets until the pool is full again. See :meth:`xrpy.XRPY._top_up_tickets`.
+
+        :param from_wallet: Wallet to create Tickets for
+        :type from_wallet: Wallet
+
+        :param blocking: If False, return at once when another top-up is running
+        :type blocking: bool
+
+        :return: None
+        """
+
+        if blocking is False and self._ticket_lock.locked():
+            return
+
+        async with self._ticket_lock:
+            address = from_wallet.classic_address
+
+            # Another top-up may have filled the pool while this one waited for the lock.
+            if self._tickets.is_synced(address) and not self._tickets.needs_top_up(address):
+                return
+
+            on_ledger = await self._sync_tickets(address)
+            available = self._tickets.available(address)
+            if available > 0 and not self._tickets.needs_top_up(address):
+                return
+
+            ticket_count = min(self._tickets.size - available, MAX_TICKETS - on_ledger)
+            if ticket_count > 0:
+                await self.create_tickets(from_wallet, ticket_count)
+
+    async def _sync_tickets(self, address: str) -> int:
+        """
+        Load the Tickets an account owns into the ticket pool
+
+        :param address: Wallet address
+        :type address: str
+
+        :return: Number of Tickets the account owns
+        :rtype: int
+        """
+
+        tickets = await self.get_tickets(address)
+        self._tickets.sync(address, tickets)
+        return len(tickets)
+
+    async def get_tickets(self, address: str) -> List[int]:
+        """
+        Get the TicketSequence of every Ticket an account owns, in the current ledger
+
+        :param address: Wallet address
+        :type address: str
+
+        :raises XRPLRequestFailureException: If a request fails
+
+        :return: TicketSequences, lowest first
+        :rtype: List[int]
+        """
+
+        account_objects = AccountObjects(
+            account=address,
+            type=AccountObjectType.TICKET,
+            ledger_index='current',
+        )
+
+        tickets = []
+        async for page in self._iter_pages(account_objects):
+            tickets.extend(ticket['TicketSequence'] for ticket in page.result.get('account_objects', []))
+
+        return sorted(tickets)
+
+    async def create_tickets(
+            self, from_wallet: Wallet, ticket_count: int, wait_for_validation: bool = True
+    ) -> Response:
+        """
+        Create Tickets with a single TicketCreate. With a ticket pool set, the pool is re-synced afterwards.
+
+        :param from_wallet: XRPL Wallet
+        :type from_wallet: Wallet
+
+        :param ticket_count: Number of Tickets to create (1 to 250)
+        :type ticket_count: int
+
+        :param wait_for_validation: If False, return as soon as the transaction is submitted
+        :type wait_for_validation: bool
+
+        :return: Result of Ticket creation attempt
+        :rtype: Response
+        """
+
+        transaction = ticket_create(from_wallet.classic_address, ticket_count)
+
+        response = await self._sign_and_send(transaction, from_wallet, wait_for_validation)
+        if self._tickets is not None:
+            await self._sync_tickets(from_wallet.classic_address)
+        return response
+
+    async def _submit_batch(self, signed: List[Union[Transaction, str]], hashes: List[str]) -> List[Optional[Response]]:
+        """
+        Submit signed transactions in Sequence order without raising. See :meth:`xrpy.XRPY._submit_batch`.
+
+        :param signed: Signed transactions or their blobs, in Sequence order
+        :type signed: List[Union[Transaction, str]]
+
+        :param hashes: Their hashes, in the same order
+        :type hashes: List[str]
+
+        :return: ``submit`` Response, None or error Response per transaction, in the same order
+        :rtype: List[Optional[Response]]
+        """
+
+        submitted = []
+        rejected = False
+        for transaction, transaction_hash in zip(signed, hashes):
+            if rejected:
+                submitted.append(_failure(
+                    transaction_hash, 'notSubmitted', 'An earlier transaction of the batch failed to submit'
+                ))
+                continue
+
+            try:
+                submitted.append(await self._try_submit(transaction, _main._SUBMIT_ATTEMPTS))
+            except Exception as e:
+                rejected = True
+                submitted.append(_failure(transaction_hash, getattr(e, 'error', type(e).__name__), str(e)))
+
+        return submitted
+
+    async def submit_many(
+            self, transactions: List[Transaction], from_wallet: Wallet, batch_size: int = _main._BATCH_SIZE,
+            wait_for_validation: bool = True
+    ) -> List[Response]:
+        """
+        Sign and send many transactions from one wallet. See :meth:`xrpy.XRPY.submit_many`.
+
+        :param transactions: Unsigned transactions, in the order they must apply
+        :type transactions: List[Transaction]
+
+        :param from_wallet: Wallet to sign the transactions with
+        :type from_wallet: Wallet
+
+        :param batch_size: Transactions submitted before waiting for them to validate
+        :type batch_size: int
+
+        :param wait_for_validation: If False, return the ``submit`` responses without waiting for a validated ledger
+        :type wait_for_validation: bool
+
+        :return: One Response per transaction, in the same order
+        :rtype: List[Response]
+        """
+
+        from .ratelimit import request_priority, PRIORITY_BULK
+
+        if not self.local_sequences:
+            self._sequences.invalidate(from_wallet.classic_address)
+
+        if wait_for_validation is True:
+            await self._watch(from_wallet.classic_address)
+
+        with request_priority(PRIORITY_BULK):
+            responses = []
+            for start in range(0, len(transactions), batch_size):
+                signed = await self._prepare_batch(transactions[start:start + batch_size], from_wallet)
+
+                # Submit in Sequence order so the server never sees a gap.
+                hashes = [transaction.get_hash() for transaction in signed]
+                submitted = await self._submit_batch(signed, hashes)
+
+                if wait_for_validation is True:
+                    responses.extend(await self._wait_for_outcomes(
+                        from_wallet.classic_address, hashes, signed[0].last_ledger_sequence, submitted
+                    ))
+                else:
+                    responses.extend(_unknown_if_missing(hashes, submitted))
+
+                for transaction in signed:
+                    self._discard_cached(transaction)
+
+        return responses
+
+    async def prepare_signed(
+            self, transactions: List[Transaction], from_wallet: Wallet, ledger_offset: int = _main._LEDGER_OFFSET,
+            max_workers: int = None
+    ) -> List[Tuple[str, str]]:
+        """
+        Sign transactions offline, filling in Sequences, the fee and a shared LastLedgerSequence. The signing runs in
+        the default executor. See :meth:`xrpy.XRPY.prepare_signed`.
+
+        :param transactions: Unsigned transactions, in the order they must apply
+        :type transactions: List[Transaction]
+
+        :param from_wallet: Wallet to sign the transactions with
+        :type from_wallet: Wallet
+
+        :param ledger_offset: Ledgers after the latest validated one the blobs stay valid for
+        :type ledger_offset: int
+
+        :param max_workers: max number of signing processes (default: one per CPU)
+        :type max_workers: int
+
+        :return: (blob, hash) pairs, in the same order as the transactions
+        :rtype: List[Tuple[str, str]]
+        """
+
+        from .signing import prepare_and_sign
+
+        if not transactions:
+            return []
+
+        first_sequence, fee, latest_ledger_sequence = await asyncio.gather(
+            self._next_sequence(from_wallet.classic_address, len(transactions)),
+            self._fee(),
+            self._latest_validated_ledger_sequence(),
+        )
+
+        return await asyncio.get_running_loop().run_in_executor(
+            None, prepare_and_sign, transactions, from_wallet, first_sequence, fee,
+            latest_ledger_sequence + ledger_offset, max_workers
+        )
+
+    async def submit_signed(self, signed: List[Tuple[str, str]], wait_for_validation: bool = True) -> List[Response]:
+        """
+        Submit blobs signed offline, in order. See :meth:`xrpy.XRPY.submit_signed`.
+
+        :param signed: (blob, hash) pairs, in Sequence order
+        :type signed: List[Tuple[str, str]]
+
+        :param wait_for_validation: If False, return the ``submit`` responses without waiting for a validated ledger
+        :type wait_for_validation: bool
+
+        :raises ValueError: If the blobs come from several accounts, or if waiting for blobs without one shared
+            LastLedgerSequence. Nothing is submitted then.
+
+        :return: One Response per blob, in the same order
+        :rtype: List[Response]
+        """
+
+        if not signed:
+            return []
+
+        decoded = [decode(blob) for blob, _ in signed]
+        account = decoded[0]['Account']
+        last_ledger_sequence = decoded[0].get('LastLedgerSequence')
+        if any(fields['Account'] != account for fields in decoded):
+            raise ValueError('Blobs submitted together must all come from one account')
+        if wait_for_validation is True and (
+                last_ledger_sequence is None or
+                any(fields.get('LastLedgerSequence') != last_ledger_sequence for fields in decoded)
+        ):
+            raise ValueError('Blobs without one shared LastLedgerSequence can not be waited for')
+
+        first_ledger = None
+        if wait_for_validation is True:
+            await self._watch(account)
+            first_ledger = await self._latest_validated_ledger_sequence() + 1
+
+        hashes = [transaction_hash for _, transaction_hash in signed]
+        submitted = await self._submit_batch([blob for blob, _ in signed], hashes)
+
+        self._sequences.invalidate(account)
+        if self._cache is not None:
+            self._cache.discard_account(account)
+
+        if wait_for_validation is False:
+            return _unknown_if_missing(hashes, submitted)
+
+        return await self._wait_for_outcomes(account, hashes, last_ledger_sequence, submitted, first_ledger)
+
+    async def create_wallet(self, wallet: Optional[Wallet] = None, debug: bool = False) -> Wallet:
+        """
+        Create a wallet
+
+        :param wallet: A wallet to use for the creation process. If None, a new wallet will be created.
+        :type wallet: Optional[Wallet]
+
+        :param debug: Whether to print debug information as it creates the wallet.
+        :type debug: bool
+
+        :return: XRPL Wallet
+        :rtype: Wallet
+        """
+
+        _wallet = await generate_faucet_wallet(self._client, wallet, debug)
+        return _wallet
+
+    async def transfer_xrp(
+            self, from_wallet: Wallet, amount: Union[int, float], destination: str, wait_for_validation: bool = True
+    ) -> Response:
+        """
+        Transfer XRP
+
+        :param from_wallet: XRPL Wallet
+        :type from_wallet: Wallet
+
+        :param amount: Amount to send
+        :type amount: Union[int, float]
+
+        :param destination: Destination address
+        :type destination: str
+
+        :param wait_for_validation: If False, return as soon as the transaction is submitted
+        :type wait_for_validation: bool
+
+        :return: Result of transaction sending attempt
+        :rtype: Response
+        """
+
+        payment = xrp_payment(from_wallet.classic_address, amount, destination)
+
+        response = await self._sign_and_send(payment, from_wallet, wait_for_validation)
+        return response
+
+    async def transfer_token(
+            self, from_wallet: Wallet, currency: str, amount: Union[int, float], destination: str, issuer: str,
+            wait_for_validation: bool = True
+    ) -> Response:
+        """
+        Transfer a token
+
+        :param from_wallet: XRPL Wallet
+        :type from_wallet: Wallet
+
+        :param currency: Currency to send
+        :type currency: str
+
+        :param amount: Amount to send
+        :type amount: Union[int, float]
+
+        :param destination: Destination address
+        :type destination: str
+
+        :param issuer: Issuer address
+        :type issuer: str
+
+        :param wait_for_validation: If False, return as soon as the transaction is submitted
+        :type wait_for_validation: bool
+
+        :return: Result of transaction sending attempt
+        :rtype: Response
+        """
+
+        payment = token_payment(from_wallet.classic_address, currency, amount, destination, issuer)
+
+        response = await self._sign_and_send(payment, from_wallet, wait_for_validation)
+        return response
+
+    async def transfer_xrp_many(
+            self, from_wallet: Wallet, payments: List[Tuple[str, Union[int, float]]],
+            batch_size: int = _main._BATCH_SIZE
+    ) -> List[Response]:
+        """
+        Transfer XRP to many destinations. See :meth:`submit_many`.
+
+        :param from_wallet: XRPL Wallet
+        :type from_wallet: Wallet
+
+        :param payments: (destination, amount) pairs
+        :type payments: List[Tuple[str, Union[int, float]]]
+
+        :param batch_size: Payments submitted before waiting for them to validate
+        :type batch_size: int
+
+        :return: One Response per payment, in the same order
+        :rtype: List[Response]
+        """
+
+        transactions = [
+            xrp_payment(from_wallet.classic_address, amount, destination) for destination, amount in payments
+        ]
+
+        return await self.submit_many(transactions, from_wallet, batch_size)
+
+    async def transfer_token_many(
+            self, from_wallet: Wallet, currency: str, issuer: str, payments: List[Tuple[str, Union[int, float]]],
+            batch_size: int = _main._BATCH_SIZE
+    ) -> List[Response]:
+        """
+        Transfer a token to many destinations. See :meth:`submit_many`.
+
+        :param from_wallet: XRPL Wallet
+        :type from_wallet: Wallet
+
+        :param currency: Currency to send
+        :type currency: str
+
+        :param issuer: Issuer address
+        :type issuer: str
+
+        :param payments: (destination, amount) pairs
+        :type payments: List[Tuple[str, Union[int, float]]]
+
+        :param batch_size: Payments submitted before waiting for them to validate
+        :type batch_size: int
+
+        :return: One Response per payment, in the same order
+        :rtype: List[Response]
+        """
+
+        transactions = [
+            token_payment(from_wallet.classic_address, currency, amount, destination, issuer)
+            for destination, amount in payments
+        ]
+
+        return await self.submit_many(transactions, from_wallet, batch_size)
+
+    async def set_trust_line(
+            self, from_wallet: Wallet, currency: str, value: str, issuer: str, wait_for_validation: bool = True
+    ) -> Response:
+        """
+        Create a trust line
+
+        :param from_wallet: XRPL Wallet
+        :type from_wallet: Wallet
+
+        :param currency: Trust line currency
+        :type currency: str
+
+        :param value: Trust line value
+        :type value: str
+
+        :param issuer: Trust line issuer
+        :type issuer: str
+
+        :param wait_for_validation: If False, return as soon as the transaction is submitted
+        :type wait_for_validation: bool
+
+        :return: Result of Trust line creation attempt
+        :rtype: Response
+        """
+
+        transaction = trust_set(from_wallet.classic_address, currency, value, issuer)
+
+        response = await self._sign_and_send(transaction, from_wallet, wait_for_validation)
+        return response
+
+    async def create_buy_offer(
+            self, from_wallet: Wallet, taker_gets_xrp: Union[float, int],
+            taker_pays_currency: str, taker_pays_value: str, taker_pays_issuer: str,
+            _type: str, wait_for_validation: bool = True
+    ) -> Response:
+        """
+        Place Order
+
+        :param from_wallet: XRPL Wallet
+        :type from_wallet: Wallet
+
+        :param taker_gets_xrp: amount in xrp for taker gets
+        :type taker_gets_xrp: int
+
+        :param taker_pays_currency: Currency
+        :type taker_pays_currency: str
+
+        :param taker_pays_value: Value
+        :type taker_pays_value: str
+
+        :param taker_pays_issuer: Issuer
+        :type taker_pays_issuer: str
+
+        :param _type: Offer type (market or limit)
+        :type _type: str
+
+        :param wait_for_validation: If False, return as soon as the transaction is submitted
+        :type wait_for_validation: bool
+
+        :return: Result of order placing attempt
+        :rtype: Response
+        """
+
+        offer_create = buy_offer(
+            from_wallet.classic_address, taker_gets_xrp,
+            taker_pays_currency, taker_pays_value, taker_pays_issuer,
+            _type
+        )
+
+        response = await self._sign_and_send(offer_create, from_wallet, wait_for_validation)
+        return response
+
+    async def create_sell_offer(
+            self, from_wallet: Wallet, taker_pays_xrp: Union[float, int],
+            taker_gets_currency: str, taker_gets_value: str, taker_gets_issuer: str,
+            _type: str, wait_for_validation: bool = True
+    ) -> Response:
+        """
+        Place Order
+
+        :param from_wallet: XRPL Wallet
+        :type from_wallet: Wallet
+
+        :param taker_pays_xrp: amount in xrp for taker pays
+        :type taker_pays_xrp: int
+
+        :param taker_gets_currency: Currency
+        :type taker_gets_currency: str
+
+        :param taker_gets_value: Value
+        :type taker_gets_value: str
+
+        :param taker_gets_issuer: Issuer
+        :type taker_gets_issuer: str
+
+        :param _type: Offer type (market or limit)
+        :type _type: str
+
+        :param wait_for_validation: If False, return as soon as the transaction is submitted
+        :type wait_for_validation: bool
+
+        :return: Result of order placing attempt
+        :rtype: Response
+        """
+
+        offer_create = sell_offer(
+            from_wallet.classic_address, taker_pays_xrp,
+            taker_gets_currency, taker_gets_value, taker_gets_issuer,
+            _type
+        )
+
+        response = await self._sign_and_send(offer_create, from_wallet, wait_for_validation)
+        return response
+
+    async def cancel_offer(
+            self, from_wallet: Wallet, offer_sequence: int, wait_for_validation: bool = True
+    ) -> Response:
+        """
+        Cancel order
+
+        :param from_wallet: XRPL Wallet
+        :type from_wallet: Wallet
+
+        :param offer_sequence: The sequence number (or Ticket number) of a previous OfferCreate transaction.
+        :type offer_sequence: int
+
+        :param wait_for_validation: If False, return as soon as the transaction is submitted
+        :type wait_for_validation: bool
+
+        :return: Result of order canceling attempt
+        :rtype: Response
+        """
+
+        transaction = offer_cancel(from_wallet.classic_address, offer_sequence)
+
+        response = await self._sign_and_send(transaction, from_wallet, wait_for_validation)
+        return response
+
+    async def delete_account(
+            self, from_wallet: Wallet, destination: str, destination_tag: Optional[int] = None
+    ) -> Response:
+        """
+        Delete XRP Wallet
+
+        :param from_wallet: wallet you want to delete
+        :type from_wallet: Wallet
+
+        :param destination: destination address
+        :type destination: str
+
+        :param destination_tag: destination tag
+        :type destination_tag: int
+
+        :return: Result of account deletion attempt
+        :rtype: Response
+        """
+
+        transaction = account_delete(from_wallet.classic_address, destination, destination_tag)
+
+        response = await self._sign_and_send(transaction, from_wallet)
+        return response
+
+    async def advanced_delete_account(
+            self, from_wallet: Wallet, destination: str, destination_tag: Optional[int] = None,
+            batched: Optional[bool] = False
+    ) -> Dict[str, List[Response]]:
+        """
+        Advanced Delete XRP Wallet.
+        1) Cancel all offers
+        2) Sell All Tokens
+        3) Remove All Trustlines
+        4) Delete Account
+
+        In batched mode, the async counterpart of :meth:`xrpy.XRPY.advanced_delete_account`'s threaded mode, steps
+        1-3 are sent with :meth:`submit_many`.
+
+        :param from_wallet: wallet you want to delete
+        :type from_wallet: Wallet
+
+        :param destination: destination address
+        :type destination: str
+
+        :param destination_tag: destination tag
+        :type destination_tag: int
+
+        :param batched: if True, sign and submit steps 1-3 as one batch
+        :type batched: bool
+
+        :return: Result of account deletion attempt
+        :rtype: Response
+        """
+
+        __data__ = {
+            'CancelOffers': [],
+            'SellAllTokens': [],
+            'RemoveTrustlines': [],
+            'DeleteAccount': [],
+        }
+
+        address = from_wallet.classic_address
+
+        async with self.at_ledger() as snapshot:
+            offers, trustlines = await asyncio.gather(
+                snapshot.get_account_offer_records(address),
+                snapshot.get_account_trustline_records(address),
+            )
+        to_sell = [trustline for trustline in trustlines if trustline.balance != 0]
+
+        cancels = [offer_cancel(address, offer.seq) for offer in offers]
+        sells = [
+            sell_offer(
+                address,
+                0.00001,
+                trustline.currency,
+                str(trustline.balance),
+                trustline.account,
+                _type='market'
+            )
+            for trustline in to_sell
+        ]
+        removals = [
+            trust_set(address, trustline.currency, '0', trustline.account)
+            for trustline in trustlines
+        ]
+
+        if batched is True:
+            results = await self.submit_many(cancels + sells + removals, from_wallet)
+        else:
+            results = [
+                await self._sign_and_send(transaction, from_wallet) for transaction in cancels + sells + removals
+            ]
+
+        sold = iter(results[len(cancels):len(cancels) + len(sells)])
+        __data__['CancelOffers'] = results[:len(cancels)]
+        __data__['SellAllTokens'] = [
+            next(sold) if trustline.balance != 0 else None for trustline in trustlines
+        ]
+        __data__['RemoveTrustlines'] = results[len(cancels) + len(sells):]
+
+        # Delete account
+        _ = await self.delete_account(from_wallet, destination, destination_tag)
+        __data__['DeleteAccount'] = _
+
+        return __data__
+
+    async def get_account_info(self, address: str, ledger_index: Union[str, int] = 'validated') -> Response:
+        """
+        Get Account Info
+
+        :param address: Wallet address or X-address
+        :type address: str
+
+        :param ledger_index: Ledger to read from: an index, or 'validated', 'current' or 'closed'
+        :type ledger_index: Union[str, int]
+
+        :raises XRPLRequestFailureException: If the request fails
+
+        :return: Account info
+        :rtype: Response
+        """
+
+        if is_valid_xaddress(address):
+            address, _, _ = xaddress_to_classic_address(address)
+
+        acc_info = await self._request(AccountInfo(
+            account=address,
+            ledger_index=ledger_index,
+        ))
+        if not acc_info.is_successful():
+            raise XRPLRequestFailureException(acc_info.result)
+
+        return acc_info
+
+    async def _map_addresses(
+            self, function: Callable[[str], Awaitable[Any]], addresses: Iterable[str],
+            concurrency: int = _main._BULK_WORKERS
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Await ``function`` for every address with at most ``concurrency`` in flight, yielding results as they complete.
+        See :meth:`xrpy.XRPY._map_addresses`.
+
+        :param function: Coroutine function taking an address
+        :type function: Callable[[str], Awaitable[Any]]
+
+        :param addresses: Addresses
+        :type addresses: Iterable[str]
+
+        :param concurrency: max number of concurrent calls
+        :type concurrency: int
+
+        :return: (address, result or exception) pairs, in completion order
+        :rtype: AsyncIterator[Tuple[str, Any]]
+        """
+
+        from .ratelimit import request_priority, PRIORITY_BULK
+
+        async def call(address: str) -> Tuple[str, Any]:
+            try:
+                with request_priority(PRIORITY_BULK):
+                    return address, await function(address)
+            except Exception as e:
+                return address, e
+
+        addresses = iter(addresses)
+        pending = {asyncio.ensure_future(call(address)) for address in islice(addresses, concurrency)}
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    for address in islice(addresses, 1):
+                        pending.add(asyncio.ensure_future(call(address)))
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _pin_ledger_index(self, ledger_index: Union[str, int]) -> Union[str, int]:
+        """
+        Resolve 'validated' to the index of the latest validated ledger, so a batch of reads sees one ledger
+
+        :param ledger_index: Ledger index or shortcut
+        :type ledger_index: Union[str, int]
+
+        :return: Ledger index
+        :rtype: Union[str, int]
+        """
+
+        if ledger_index == 'validated':
+            if self._snapshot_index is not None:
+                return self._snapshot_index
+            return await self._latest_validated_ledger_sequence()
+        return ledger_index
+
+    async def get_account_infos(
+            self, addresses: Iterable[str], ledger_index: Union[str, int] = 'validated',
+            concurrency: int = _main._BULK_WORKERS
+    ) -> AsyncIterator[Tuple[str, Union[Response, Exception]]]:
+        """
+        Get Account Info for many addresses, at most ``concurrency`` requests in flight.
+        See :meth:`xrpy.XRPY.get_account_infos`.
+
+        :param addresses: Wallet addresses
+        :type addresses: Iterable[str]
+
+        :param ledger_index: Ledger to read from: an index, or 'validated', 'current' or 'closed'
+        :type ledger_index: Union[str, int]
+
+        :param concurrency: max number of concurrent requests
+        :type concurrency: int
+
+        :return: (address, account info or exception) pairs, in completion order
+        :rtype: AsyncIterator[Tuple[str, Union[Response, Exception]]]
+        """
+
+        ledger_index = await self._pin_ledger_index(ledger_index)
+
+        async for result in self._map_addresses(
+                lambda address: self.get_account_info(address, ledger_index), addresses, concurrency
+        ):
+            yield result
+
+    async def _iter_pages(self, request: Request, prefetch: bool = False) -> AsyncIterator[Response]:
+        """
+        Send a paginated request and follow its ``marker`` until the last page
+
+        :param request: First page request
+        :type request: Request
+
+        :param prefetch: If True, fetch the next page in the background while the caller processes the current one
+        :type prefetch: bool
+
+        :raises XRPLRequestFailureException: If a page request fails
+
+        :return: One Response per page
+        :rtype: AsyncIterator[Response]
+        """
+
+        pending = asyncio.ensure_future(self._request(request)) if prefetch is True else None
+
+        try:
+            while request is not None:
+                response = await pending if prefetch is True else await self._request(request)
+                if not response.is_successful():
+                    raise XRPLRequestFailureException(response.result)
+
+                request = _next_page(request, response)
+                if prefetch is True and request is not None:
+                    pending = asyncio.ensure_future(self._request(request))
+
+                yield response
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def _request_all_pages(self, request: Request, key: str) -> Response:
+        """
+        Send a paginated request and merge every page into one Response
+
+        :param request: First page request
+        :type request: Request
+
+        :param key: Result field holding the paginated list
+        :type key: str
+
+        :raises XRPLRequestFailureException: If a request for a page after the first fails
+
+        :return: First page Response with ``key`` holding the items of every page and no ``marker``
+        :rtype: Response
+        """
+
+        first = await self._request(request)
+        if not first.is_successful() or first.result.get('marker') is None:
+            return first
+
+        result = {**first.result, key: list(first.result.get(key, []))}
+        del result['marker']
+        async for page in self._iter_pages(_next_page(request, first), prefetch=True):
+            result[key].extend(page.result.get(key, []))
+
+        return Response(status=first.status, result=result, id=first.id, type=first.type)
+
+    async def iter_account_trustlines(
+            self, address: str, limit: int = None, prefetch: bool = False
+    ) -> AsyncIterator[Dict]:
+        """
+        Iterate over every trust line of an account, one page at a time, all from the latest validated ledger
+
+        :param address: Wallet address
+        :type address: str
+
+        :param limit: Trust lines per page (server default if None)
+        :type limit: int
+
+        :param prefetch: If True, fetch the next page while the caller processes the current one
+        :type prefetch: bool
+
+        :return: Trust lines
+        :rtype: AsyncIterator[Dict]
+        """
+
+        account_lines = AccountLines(
+            account=address,
+            ledger_index='validated',
+            limit=limit,
+        )
+
+        async for page in self._iter_pages(account_lines, prefetch):
+            for line in page.result.get('lines', []):
+                yield line
+
+    async def iter_account_offers(self, address: str, limit: int = None, prefetch: bool = False) -> AsyncIterator[Dict]:
+        """
+        Iterate over every offer of an account, one page at a time, all from the latest validated ledger
+
+        :param address: Wallet address
+        :type address: str
+
+        :param limit: Offers per page (server default if None)
+        :type limit: int
+
+        :param prefetch: If True, fetch the next page while the caller processes the current one
+        :type prefetch: bool
+
+        :return: Offers
+        :rtype: AsyncIterator[Dict]
+        """
+
+        account_offers = AccountOffers(
+            account=address,
+            ledger_index='validated',
+            limit=limit,
+        )
+
+        async for page in self._iter_pages(account_offers, prefetch):
+            for offer in page.result.get('offers', []):
+                yield offer
+
+    async def get_account_trustline_records(self, address: str, prefetch: bool = False) -> List[TrustLine]:
+        """
+        Get every trust line of an account as slotted records. See :meth:`xrpy.XRPY.get_account_trustline_records`.
+
+        :param address: Wallet address
+        :type address: str
+
+        :param prefetch: If True, fetch the next page while the current one is converted
+        :type prefetch: bool
+
+        :return: Trust lines
+        :rtype: List[TrustLine]
+        """
+
+        return [TrustLine.from_xrpl(line) async for line in self.iter_account_trustlines(address, prefetch=prefetch)]
+
+    async def get_account_offer_records(self, address: str, prefetch: bool = False) -> List[Offer]:
+        """
+        Get every offer of an account as slotted records. See :meth:`xrpy.XRPY.get_account_offer_records`.
+
+        :param address: Wallet address
+        :type address: str
+
+        :param prefetch: If True, fetch the next page while the current one is converted
+        :type prefetch: bool
+
+        :return: Offers
+        :rtype: List[Offer]
+        """
+
+        return [Offer.from_xrpl(offer) async for offer in self.iter_account_offers(address, prefetch=prefetch)]
+
+    async def iter_account_transactions(
+            self, address: str, ledger_min: int = -1, ledger_max: int = -1, forward: bool = False, limit: int = None,
+            marker: Optional[Any] = None, prefetch: bool = True, on_page: Optional[Callable[[Any], None]] = None
+    ) -> AsyncIterator[Dict]:
+        """
+        Iterate over the validated transactions of an account, one page at a time.
+        See :meth:`xrpy.XRPY.iter_account_transactions`.
+
+        :param address: Wallet address
+        :type address: str
+
+        :param ledger_min: Earliest ledger to include (-1 for the earliest the server has)
+        :type ledger_min: int
+
+        :param ledger_max: Latest ledger to include (-1 for the latest validated one)
+        :type ledger_max: int
+
+        :param forward: If True, oldest transactions first; newest first otherwise
+        :type forward: bool
+
+        :param limit: Transactions per page (server default if None)
+        :type limit: int
+
+        :param marker: Marker to resume from
+        :type marker: Optional[Any]
+
+        :param prefetch: If True, fetch the next page while the caller processes the current one
+        :type prefetch: bool
+
+        :param on_page: Called with the next page's marker after every page
+        :type on_page: Optional[Callable[[Any], None]]
+
+        :raises XRPLRequestFailureException: If a page request fails
+
+        :return: ``account_tx`` entries, with ``tx``, ``meta`` and ``validated``
+        :rtype: AsyncIterator[Dict]
+        """
+
+        account_tx = AccountTx(
+            account=address,
+            ledger_index_min=ledger_min,
+            ledger_index_max=ledger_max,
+            forward=forward,
+            limit=limit,
+            marker=marker,
+        )
+
+        async for page in self._iter_pages(account_tx, prefetch):
+            for transaction in page.result.get('transactions', []):
+                yield transaction
+            if on_page is not None:
+                on_page(page.result.get('marker'))
+
+    async def get_account_trustlines(self, address: str) -> Response:
+        """
+        Get Account Trustlines as of the latest validated ledger. Follows ``marker`` so every page is included.
+
+        :param address: Wallet address
+        :type address: str
+
+        :return: Account Trustlines
+        :rtype: Response
+        """
+
+        account_lines = AccountLines(
+            account=address,
+            ledger_index='validated',
+        )
+        account_lines_req = await self._request_all_pages(account_lines, 'lines')
+
+        return account_lines_req
+
+    async def get_account_offers(self, address: str) -> Response:
+        """
+        Get Account Offers as of the latest validated ledger. Follows ``marker`` so every page is included.
+
+        :param address: Wallet address
+        :type address: str
+
+        :return: Account Offers
+        :rtype: Response
+        """
+
+        account_offers = AccountOffers(
+            account=address,
+            ledger_index='validated',
+        )
+        account_offers_req = await self._request_all_pages(account_offers, 'offers')
+
+        return account_offers_req
+
+    async def order_book_sell(
+            self, classic_address: str, taker_pays_currency: Union[str, XRP], taker_pays_issuer: str
+    ) -> Response:
+        """
+        Get Orderbook
+
+        :param classic_address: Wallet address
+        :type classic_address: str
+
+        :param taker_pays_currency: Currency
+        :type taker_pays_currency: str
+
+        :param taker_pays_issuer: Issuer
+        :type taker_pays_issuer: str
+
+        :return: Order book offers
+        :rtype: Response
+        """
+
+        book_offers = _sell_book(classic_address, taker_pays_currency, taker_pays_issuer)
+
+        book_offers_req = await self._request(book_offers)
+
+        return book_offers_req
+
+    async def order_book_buy(
+            self, classic_address: str, taker_pays_currency: Union[str, XRP], taker_pays_issuer: str
+    ) -> Response:
+        """
+        Get Orderbook
+
+        :param classic_address: Wallet address
+        :type classic_address: str
+
+        :param taker_pays_currency: Currency
+        :type taker_pays_currency: str
+
+        :param taker_pays_issuer: Issuer
+        :type taker_pays_issuer: str
+
+        :return: Order book offers
+        :rtype: Response
+        """
+
+        book_offers = _buy_book(classic_address, taker_pays_currency, taker_pays_issuer)
+
+        book_offers_req = await self._request(book_offers)
+
+        return book_offers_req
+
+    async def order_books(
+            self, classic_address: str, taker_pays_currency: Union[str, XRP], taker_pays_issuer: str
+    ) -> Tuple[Response, Response]:
+        """
+        Get both sides of an Orderbook concurrently
+
+        :param classic_address: Wallet address
+        :type classic_address: str
+
+        :param taker_pays_currency: Currency
+        :type taker_pays_currency: str
+
+        :param taker_pays_issuer: Issuer
+        :type taker_pays_issuer: str
+
+        :return: The :meth:`order_book_sell` and :meth:`order_book_buy` responses
+        :rtype: Tuple[Response, Response]
+        """
+
+        sell, buy = await self.request_many([
+            _sell_book(classic_address, taker_pays_currency, taker_pays_issuer),
+            _buy_book(classic_address, taker_pays_currency, taker_pays_issuer),
+        ])
+
+        return sell, buy
+
+    async def get_reserves(self, refresh: bool = False) -> Tuple[int, int]:
+        """
+        Get the network's base and owner reserves. See :meth:`xrpy.XRPY.get_reserves`.
+
+        :param refresh: Request them even if the cached ones are still valid
+        :type refresh: bool
+
+        :raises XRPLRequestFailureException: If the server_state request fails
+
+        :return: (base reserve, owner reserve per object) in drops
+        :rtype: Tuple[int, int]
+        """
+
+        if refresh:
+            self._reserves.invalidate()
+
+        reserves = self._reserves.get()
+        if reserves is not None:
+            return reserves
+
+        if self._reserve_lock is None:
+            self._reserve_lock = asyncio.Lock()
+
+        async with self._reserve_lock:
+            reserves = self._reserves.get()
+            if reserves is None:
+                response = await self._request(ServerState())
+                if not response.is_successful():
+                    raise XRPLRequestFailureException(response.result)
+                reserves = self._reserves.update(response.result)
+
+        return reserves
+
+    async def _balance_and_reserve(
+            self, address: str, include_wallet_reserve: bool, ledger_index: Union[str, int]
+    ) -> Tuple[int, int]:
+        """
+        Balance and reserve of an account from one ``account_info`` and the cached reserves
+
+        :param address: Wallet address
+        :type address: str
+
+        :param include_wallet_reserve: Include the base reserve
+        :type include_wallet_reserve: bool
+
+        :param ledger_index: Ledger to read the account from
+        :type ledger_index: Union[str, int]
+
+        :return: (balance, reserved) in drops
+        :rtype: Tuple[int, int]
+        """
+
+        account_info, reserves = await asyncio.gather(
+            self.get_account_info(address, ledger_index),
+            self.get_reserves(),
+        )
+        account_data = account_info.result.get('account_data', {})
+        reserved = Reserves.reserved(reserves, account_data.get('OwnerCount', 0), include_wallet_reserve)
+
+        return int(account_data.get('Balance', 0)), reserved
+
+    async def get_reserved_drops(
+            self, address: str, include_wallet_reserve: bool = False, ledger_index: Union[str, int] = 'validated'
+    ) -> int:
+        """
+        Get Reserved Balance in drops. See :meth:`xrpy.XRPY.get_reserved_drops`.
+
+        :param address: Wallet address
+        :type address: str
+
+        :param include_wallet_reserve: Include the base reserve every account holds (default: False)
+        :type include_wallet_reserve: bool
+
+        :param ledger_index: Ledger to read the account from
+        :type ledger_index: Union[str, int]
+
+        :return: Reserved Balance in drops
+        :rtype: int
+        """
+
+        return (await self._balance_and_reserve(address, include_wallet_reserve, ledger_index))[1]
+
+    async def get_reserved_balance(
+            self, address: str, include_wallet_reserve: bool = False, ledger_index: Union[str, int] = 'validated'
+    ) -> float:
+        """
+        Get Reserved Balance in XRP. See :meth:`xrpy.XRPY.get_reserved_balance`.
+
+        :param address: Wallet address
+        :type address: str
+
+        :param include_wallet_reserve: Include the base reserve every account holds (default: False)
+        :type include_wallet_reserve: bool
+
+        :param ledger_index: Ledger to read the account from
+        :type ledger_index: Union[str, int]
+
+        :return: Reserved Balance in XRP
+        :rtype: float
+        """
+
+        reserved = await self.get_reserved_drops(address, include_wallet_reserve, ledger_index)
+
+        return float(drops_to_xrp(str(reserved)))
+
+    async def get_spendable_balance(self, address: str, ledger_index: Union[str, int] = 'validated') -> int:
+        """
+        Get Spendable Balance in drops. See :meth:`xrpy.XRPY.get_spendable_balance`.
+
+        :param address: Wallet address
+        :type address: str
+
+        :param ledger_index: Ledger to read the account from
+        :type ledger_index: Union[str, int]
+
+        :return: Spendable Balance in drops, 0 if the balance does not cover the reserve
+        :rtype: int
+        """
+
+        balance, reserved = await self._balance_and_reserve(address, True, ledger_index)
+
+        return max(balance - reserved, 0)
+
+    async def get_balance(
+            self, address: str, include_wallet_reserve: bool = True, ledger_index: Union[str, int] = 'validated'
+    ) -> Union[float, int]:
+        """
+        Get Balance in drops
+
+        :param address: Wallet address
+        :type address: str
+
+        :param include_wallet_reserve: Include the reserved drops; False gives :meth:`get_spendable_balance`
+            (default: True)
+        :type include_wallet_reserve: bool
+
+        :param ledger_index: Ledger to read the balance from
+        :type ledger_index: Union[str, int]
+
+        :return: Balance in drops
+        :rtype: float
+        """
+
+        if include_wallet_reserve is False:
+            return float(await self.get_spendable_balance(address, ledger_index))
+
+        account_info = await self.get_account_info(address, ledger_index)
+
+        return float(account_info.result.get('account_data', {}).get('Balance', 0)) or 0.0
+
+    async def get_balances(
+            self, addresses: Iterable[str], include_wallet_reserve: bool = True,
+            ledger_index: Union[str, int] = 'validated', concurrency: int = _main._BULK_WORKERS
+    ) -> AsyncIterator[Tuple[str, Union[float, Exception]]]:
+        """
+        Get Balance in drops for many addresses. See :meth:`xrpy.XRPY.get_account_infos` for how the batch runs.
+
+        :param addresses: Wallet addresses
+        :type addresses: Iterable[str]
+
+        :param include_wallet_reserve: Include the reserved drops; False gives spendable balances (default: True)
+        :type include_wallet_reserve: bool
+
+        :param ledger_index: Ledger to read from: an index, or 'validated', 'current' or 'closed'
+        :type ledger_index: Union[str, int]
+
+        :param concurrency: max number of concurrent requests
+        :type concurrency: int
+
+        :return: (address, balance or exception) pairs, in completion order
+        :rtype: AsyncIterator[Tuple[str, Union[float, Exception]]]
+        """
+
+        ledger_index = await self._pin_ledger_index(ledger_index)
+
+        async for result in self._map_addresses(
+                lambda address: self.get_balance(address, include_wallet_reserve, ledger_index), addresses, concurrency
+        ):
+            yield result
+
+    def __str__(self):
+        return f'AsyncXRPY Client: {self._client}, Version: {__version__}'
+
+    def __repr__(self):
+        return self.__str__()
@@ -0,0 +1,180 @@
+import json
+import time
+
+from collections import OrderedDict
+from threading import Lock
+
+
+from typing import Optional, Dict, Tuple
+
+
+from xrpl.models.requests.request import Request
+from xrpl.models.response import Response
+
+
+__all__ = [
+    'ReadCache',
+]
+
+
+# Default entry lifetime in seconds, about one ledger close.
+_TTL = 4.0
+
+# Default maximum number of cached responses.
+_MAXSIZE = 10_000
+
+
+def request_key(request: Request) -> str:
+    """
+    Cache key of a request: its parameters without the request id
+
+    :param request: Request
+    :type request: Request
+
+    :return: Key
+    :rtype: str
+    """
+
+    params = request.to_dict()
+    params.pop('id', None)
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+class ReadCache:
+    """
+    TTL + LRU cache for read responses.
+
+    Entries expire after ``ttl`` seconds, the least recently used entry is evicted once ``maxsize`` is reached, and
+    everything is dropped when a newer ledger is reported through :meth:`ledger_closed`. Entries that belong to an
+    account can be dropped with :meth:`discard_account`, e.g. after the account submitted a transaction.
+    """
+
+    def __init__(self, ttl: float = _TTL, maxsize: int = _MAXSIZE):
+        """
+        TTL + LRU cache for read responses.
+
+        :param ttl: Seconds an entry stays valid
+        :type ttl: float
+
+        :param maxsize: Maximum number of entries
+        :type maxsize: int
+        """
+
+        self.ttl = ttl
+        self.maxsize = maxsize
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = Lock()
+        self._entries: Dict[str, Tuple[float, Optional[str], Response]] = OrderedDict()
+        self._ledger_index = 0
+
+    def get(self, key: str) -> Optional[Response]:
+        """
+        Look up a response
+
+        :param key: Request key
+        :type key: str
+
+        :return: Cached response, or None on a miss
+        :rtype: Optional[Response]
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def put(self, key: str, response: Response, account: Optional[str] = None) -> None:
+        """
+        Store a response
+
+        :param key: Request key
+        :type key: str
+
+        :param response: Response to store
+        :type response: Response
+
+        :param account: Account the response describes, for :meth:`discard_account`
+        :type account: Optional[str]
+
+        :return: None
+        """
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, account, response)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def ledger_closed(self, ledger_index: int) -> None:
+        """
+        Report a ledger index; the cache is cleared when it is newer than every index seen before
+
+        :param ledger_index: Index of a validated or current ledger
+        :type ledger_index: int
+
+        :return: None
+        """
+
+        with self._lock:
+            if ledger_index > self._ledger_index:
+                if self._ledger_index:
+                    self._entries.clear()
+                self._ledger_index = ledger_index
+
+    def discard_account(self, account: str) -> None:
+        """
+        Drop every entry describing an account
+
+        :param account: Account address
+        :type account: str
+
+        :return: None
+        """
+
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry[1] == account]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Drop every entry
+
+        :return: None
+        """
+
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Hit/miss counters
+
+        :return: hits, misses, evictions and current size
+        :rtype: Dict[str, int]
+        """
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f'ReadCache(ttl={self.ttl}, maxsize={self.maxsize}, hits={self.hits}, misses={self.misses})'
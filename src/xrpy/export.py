@@ -0,0 +1,179 @@
+import json
+import os
+
+
+from typing import Optional, Dict, Iterable, BinaryIO, Any
+
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+__all__ = [
+    'transaction_row',
+    'write_ndjson',
+    'write_parquet',
+    'read_checkpoint',
+    'write_checkpoint',
+]
+
+
+# Transactions buffered into one Parquet row group.
+_ROW_GROUP = 10_000
+
+
+def transaction_row(transaction: Dict) -> Dict[str, Any]:
+    """
+    Flatten an ``account_tx`` entry into the columns of a Parquet export. The full transaction and metadata are kept as
+    JSON in ``tx_json`` and ``meta_json``.
+
+    :param transaction: Entry of ``account_tx``'s ``transactions``
+    :type transaction: Dict
+
+    :return: Row
+    :rtype: Dict[str, Any]
+    """
+
+    tx = transaction.get('tx') or transaction.get('tx_json') or {}
+    meta = transaction.get('meta') or {}
+
+    return {
+        'hash': tx.get('hash', transaction.get('hash')),
+        'ledger_index': tx.get('ledger_index', transaction.get('ledger_index')),
+        'date': tx.get('date', transaction.get('date')),
+        'transaction_type': tx.get('TransactionType'),
+        'account': tx.get('Account'),
+        'destination': tx.get('Destination'),
+        'fee': int(tx['Fee']) if 'Fee' in tx else None,
+        'sequence': tx.get('Sequence'),
+        'result': meta.get('TransactionResult') if type(meta) is dict else None,
+        'validated': transaction.get('validated'),
+        'tx_json': json.dumps(tx, separators=(',', ':')),
+        'meta_json': json.dumps(meta, separators=(',', ':')),
+    }
+
+
+def write_ndjson(transactions: Iterable[Dict], file: BinaryIO) -> int:
+    """
+    Write transactions as newline-delimited JSON, one line each, as they come
+
+    :param transactions: Transactions, e.g. from :meth:`xrpy.XRPY.iter_account_transactions`
+    :type transactions: Iterable[Dict]
+
+    :param file: File opened in binary mode
+    :type file: BinaryIO
+
+    :return: Number of transactions written
+    :rtype: int
+    """
+
+    written = 0
+    for transaction in transactions:
+        file.write(json.dumps(transaction, separators=(',', ':')).encode() + b'\n')
+        written += 1
+
+    return written
+
+
+def _parquet_schema() -> 'pyarrow.Schema':
+    return pyarrow.schema([
+        ('hash', pyarrow.string()),
+        ('ledger_index', pyarrow.int64()),
+        ('date', pyarrow.int64()),
+        ('transaction_type', pyarrow.string()),
+        ('account', pyarrow.string()),
+        ('destination', pyarrow.string()),
+        ('fee', pyarrow.int64()),
+        ('sequence', pyarrow.int64()),
+        ('result', pyarrow.string()),
+        ('validated', pyarrow.bool_()),
+        ('tx_json', pyarrow.string()),
+        ('meta_json', pyarrow.string()),
+    ])
+
+
+def write_parquet(transactions: Iterable[Dict], path: str, row_group_size: int = _ROW_GROUP) -> int:
+    """
+    Write transactions to a Parquet file with the columns of :func:`transaction_row`. Only one row group is held in
+    memory at a time.
+
+    :param transactions: Transactions, e.g. from :meth:`xrpy.XRPY.iter_account_transactions`
+    :type transactions: Iterable[Dict]
+
+    :param path: Output file
+    :type path: str
+
+    :param row_group_size: Transactions per row group
+    :type row_group_size: int
+
+    :raises ImportError: If pyarrow is not installed
+
+    :return: Number of transactions written
+    :rtype: int
+    """
+
+    if pyarrow is None:
+        raise ImportError('Parquet export needs the pyarrow package: pip install xrpy[parquet]')
+
+    schema = _parquet_schema()
+    written = 0
+    rows = []
+
+    def flush() -> None:
+        columns = {name: [row[name] for row in rows] for name in schema.names}
+        writer.write_table(pyarrow.Table.from_pydict(columns, schema=schema))
+        rows.clear()
+
+    with pyarrow.parquet.ParquetWriter(path, schema) as writer:
+        for transaction in transactions:
+            rows.append(transaction_row(transaction))
+            written += 1
+            if len(rows) >= row_group_size:
+                flush()
+
+        if rows or written == 0:
+            flush()
+
+    return written
+
+
+def read_checkpoint(path: str) -> Optional[Dict]:
+    """
+    Read an export checkpoint
+
+    :param path: Checkpoint file
+    :type path: str
+
+    :return: Checkpoint, or None if there is none
+    :rtype: Optional[Dict]
+    """
+
+    if not os.path.exists(path):
+        return None
+
+    with open(path) as file:
+        return json.load(file)
+
+
+def write_checkpoint(path: str, checkpoint: Dict) -> None:
+    """
+    Replace an export checkpoint atomically, so a crash leaves either the old or the new one
+
+    :param path: Checkpoint file
+    :type path: str
+
+    :param checkpoint: JSON-serializable checkpoint
+    :type checkpoint: Dict
+
+    :return: None
+    """
+
+    with open(f'{path}.tmp', 'w') as file:
+        json.dump(checkpoint, file)
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(f'{path}.tmp', path)
@@ -0,0 +1,159 @@
+import math
+import time
+
+from threading import Lock
+
+
+from typing import Optional, Dict
+
+
+from xrpl.utils import xrp_to_drops
+
+
+__all__ = [
+    'FeeOracle',
+    'FEE_POLICIES',
+]
+
+
+# Fee levels a FeeOracle can base its fee on: the drops fields of a ``fee`` response, or a fixed amount.
+FEE_POLICIES = {
+    'open': 'open_ledger_fee',
+    'minimum': 'minimum_fee',
+    'median': 'median_fee',
+    'fixed': None,
+}
+
+# Default highest fee in XRP, same as xrpl-py's get_fee.
+_MAX_FEE = 2
+
+# Seconds a fee stays valid when no newer ledger is reported, about one ledger close.
+_MAX_AGE = 4.0
+
+
+class FeeOracle:
+    """
+    Shared transaction fee, refreshed at most once per ledger.
+
+    The oracle does no network I/O itself. The client asks :meth:`get` for the fee and, when it is stale, requests
+    ``fee`` and hands the result to :meth:`update`. A fee goes stale when a ledger newer than the one it was read in is
+    reported through :meth:`ledger_closed`, or after ``max_age`` seconds.
+
+    The fee is picked by ``policy`` ('open', 'minimum' or 'median' fee of the ``fee`` response, or 'fixed'), scaled by
+    ``percent`` (e.g. 150 pays 1.5 × the open ledger fee to get ahead of the queue) and capped at ``max_fee``.
+    """
+
+    def __init__(self, policy: str = 'open', percent: float = 100, fixed: Optional[int] = None,
+                 max_fee: float = _MAX_FEE, max_age: float = _MAX_AGE):
+        """
+        Shared transaction fee, refreshed at most once per ledger.
+
+        :param policy: 'open', 'minimum', 'median' or 'fixed'
+        :type policy: str
+
+        :param percent: Percentage of the policy fee to pay
+        :type percent: float
+
+        :param fixed: Fee in drops for the 'fixed' policy
+        :type fixed: Optional[int]
+
+        :param max_fee: Highest fee in XRP
+        :type max_fee: float
+
+        :param max_age: Seconds a fee stays valid when no newer ledger is reported
+        :type max_age: float
+
+        :raises ValueError: If the policy is unknown, or 'fixed' without a fixed fee
+        """
+
+        if policy not in FEE_POLICIES:
+            raise ValueError(f'Invalid fee policy: {policy}')
+        if policy == 'fixed' and fixed is None:
+            raise ValueError('The fixed fee policy needs a fixed fee')
+
+        self.policy = policy
+        self.percent = percent
+        self.fixed = fixed
+        self.max_fee = max_fee
+        self.max_age = max_age
+
+        self.refreshes = 0
+
+        self._lock = Lock()
+        self._fee: Optional[str] = None
+        self._ledger_index = 0
+        self._expires_at = 0.0
+
+    @property
+    def needs_network(self) -> bool:
+        return self.policy != 'fixed'
+
+    def _pick(self, drops: Dict[str, str]) -> str:
+        """
+        Apply the policy to the drops of a ``fee`` response
+
+        :param drops: ``drops`` field of a ``fee`` response
+        :type drops: Dict[str, str]
+
+        :return: Fee in drops
+        :rtype: str
+        """
+
+        fee = self.fixed if self.policy == 'fixed' else int(drops[FEE_POLICIES[self.policy]])
+        fee = math.ceil(fee * self.percent / 100)
+
+        return str(min(fee, int(xrp_to_drops(self.max_fee))))
+
+    def get(self) -> Optional[str]:
+        """
+        Current fee
+
+        :return: Fee in drops, or None if it has to be refreshed with :meth:`update`
+        :rtype: Optional[str]
+        """
+
+        if not self.needs_network:
+            return self._pick({})
+
+        with self._lock:
+            if self._fee is None or time.monotonic() >= self._expires_at:
+                return None
+            return self._fee
+
+    def update(self, result: Dict) -> str:
+        """
+        Refresh the fee from a ``fee`` response
+
+        :param result: ``fee`` response result
+        :type result: Dict
+
+        :return: Fee in drops
+        :rtype: str
+        """
+
+        fee = self._pick(result.get('drops', {}))
+
+        with self._lock:
+            self._fee = fee
+            self._ledger_index = result.get('ledger_current_index', 0)
+            self._expires_at = time.monotonic() + self.max_age
+            self.refreshes += 1
+
+        return fee
+
+    def ledger_closed(self, ledger_index: int) -> None:
+        """
+        Report a validated ledger index; the fee goes stale once the ledger it was read in has closed
+
+        :param ledger_index: Validated ledger index
+        :type ledger_index: int
+
+        :return: None
+        """
+
+        with self._lock:
+            if self._fee is not None and ledger_index >= self._ledger_index:
+                self._expires_at = 0.0
+
+    def __repr__(self):
+        return f'FeeOracle(policy={self.policy!r}, percent={self.percent}, fee={self._fee})'
@@ -0,0 +1,290 @@
+import json
+import time
+
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from threading import Lock
+
+
+from typing import Optional, Dict, Tuple, Iterator, Any
+
+
+try:
+    from opentelemetry import trace, metrics
+except ImportError:
+    trace = metrics = None
+
+
+__all__ = [
+    'Instrumentation',
+    'Metrics',
+    'OpenTelemetryInstrumentation',
+    'json_size',
+]
+
+
+# Span durations kept per span name for percentiles.
+_WINDOW = 10_000
+
+
+def json_size(value: Any) -> int:
+    """
+    Size of a value encoded as compact JSON, an estimate of the bytes it takes on the wire
+
+    :param value: JSON-serializable value
+    :type value: Any
+
+    :return: Size in bytes
+    :rtype: int
+    """
+
+    return len(json.dumps(value, separators=(',', ':')).encode())
+
+
+class Instrumentation:
+    """
+    Receives the spans and counters of an :class:`xrpy.XRPY` instance. This base class times spans and drops
+    everything; subclass it and override :meth:`record` and :meth:`count` to export them.
+
+    Spans: ``request`` (one client request, ``method`` attribute), ``request_many``, ``autofill``, ``sign``,
+    ``submit`` (``engine_result`` attribute) and ``wait`` (until a submitted transaction's outcome is known). A span
+    that raised gets an ``error`` attribute with the exception's type.
+
+    Counters: ``requests``, ``cache_hits``, ``coalesced`` (reads that waited for an identical one in flight) and
+    ``errors`` per ``method``, ``request_bytes`` and ``response_bytes`` (compact JSON size), ``retries`` per
+    ``reason``, and ``resubmits`` (signed transactions sent again while waiting for their outcome) per
+    ``transaction_type``.
+    """
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Dict[str, Any]]:
+        """
+        Time a block of work. The yielded attributes can be added to inside the block.
+
+        :param name: Span name
+        :type name: str
+
+        :param attributes: Attributes of the span
+        :type attributes: Any
+
+        :return: Attributes of the span
+        :rtype: Iterator[Dict[str, Any]]
+        """
+
+        start = time.perf_counter()
+        try:
+            yield attributes
+        except BaseException as e:
+            attributes['error'] = type(e).__name__
+            raise
+        finally:
+            self.record(name, time.perf_counter() - start, attributes)
+
+    def record(self, name: str, seconds: float, attributes: Dict[str, Any]) -> None:
+        """
+        Called when a span ends
+
+        :param name: Span name
+        :type name: str
+
+        :param seconds: Duration of the span
+        :type seconds: float
+
+        :param attributes: Attributes of the span
+        :type attributes: Dict[str, Any]
+
+        :return: None
+        """
+
+    def count(self, name: str, value: int = 1, **attributes) -> None:
+        """
+        Add to a counter
+
+        :param name: Counter name
+        :type name: str
+
+        :param value: Amount to add
+        :type value: int
+
+        :param attributes: Attributes of this increment
+        :type attributes: Any
+
+        :return: None
+        """
+
+
+class Metrics(Instrumentation):
+    """
+    Keeps counters and span durations in memory, to read from benchmarks and tests or to export periodically.
+    """
+
+    def __init__(self, window: int = _WINDOW):
+        """
+        Keeps counters and span durations in memory.
+
+        :param window: Durations kept per span name for percentiles
+        :type window: int
+        """
+
+        self.window = window
+
+        self._lock = Lock()
+        self._counters: Dict[Tuple[str, Tuple], int] = defaultdict(int)
+        self._spans: Dict[str, Tuple[int, float]] = defaultdict(lambda: (0, 0.0))
+        self._durations: Dict[str, deque] = {}
+
+    def record(self, name: str, seconds: float, attributes: Dict[str, Any]) -> None:
+        with self._lock:
+            calls, total = self._spans[name]
+            self._spans[name] = (calls + 1, total + seconds)
+            self._durations.setdefault(name, deque(maxlen=self.window)).append(seconds)
+
+    def count(self, name: str, value: int = 1, **attributes) -> None:
+        with self._lock:
+            self._counters[(name, tuple(sorted(attributes.items())))] += value
+
+    def counter(self, name: str, **attributes) -> int:
+        """
+        Total of a counter over the increments that have all the given attributes
+
+        :param name: Counter name
+        :type name: str
+
+        :param attributes: Attributes to match, e.g. ``method='account_info'``
+        :type attributes: Any
+
+        :return: Total
+        :rtype: int
+        """
+
+        wanted = attributes.items()
+        with self._lock:
+            return sum(
+                value for (counter, labels), value in self._counters.items()
+                if counter == name and wanted <= dict(labels).items()
+            )
+
+    def counter_by(self, name: str, attribute: str) -> Dict[Any, int]:
+        """
+        Totals of a counter per value of one attribute, e.g. requests per ``method``
+
+        :param name: Counter name
+        :type name: str
+
+        :param attribute: Attribute to group by
+        :type attribute: str
+
+        :return: Total per attribute value
+        :rtype: Dict[Any, int]
+        """
+
+        totals = defaultdict(int)
+        with self._lock:
+            for (counter, labels), value in self._counters.items():
+                labels = dict(labels)
+                if counter == name and attribute in labels:
+                    totals[labels[attribute]] += value
+
+        return dict(totals)
+
+    def span_stats(self, name: str) -> Optional[Dict[str, float]]:
+        """
+        Statistics of a span: ``count`` and ``total`` seconds over all of them, ``p50``, ``p99`` and ``max`` over the
+        recent window
+
+        :param name: Span name
+        :type name: str
+
+        :return: Statistics, or None if the span never ended
+        :rtype: Optional[Dict[str, float]]
+        """
+
+        with self._lock:
+            if name not in self._durations:
+                return None
+            calls, total = self._spans[name]
+            durations = sorted(self._durations[name])
+
+        return {
+            'count': calls,
+            'total': total,
+            'p50': durations[(len(durations) - 1) // 2],
+            'p99': durations[min(len(durations) - 1, int(len(durations) * 0.99))],
+            'max': durations[-1],
+        }
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        :meth:`span_stats` of every span that ended
+
+        :return: Statistics per span name
+        :rtype: Dict[str, Dict[str, float]]
+        """
+
+        with self._lock:
+            names = list(self._durations)
+
+        return {name: self.span_stats(name) for name in names}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._spans.clear()
+            self._durations.clear()
+
+    def __repr__(self):
+        return f'Metrics(spans={len(self._durations)}, counters={len(self._counters)})'
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """
+    Exports spans as OpenTelemetry spans named ``xrpy.<span>`` and counters as OpenTelemetry counters named
+    ``xrpy.<counter>``. Spans nest, so requests show up under the autofill, submit or wait they belong to.
+
+    Needs the ``opentelemetry-api`` package; the SDK and exporters are configured by the application as usual.
+    """
+
+    def __init__(self, tracer: Optional['trace.Tracer'] = None, meter: Optional['metrics.Meter'] = None):
+        """
+        Exports spans and counters through OpenTelemetry.
+
+        :param tracer: Tracer to start spans with (default: the global tracer provider's ``xrpy`` tracer)
+        :type tracer: Optional[opentelemetry.trace.Tracer]
+
+        :param meter: Meter to create counters with (default: the global meter provider's ``xrpy`` meter)
+        :type meter: Optional[opentelemetry.metrics.Meter]
+
+        :raises ImportError: If opentelemetry-api is not installed
+        """
+
+        if trace is None:
+            raise ImportError(
+                'OpenTelemetryInstrumentation needs the opentelemetry-api package: pip install xrpy[opentelemetry]'
+            )
+
+        self._tracer = tracer or trace.get_tracer('xrpy')
+        self._meter = meter or metrics.get_meter('xrpy')
+
+        self._lock = Lock()
+        self._counters: Dict[str, Any] = {}
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Dict[str, Any]]:
+        with self._tracer.start_as_current_span(f'xrpy.{name}', attributes=attributes) as span:
+            try:
+                yield attributes
+            finally:
+                span.set_attributes(attributes)
+
+    def count(self, name: str, value: int = 1, **attributes) -> None:
+        counter = self._counters.get(name)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.get(name)
+                if counter is None:
+                    counter = self._counters[name] = self._meter.create_counter(f'xrpy.{name}')
+
+        counter.add(value, attributes)
+
+    def __repr__(self):
+        return f'OpenTelemetryInstrumentation(tracer={self._tracer!r})'
@@ -1,113 +1,1931 @@
-from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import copy
+import dataclasses
+import math
+import os
+import sys
+import time
 
+from asyncio import run_coroutine_threadsafe
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import contextmanager, nullcontext
+from contextvars import copy_context
+from itertools import count, islice
+from threading import Lock, Thread
 
-from typing import Union, Optional, Dict, List
 
+from typing import TYPE_CHECKING, Union, Optional, Dict, List, Tuple, Iterable, Iterator, Callable, TypeVar, Any
 
-from xrpl.account import get_account_info as xrpl_get_account_info
 
-from xrpl.clients import JsonRpcClient, WebsocketClient
+
+from xrpl.clients import JsonRpcClient, WebsocketClient, XRPLRequestFailureException
+from xrpl.asyncio.clients.exceptions import XRPLWebsocketException
 from xrpl.wallet import generate_faucet_wallet, Wallet
+from xrpl.core.addresscodec import is_valid_xaddress, xaddress_to_classic_address
+from xrpl.core.binarycodec import decode, encode
+
+
+from xrpl.models.base_model import BaseModel
+from xrpl.models.transactions import Transaction
+from xrpl.models.transactions.types import TransactionType
+from xrpl.utils import drops_to_xrp, xrp_to_drops
+from xrpl.models.amounts import IssuedCurrencyAmount
+from xrpl.models.response import Response, ResponseStatus
+
+from xrpl.models.requests import BookOffers, AccountLines, AccountOffers, AccountInfo, AccountObjects, \
+    AccountObjectType, AccountTx, Ledger, Tx, Fee, ServerState, SubmitOnly, Request
+from xrpl.models.currencies import XRP, IssuedCurrency
+
+from xrpl.transaction import safe_sign_transaction, XRPLReliableSubmissionException
+
+from .cache import ReadCache, request_key
+from .fees import FeeOracle, _MAX_FEE
+from .instrumentation import Instrumentation, json_size
+from .records import TrustLine, Offer
+from .reserves import Reserves
+from .sequence import SequenceManager, RESYNC_RESULTS
+from .tickets import TicketPool, MAX_TICKETS
+from .transactions import xrp_payment, token_payment, trust_set, buy_offer, sell_offer, offer_cancel, account_delete, \
+    ticket_create
+
+
+# Optional features are imported by the methods that use them, so ``from xrpy import XRPY`` does not load them.
+if TYPE_CHECKING:
+    from .orderbook import OrderBook
+    from .pool import ClientPool
+    from .ratelimit import RateLimiter
+    from .validation import ValidationTracker
+
+
+__version__ = '0.2.1'
+
+
+__all__ = [
+    'XRPY',
+    'JsonRpcClient',
+    'WebsocketClient',
+    'ReadCache',
+    'FeeOracle',
+    'TicketPool',
+    'Instrumentation',
+    'XRP',
+    'Wallet',
+]
+
+
+_Model = TypeVar('_Model', bound=BaseModel)
+_Result = TypeVar('_Result')
+
+
+# Seconds between two checks of a submitted transaction's outcome.
+_POLL_INTERVAL = 1
+
+# How many times a transaction is re-signed with a fresh Sequence after tefPAST_SEQ.
+_MAX_RESYNCS = 3
+
+# Ledgers a transaction stays valid for after the latest validated ledger, same as xrpl-py's autofill.
+_LEDGER_OFFSET = 20
+
+# Times a signed blob is submitted in a row after transient failures before its outcome is left to the wait loop.
+_SUBMIT_ATTEMPTS = 3
+
+# Consecutive failed polls tolerated while waiting for a transaction's outcome.
+_MAX_POLL_FAILURES = 10
+
+# rippled errors after which the same request can simply be sent again.
+_TRANSIENT_ERRORS = frozenset({'slowDown', 'tooBusy', 'noNetwork', 'noCurrent', 'noClosed', 'allEndpointsFailed'})
+
+# Connection failures after which the same request can be sent again, along with httpx's TransportError and
+# websockets' ConnectionClosed (see _is_transient). A submit that failed this way may or may not have reached the
+# server.
+_TRANSIENT_EXCEPTIONS = (OSError, TimeoutError, asyncio.TimeoutError, XRPLWebsocketException)
+
+# Transactions signed and submitted together by submit_many before waiting for them.
+_BATCH_SIZE = 200
+
+# Seconds a JSON-RPC request of request_many may take, same as xrpl-py's JsonRpcClient.
+_TIMEOUT = 10.0
+
+# Concurrent requests of the bulk lookups when no max_workers is set.
+_BULK_WORKERS = 32
+
+# Read requests whose responses may be served from a ReadCache.
+_CACHED_METHODS = frozenset({'account_info', 'account_lines', 'account_offers', 'book_offers'})
+
+# Reads pinned to the snapshot ledger inside XRPY.at_ledger, when they ask for the validated or the default ledger.
+_SNAPSHOT_METHODS = frozenset({
+    'account_info', 'account_lines', 'account_offers', 'account_objects', 'account_currencies', 'book_offers',
+    'gateway_balances', 'ledger_entry',
+})
+
+# Reads whose identical concurrent requests share one request to the server.
+_COALESCED_METHODS = frozenset({
+    'account_info', 'account_lines', 'account_offers', 'account_objects', 'account_currencies', 'account_tx',
+    'book_offers', 'gateway_balances', 'ledger', 'ledger_entry', 'tx', 'fee', 'server_info', 'server_state',
+})
+
+# Transactions sent with a Ticket from the ticket pool instead of a Sequence, when a pool is set.
+_TICKET_TYPES = frozenset({TransactionType.PAYMENT, TransactionType.OFFER_CANCEL, TransactionType.TRUST_SET})
+
+
+def _replace(model: _Model, **fields) -> _Model:
+    """
+    Return a copy of a transaction or request with some fields replaced
+
+    :param model: Transaction or request to copy
+    :type model: BaseModel
+
+    :param fields: Fields to set on the copy
+    :type fields: Any
+
+    :return: Copy of the same type
+    :rtype: BaseModel
+    """
+
+    return dataclasses.replace(model, **fields)
+
+
+def _next_page(request: Request, response: Response) -> Optional[Request]:
+    """
+    Request for the page after a response, pinned to the ledger of a validated first page
+
+    A marker is only meaningful against the ledger it was returned for, so once a page was read from a validated
+    ledger the following ones are read from that same ledger instead of whichever one is latest by then.
+
+    :param request: Request the response answers
+    :type request: Request
+
+    :param response: Page response
+    :type response: Response
+
+    :return: Next page request, or None after the last page
+    :rtype: Optional[Request]
+    """
+
+    marker = response.result.get('marker')
+    if marker is None:
+        return None
+
+    if response.result.get('validated') is True and response.result.get('ledger_index') is not None:
+        return _replace(request, marker=marker, ledger_index=response.result['ledger_index'])
+
+    return _replace(request, marker=marker)
+
+
+def _consumes_sequence(engine_result: str) -> bool:
+    """
+    Whether a preliminary engine result means the transaction will use up its Sequence
+
+    :param engine_result: Preliminary result returned by ``submit``
+    :type engine_result: str
+
+    :return: False for local (tel), malformed (tem) and failed (tef) results
+    :rtype: bool
+    """
+
+    return engine_result[:3] not in ('tel', 'tem', 'tef')
+
+
+def _is_transient(error: Exception) -> bool:
+    """
+    Whether a request that raised ``error`` can be sent again as is
+
+    :param error: Exception raised by a request
+    :type error: Exception
+
+    :return: True for connection failures and node-level errors such as ``slowDown`` or ``noCurrent``
+    :rtype: bool
+    """
+
+    from httpx import TransportError
+    from websockets.exceptions import ConnectionClosed
+
+    if isinstance(error, XRPLRequestFailureException):
+        return error.error in _TRANSIENT_ERRORS
+    return isinstance(error, (*_TRANSIENT_EXCEPTIONS, TransportError, ConnectionClosed))
+
+
+def _is_pool(client: Any) -> bool:
+    """
+    Whether a client is a :class:`xrpy.ClientPool`, without loading the pool module when no pool was ever made
+
+    :param client: Client
+    :type client: Any
+
+    :return: True for a ClientPool
+    :rtype: bool
+    """
+
+    pool = sys.modules.get(f'{__package__}.pool')
+    return pool is not None and type(client) is pool.ClientPool
+
+
+def _failure(transaction_hash: str, error: str, error_message: Optional[str]) -> Response:
+    """
+    Error Response standing in for the outcome of a transaction that did not validate
+
+    :param transaction_hash: Transaction hash
+    :type transaction_hash: str
+
+    :param error: Error code, e.g. an engine result
+    :type error: str
+
+    :param error_message: Error message
+    :type error_message: Optional[str]
+
+    :return: Response
+    :rtype: Response
+    """
+
+    return Response(status=ResponseStatus.ERROR, result={
+        'error': error,
+        'error_message': error_message,
+        'hash': transaction_hash,
+    })
+
+
+def _unknown_if_missing(hashes: List[str], submitted: List[Optional[Response]]) -> List[Response]:
+    """
+    ``submit`` responses of a batch that is not waited for, with a ``'submitFailed'`` error Response for every
+    transaction whose outcome is unknown after transient failures
+
+    :param hashes: Transaction hashes
+    :type hashes: List[str]
+
+    :param submitted: Results of :meth:`XRPY._submit_batch`, in the same order
+    :type submitted: List[Optional[Response]]
+
+    :return: One Response per transaction, in the same order
+    :rtype: List[Response]
+    """
+
+    return [
+        _failure(transaction_hash, 'submitFailed', 'Outcome unknown after transient failures')
+        if response is None else response
+        for transaction_hash, response in zip(hashes, submitted)
+    ]
+
+
+def _sell_book(classic_address: str, taker_pays_currency: Union[str, XRP], taker_pays_issuer: str) -> BookOffers:
+    """
+    Build the book_offers request of :meth:`XRPY.order_book_sell`
+
+    :param classic_address: Wallet address
+    :type classic_address: str
+
+    :param taker_pays_currency: Currency
+    :type taker_pays_currency: str
+
+    :param taker_pays_issuer: Issuer
+    :type taker_pays_issuer: str
+
+    :return: BookOffers request
+    :rtype: BookOffers
+    """
+
+    return BookOffers(
+        taker=classic_address,
+        taker_gets=IssuedCurrencyAmount(
+            currency=taker_pays_currency,
+            value='0',
+            issuer=taker_pays_issuer,
+        ),
+        taker_pays=XRP(),
+    )
+
+
+def _buy_book(classic_address: str, taker_pays_currency: Union[str, XRP], taker_pays_issuer: str) -> BookOffers:
+    """
+    Build the book_offers request of :meth:`XRPY.order_book_buy`
+
+    :param classic_address: Wallet address
+    :type classic_address: str
+
+    :param taker_pays_currency: Currency
+    :type taker_pays_currency: str
+
+    :param taker_pays_issuer: Issuer
+    :type taker_pays_issuer: str
+
+    :return: BookOffers request
+    :rtype: BookOffers
+    """
+
+    return BookOffers(
+        taker=classic_address,
+        taker_gets=XRP(),
+        taker_pays=IssuedCurrencyAmount(
+            currency=taker_pays_currency,
+            value='0',
+            issuer=taker_pays_issuer,
+        ),
+    )
+
+
+class XRPY:
+    """
+    XRPY is a wrapper for the XRPL API.
+    """
+
+    def __init__(self, client: Optional[Union[JsonRpcClient, WebsocketClient, 'ClientPool', str, List[str]]] = None,
+                 max_workers: int = None, local_sequences: bool = False, cache: Optional[ReadCache] = None,
+                 fee_oracle: Optional[FeeOracle] = None, ticket_pool: Optional[TicketPool] = None,
+                 validation_tracker: Optional['ValidationTracker'] = None,
+                 instrumentation: Optional[Instrumentation] = None, coalesce: bool = True,
+                 rate_limiter: Optional['RateLimiter'] = None):
+        """
+        XRPY is a wrapper for the XRPL API.
+
+        You can initialize XRPY with a client, or you can initialize it with a url string.
+        A list of urls builds a :class:`ClientPool` that fails over between them.
+
+        :param client: XRPL client
+        :type client: Optional[Union[JsonRpcClient, WebsocketClient, ClientPool, str, List[str]]]
+
+        :param max_workers: Maximum number of workers for the thread pool
+        :type max_workers: int
+
+        :param local_sequences: Hand out Sequence numbers locally instead of asking the server for every transaction
+        :type local_sequences: bool
+
+        :param cache: Serve account_info, account_lines, account_offers and book_offers from this cache
+        :type cache: Optional[ReadCache]
+
+        :param fee_oracle: Take transaction fees from this oracle instead of a ``fee`` request per transaction
+        :type fee_oracle: Optional[FeeOracle]
+
+        :param ticket_pool: Send payments, trust lines and offer cancellations with Tickets from this pool
+        :type ticket_pool: Optional[TicketPool]
+
+        :param validation_tracker: Wait for transactions on this opened tracker's stream instead of polling ``tx``
+        :type validation_tracker: Optional[ValidationTracker]
+
+        :param instrumentation: Report spans and counters of requests, autofill, signing, submits and waits to this
+        :type instrumentation: Optional[Instrumentation]
+
+        :param coalesce: Send identical reads made at the same time (e.g. by several threads) as one request
+        :type coalesce: bool
+
+        :param rate_limiter: Limit the requests sent to the server with this; a ClientPool limits each endpoint
+        :type rate_limiter: Optional[RateLimiter]
+
+        :raises TypeError: If client is not a JsonRpcClient, WebsocketClient or ClientPool
+
+        :return: XRPY
+        """
+
+        if client is None:
+            client = JsonRpcClient('https://xrplcluster.com')
+        elif type(client) is str:
+            client = JsonRpcClient(client)
+        elif type(client) is list:
+            from .pool import ClientPool
+            client = ClientPool(client, rate_limiter=rate_limiter)
+        elif type(client) is JsonRpcClient or type(client) is WebsocketClient or _is_pool(client):
+            client = client
+        else:
+            raise Exception(f'Invalid client type: {type(client)}')
+
+        if _is_pool(client) and rate_limiter is not None:
+            client.rate_limiter = rate_limiter
+
+        self._client = client
+        self.max_workers = max_workers
+
+        self.local_sequences = local_sequences
+        self._sequences = SequenceManager()
+        self._sequence_sync_lock = Lock()
+
+        self._cache = cache
+        self._request_ids = count()
+
+        self._fees = fee_oracle
+        self._fee_lock = Lock()
+
+        self._reserves = Reserves()
+        self._reserve_lock = Lock()
+
+        self._tickets = ticket_pool
+        self._ticket_lock = Lock()
+
+        self._tracker = validation_tracker
+
+        self._instrumentation = instrumentation
+
+        self.coalesce = coalesce
+        self._in_flight: Dict[str, Future] = {}
+        self._in_flight_lock = Lock()
+
+        self._limiter = rate_limiter
+
+        self._snapshot_index: Optional[int] = None
+        self._snapshot: Optional[Dict[str, Future]] = None
+        self._snapshot_lock = Lock()
+
+    def set_max_workers(self, max_workers: int) -> None:
+        """
+        Set the maximum number of workers for the thread pool.
+
+        :param max_workers: Maximum number of workers
+        :type max_workers: int
+
+        :return: None
+        """
+
+        self.max_workers = max_workers
+
+    def set_client(self, client: Union[JsonRpcClient, WebsocketClient, 'ClientPool']) -> None:
+        """
+        Set the client for the XRPY instance.
+
+        :param client: XRPL client
+        :type client: Union[JsonRpcClient, WebsocketClient, ClientPool]
+
+        :return: None
+        """
+
+        self._client = client
+        self._sequences = SequenceManager()
+
+    def set_local_sequences(self, local_sequences: bool) -> None:
+        """
+        Enable or disable local Sequence allocation.
+
+        :param local_sequences: Hand out Sequence numbers locally instead of asking the server for every transaction
+        :type local_sequences: bool
+
+        :return: None
+        """
+
+        self.local_sequences = local_sequences
+
+    def set_cache(self, cache: Optional[ReadCache]) -> None:
+        """
+        Set the read cache, or disable caching with None.
+
+        :param cache: Serve account_info, account_lines, account_offers and book_offers from this cache
+        :type cache: Optional[ReadCache]
+
+        :return: None
+        """
+
+        self._cache = cache
+
+    def set_fee_oracle(self, fee_oracle: Optional[FeeOracle]) -> None:
+        """
+        Set the fee oracle, or go back to a ``fee`` request per transaction with None.
+
+        :param fee_oracle: Take transaction fees from this oracle
+        :type fee_oracle: Optional[FeeOracle]
+
+        :return: None
+        """
+
+        self._fees = fee_oracle
+
+    def set_ticket_pool(self, ticket_pool: Optional[TicketPool]) -> None:
+        """
+        Set the ticket pool, or go back to sending every transaction with a Sequence with None.
+
+        :param ticket_pool: Send payments, trust lines and offer cancellations with Tickets from this pool
+        :type ticket_pool: Optional[TicketPool]
+
+        :return: None
+        """
+
+        self._tickets = ticket_pool
+
+    def set_validation_tracker(self, validation_tracker: Optional['ValidationTracker']) -> None:
+        """
+        Set the validation tracker, or go back to polling ``tx`` with None.
+
+        :param validation_tracker: Wait for transactions on this opened tracker's stream
+        :type validation_tracker: Optional[ValidationTracker]
+
+        :return: None
+        """
+
+        self._tracker = validation_tracker
+
+    def set_instrumentation(self, instrumentation: Optional[Instrumentation]) -> None:
+        """
+        Set the instrumentation, or turn it off with None.
+
+        :param instrumentation: Report spans and counters to this
+        :type instrumentation: Optional[Instrumentation]
+
+        :return: None
+        """
+
+        self._instrumentation = instrumentation
+
+    def set_coalesce(self, coalesce: bool) -> None:
+        """
+        Enable or disable coalescing of identical concurrent reads.
+
+        :param coalesce: Send identical reads made at the same time as one request
+        :type coalesce: bool
+
+        :return: None
+        """
+
+        self.coalesce = coalesce
+
+    def set_rate_limiter(self, rate_limiter: Optional['RateLimiter']) -> None:
+        """
+        Set the rate limiter, or send requests as fast as they come with None.
+
+        :param rate_limiter: Limit the requests sent to the server with this; a ClientPool limits each endpoint
+        :type rate_limiter: Optional[RateLimiter]
+
+        :return: None
+        """
+
+        if _is_pool(self._client):
+            self._client.rate_limiter = rate_limiter
+        self._limiter = rate_limiter
+
+    @property
+    def _limited(self) -> bool:
+        # A ClientPool waits for its own endpoints' tokens.
+        return self._limiter is not None and not _is_pool(self._client)
+
+    def _span(self, name: str, **attributes):
+        """
+        Open a span on the instrumentation, or a no-op context without one
+
+        :param name: Span name
+        :type name: str
+
+        :param attributes: Attributes of the span
+        :type attributes: Any
+
+        :return: Context manager yielding the span's attributes
+        """
+
+        if self._instrumentation is None:
+            return nullcontext(attributes)
+        return self._instrumentation.span(name, **attributes)
+
+    def _count(self, name: str, value: int = 1, **attributes) -> None:
+        if self._instrumentation is not None:
+            self._instrumentation.count(name, value, **attributes)
+
+    def _count_request(self, request: Request, response: Response) -> None:
+        """
+        Count a request sent to the server, its size and the size of its response
+
+        :param request: Request
+        :type request: Request
+
+        :param response: Its response
+        :type response: Response
+
+        :return: None
+        """
+
+        if self._instrumentation is None:
+            return
+
+        method = request.method.value
+        self._instrumentation.count('requests', method=method)
+        self._instrumentation.count('request_bytes', json_size(request.to_dict()), method=method)
+        self._instrumentation.count('response_bytes', json_size(response.result), method=method)
+        if not response.is_successful():
+            self._instrumentation.count('errors', method=method, error=str(response.result.get('error')))
+
+    def _request(self, request: Request) -> Response:
+        """
+        Send a request through the client, answering cacheable reads from the read cache when one is set.
+
+        Only successful responses are cached. Every validated ledger index seen in a response is reported to the
+        cache, so entries never outlive the ledger they were read from. Inside :meth:`at_ledger`, reads are pinned to
+        the snapshot ledger and sent once per snapshot; reads of the current ledger are sent every time. Other
+        identical reads in flight at the same time are coalesced into one request unless coalescing is turned off.
+
+        :param request: Request to send
+        :type request: Request
+
+        :return: Response
+        :rtype: Response
+        """
+
+        request = self._pinned(request)
+        if self._in_snapshot(request):
+            return self._single_flight(request, self._snapshot, self._snapshot_lock, keep=True)
+        if self.coalesce and request.method in _COALESCED_METHODS:
+            return self._single_flight(request, self._in_flight, self._in_flight_lock, keep=False)
+
+        return self._send(request)
+
+    def _send(self, request: Request) -> Response:
+        """
+        Send a request through the client, or answer it from the read cache
+
+        :param request: Request to send
+        :type request: Request
+
+        :return: Response
+        :rtype: Response
+        """
+
+        cached = self._cached(request)
+        if cached is not None:
+            return cached
+
+        # Throttled reads are sent again once the rate limiter's backoff is over.
+        retries = self._limiter.max_retries if self._limited and request.method in _COALESCED_METHODS else 0
+
+        for attempt in range(retries + 1):
+            if self._limited:
+                self._limiter.acquire(self._client.url)
+
+            with self._span('request', method=request.method.value):
+                try:
+                    response = self._client.request(self._with_id(request))
+                except Exception:
+                    if self._limited:
+                        self._limiter.report(self._client.url, None)
+                    raise
+            self._count_request(request, response)
+
+            if not self._limited or not self._limiter.report(self._client.url, response) or attempt == retries:
+                break
+            self._count('retries', reason=response.result.get('error'), method=request.method.value)
+
+        self._store(request, response)
+
+        return response
+
+    def _single_flight(self, request: Request, futures: Dict[str, Future], lock: Lock, keep: bool) -> Response:
+        """
+        Send a request once for every caller asking for it at the same time: the first caller sends it and the others
+        wait for its Future and get the same Response. With ``keep``, successful responses stay in ``futures`` and
+        answer later callers too (snapshot reads); otherwise the Future is dropped once the response arrives. Failed
+        responses are never kept, so they can be retried.
+
+        :param request: Request to send
+        :type request: Request
+
+        :param futures: Futures of the requests in flight (and kept), by request key
+        :type futures: Dict[str, Future]
+
+        :param lock: Lock guarding ``futures``
+        :type lock: Lock
+
+        :param keep: Keep successful responses after they arrive
+        :type keep: bool
+
+        :return: Response
+        :rtype: Response
+        """
+
+        key = request_key(request)
+        with lock:
+            future = futures.get(key)
+            sender = future is None
+            if sender:
+                future = futures[key] = Future()
+
+        if not sender:
+            self._count('cache_hits' if future.done() else 'coalesced', method=request.method.value)
+            return future.result()
+
+        try:
+            response = self._send(request)
+        except BaseException as e:
+            with lock:
+                futures.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        if not keep or not response.is_successful():
+            with lock:
+                futures.pop(key, None)
+        future.set_result(response)
+
+        return response
+
+    def _pinned(self, request: Request) -> Request:
+        """
+        Pin a read to the snapshot ledger inside :meth:`at_ledger`. Reads of an explicit ledger index or of the
+        current ledger are left alone.
+
+        :param request: Request
+        :type request: Request
+
+        :return: The request, or a copy of it reading the snapshot ledger
+        :rtype: Request
+        """
+
+        if self._snapshot_index is None or request.method not in _SNAPSHOT_METHODS:
+            return request
+        if getattr(request, 'ledger_hash', None) is not None or request.ledger_index not in (None, 'validated'):
+            return request
+        return _replace(request, ledger_index=self._snapshot_index)
+
+    def _in_snapshot(self, request: Request) -> bool:
+        """
+        Whether a read belongs to the snapshot of :meth:`at_ledger`: only reads of the snapshot ledger are kept for the
+        life of the snapshot. Reads of the current or closed ledger, like the Sequence of an account about to submit,
+        go through the normal path.
+
+        :param request: Request, after :meth:`_pinned`
+        :type request: Request
+
+        :return: True if the request is answered from and kept in the snapshot
+        :rtype: bool
+        """
+
+        return self._snapshot is not None and request.method in _SNAPSHOT_METHODS and \
+            getattr(request, 'ledger_index', None) == self._snapshot_index
+
+    @property
+    def ledger_index(self) -> Optional[int]:
+        """
+        Ledger index reads are pinned to inside :meth:`at_ledger`, None outside of it
+        """
+
+        return self._snapshot_index
+
+    @contextmanager
+    def at_ledger(self, ledger_index: Union[str, int] = 'validated') -> Iterator['XRPY']:
+        """
+        Read from one validated ledger.
+
+        Yields a copy of this instance sharing its client, caches and settings, whose reads of the validated or the
+        default (current) ledger (account_info, account_lines, account_offers, account_objects, book_offers, ...) all
+        read ``ledger_index`` instead, so methods that combine several requests, like :meth:`get_balance` or
+        :meth:`get_reserved_balance`, see one consistent ledger. A validated ledger never changes, so the copy keeps
+        every successful read until the block exits, and identical reads in flight on several threads are sent once.
+
+        Transactions can still be sent through the copy, but its reads will not see their effects.
+
+        :param ledger_index: A validated ledger index, or 'validated' for the latest one
+        :type ledger_index: Union[str, int]
+
+        :raises ValueError: If ledger_index is another shortcut, like 'current' or 'closed'
+        :raises XRPLRequestFailureException: If the latest validated ledger can't be read
+
+        :return: Snapshot XRPY
+        :rtype: Iterator[XRPY]
+        """
+
+        if type(ledger_index) is not int and ledger_index != 'validated':
+            raise ValueError(f'A snapshot needs a validated ledger, not {ledger_index!r}')
+
+        snapshot = copy.copy(self)
+        snapshot._snapshot_index = self._pin_ledger_index(ledger_index)
+        snapshot._snapshot = {}
+        snapshot._snapshot_lock = Lock()
+
+        try:
+            yield snapshot
+        finally:
+            snapshot._snapshot.clear()
+
+    def request_many(self, requests: List[Request]) -> List[Response]:
+        """
+        Send independent requests concurrently and return their responses in the same order.
+
+        With a WebsocketClient every request is written to the one socket without waiting for the previous response,
+        and responses are matched back by request id, so the batch takes about one round trip. Other clients send the
+        requests concurrently from the same event loop, a JsonRpcClient over one keep-alive HTTP session. Cacheable
+        reads are answered from the read cache when possible.
+
+        :param requests: Requests to send
+        :type requests: List[Request]
+
+        :return: One Response per request, in the same order
+        :rtype: List[Response]
+        """
+
+        requests = [self._pinned(request) for request in requests]
+        responses = [self._cached(request) for request in requests]
+        missing = [i for i, response in enumerate(responses) if response is None]
+        if not missing:
+            return responses
+
+        if self._limited:
+            for _ in missing:
+                self._limiter.acquire(self._client.url)
+
+        with self._span('request_many', requests=len(missing)):
+            fetched = self._fetch_many([requests[i] for i in missing])
+
+        for i, response in zip(missing, fetched):
+            if self._limited:
+                self._limiter.report(self._client.url, response)
+            self._count_request(requests[i], response)
+            self._store(requests[i], response)
+            responses[i] = response
+
+        return responses
+
+    def _fetch_many(self, requests: List[Request]) -> List[Response]:
+        """
+        Send requests concurrently through the client, bypassing the read cache
+
+        :param requests: Requests to send
+        :type requests: List[Request]
+
+        :return: One Response per request, in the same order
+        :rtype: List[Response]
+        """
+
+        if type(self._client) is WebsocketClient:
+            # WebsocketClient._request_impl blocks on its own loop thread, so schedule every request there directly.
+            futures = [
+                run_coroutine_threadsafe(self._client._do_request_impl(self._with_id(request)), self._client._loop)
+                for request in requests
+            ]
+            return [future.result() for future in futures]
+
+        if type(self._client) is JsonRpcClient:
+            from httpx import AsyncClient
+            from .pool import post_json_rpc
+
+            async def gather() -> List[Response]:
+                async with AsyncClient(timeout=_TIMEOUT) as http_client:
+                    return await asyncio.gather(*(
+                        post_json_rpc(http_client, self._client.url, self._with_id(request)) for request in requests
+                    ))
+        else:
+            async def gather() -> List[Response]:
+                return await asyncio.gather(*(
+                    self._client._request_impl(self._with_id(request)) for request in requests
+                ))
+
+        return asyncio.run(gather())
+
+    def _with_id(self, request: Request) -> Request:
+        """
+        Give a request a unique id, so concurrent requests on one WebSocket can't collide
+
+        :param request: Request
+        :type request: Request
+
+        :return: The request, or a copy of it with an id
+        :rtype: Request
+        """
+
+        if request.id is not None:
+            return request
+        return _replace(request, id=f'xrpy_{next(self._request_ids)}')
+
+    def _cached(self, request: Request) -> Optional[Response]:
+        """
+        Look up a cacheable read in the read cache
+
+        :param request: Request
+        :type request: Request
+
+        :return: Cached response, or None
+        :rtype: Optional[Response]
+        """
+
+        if self._in_snapshot(request):
+            future = self._snapshot.get(request_key(request))
+            if future is not None and future.done() and future.exception() is None:
+                self._count('cache_hits', method=request.method.value)
+                return future.result()
+
+        if self._cache is None or request.method not in _CACHED_METHODS:
+            return None
+
+        response = self._cache.get(request_key(request))
+        if response is not None:
+            self._count('cache_hits', method=request.method.value)
+        return response
+
+    def _store(self, request: Request, response: Response) -> None:
+        """
+        Report a response to the read cache: successful cacheable reads are stored and validated ledger indexes
+        clear stale entries
+
+        :param request: Request
+        :type request: Request
+
+        :param response: Its response
+        :type response: Response
+
+        :return: None
+        """
+
+        if not response.is_successful():
+            return
+
+        if response.result.get('validated') and 'ledger_index' in response.result:
+            if self._cache is not None:
+                self._cache.ledger_closed(response.result['ledger_index'])
+            if self._fees is not None:
+                self._fees.ledger_closed(response.result['ledger_index'])
+
+        if self._cache is not None and request.method in _CACHED_METHODS:
+            self._cache.put(request_key(request), response, getattr(request, 'account', None))
+
+        if self._in_snapshot(request):
+            stored = Future()
+            stored.set_result(response)
+            with self._snapshot_lock:
+                self._snapshot.setdefault(request_key(request), stored)
+
+    def _discard_cached(self, transaction: Transaction) -> None:
+        """
+        Drop cached reads of the accounts a submitted transaction touches
+
+        :param transaction: Submitted transaction
+        :type transaction: Transaction
+
+        :return: None
+        """
+
+        if self._cache is None:
+            return
+
+        self._cache.discard_account(transaction.account)
+        if getattr(transaction, 'destination', None) is not None:
+            self._cache.discard_account(transaction.destination)
+
+    def _fee(self) -> str:
+        """
+        Transaction fee in drops: from the fee oracle, refreshed when stale, or a ``fee`` request without one
+
+        :raises XRPLRequestFailureException: If the fee request fails
+
+        :return: Fee in drops
+        :rtype: str
+        """
+
+        if self._fees is None:
+            response = self._request(Fee())
+            if not response.is_successful():
+                raise XRPLRequestFailureException(response.result)
+            # Open ledger fee capped at 2 XRP, same as xrpl-py's get_fee.
+            return str(min(int(response.result['drops']['open_ledger_fee']), int(xrp_to_drops(_MAX_FEE))))
+
+        fee = self._fees.get()
+        if fee is not None:
+            return fee
+
+        with self._fee_lock:
+            fee = self._fees.get()
+            if fee is None:
+                response = self._request(Fee())
+                if not response.is_successful():
+                    raise XRPLRequestFailureException(response.result)
+                fee = self._fees.update(response.result)
+
+        return fee
+
+    def _transaction_fee(self, transaction: Transaction) -> str:
+        """
+        Fee in drops of a transaction, with xrpl-py's special costs: AccountDelete pays the owner reserve, and
+        EscrowFinish pays for the size of its fulfillment
+
+        :param transaction: Unsigned transaction
+        :type transaction: Transaction
+
+        :raises XRPLRequestFailureException: If the fee or server_state request fails
+
+        :return: Fee in drops
+        :rtype: str
+        """
+
+        if transaction.transaction_type == TransactionType.ACCOUNT_DELETE:
+            return str(self.get_reserves()[1])
+
+        fee = self._fee()
+        if transaction.transaction_type == TransactionType.ESCROW_FINISH and transaction.fulfillment is not None:
+            return str(math.ceil(int(fee) * (33 + len(transaction.fulfillment.encode('ascii')) / 16)))
+        return fee
+
+    def _account_sequence(self, address: str) -> int:
+        """
+        Next Sequence of an account, from ``account_info`` on the current ledger
+
+        :param address: Wallet address
+        :type address: str
+
+        :raises XRPLRequestFailureException: If the account info request fails
+
+        :return: Sequence
+        :rtype: int
+        """
+
+        response = self._request(AccountInfo(account=address, ledger_index='current'))
+        if not response.is_successful():
+            raise XRPLRequestFailureException(response.result)
+
+        return response.result['account_data']['Sequence']
+
+    def _autofill(self, transaction: Transaction) -> Transaction:
+        """
+        Fill in the Sequence, fee and LastLedgerSequence of a transaction, like xrpl-py's ``autofill`` but through
+        :meth:`_request`, so the requests are rate limited, coalesced, cached and counted like every other one.
+        Fields already set are left alone.
+
+        :param transaction: Unsigned transaction
+        :type transaction: Transaction
+
+        :raises XRPLRequestFailureException: If a request fails
+
+        :return: The transaction, or a copy of it with the missing fields
+        :rtype: Transaction
+        """
+
+        fields = {}
+        if transaction.sequence is None:
+            account = transaction.account
+            if is_valid_xaddress(account):
+                account = xaddress_to_classic_address(account)[0]
+            fields['sequence'] = self._account_sequence(account)
+        if transaction.fee is None:
+            fields['fee'] = self._transaction_fee(transaction)
+        if transaction.last_ledger_sequence is None:
+            fields['last_ledger_sequence'] = self._latest_validated_ledger_sequence() + _LEDGER_OFFSET
+
+        return _replace(transaction, **fields) if fields else transaction
+
+    def _next_sequence(self, address: str, count: int = 1) -> int:
+        """
+        Reserve consecutive Sequence numbers for an account, reading ``account_info`` only when not synced yet
+
+        :param address: Wallet address
+        :type address: str
+
+        :param count: How many numbers to reserve
+        :type count: int
+
+        :raises XRPLRequestFailureException: If the account info request fails
+
+        :return: First reserved Sequence
+        :rtype: int
+        """
+
+        sequence = self._sequences.allocate(address, count)
+        if sequence is not None:
+            return sequence
+
+        with self._sequence_sync_lock:
+            sequence = self._sequences.allocate(address, count)
+            if sequence is None:
+                self._sequences.sync(address, self._account_sequence(address))
+                sequence = self._sequences.allocate(address, count)
+
+        return sequence
+
+    def _latest_validated_ledger_sequence(self) -> int:
+        """
+        Get the index of the latest validated ledger
+
+        :raises XRPLRequestFailureException: If the ledger request fails
+
+        :return: Ledger index
+        :rtype: int
+        """
+
+        response = self._request(Ledger(ledger_index='validated'))
+        if not response.is_successful():
+            raise XRPLRequestFailureException(response.result)
+
+        return response.result['ledger_index']
+
+    def _wait_for_outcome(
+            self, transaction_hash: str, last_ledger_sequence: int, prelim_result: str,
+            resubmit: Optional[Transaction] = None
+    ) -> Response:
+        """
+        Wait until a submitted transaction is in a validated ledger or can no longer be included in one
+
+        ``resubmit`` (the signed transaction) is submitted again, as the same blob, whenever a new ledger validates
+        (or, with a validation tracker, closes) without it, and right away if the first submit's outcome is unknown.
+        The same blob can only apply once, so this is always safe. Polls that fail transiently are retried; the
+        transaction is only reported expired once a validated ledger at or past its LastLedgerSequence does not
+        contain it.
+
+        :param transaction_hash: Hash of the submitted transaction
+        :type transaction_hash: str
+
+        :param last_ledger_sequence: LastLedgerSequence of the submitted transaction
+        :type last_ledger_sequence: int
+
+        :param prelim_result: Preliminary result returned by ``submit``, empty if it is unknown
+        :type prelim_result: str
+
+        :param resubmit: Signed transaction to submit again while waiting
+        :type resubmit: Optional[Transaction]
+
+        :raises XRPLReliableSubmissionException: If the transaction failed or expired
+        :raises XRPLRequestFailureException: If a request fails
+
+        :return: Validated transaction
+        :rtype: Response
+        """
+
+        with self._span('wait'):
+            if self._tracker is not None:
+                future = self._tracker.track(transaction_hash, last_ledger_sequence)
+
+                # The stream reports the outcome, or expiry once LastLedgerSequence has passed; meanwhile the blob is
+                # submitted again for every ledger that closes without it.
+                submitted_at = None if prelim_result else 0
+                while resubmit is not None and not wait([future], _POLL_INTERVAL).done:
+                    ledger_index = self._tracker.ledger_index
+                    if ledger_index is None:
+                        continue
+                    if submitted_at is not None and ledger_index > submitted_at:
+                        self._count('resubmits', transaction_type=resubmit.transaction_type.value)
+                        self._try_submit(resubmit)
+                    submitted_at = ledger_index
+
+                response = future.result()
+                if not response.is_successful():
+                    raise XRPLReliableSubmissionException(
+                        f'{response.result["error_message"]} in the transaction. Prelim result: {prelim_result}'
+                    )
+
+                return_code = response.result['meta']['TransactionResult']
+                if return_code != 'tesSUCCESS':
+                    raise XRPLReliableSubmissionException(f'Transaction failed: {return_code}')
+                return response
+
+            # Validated ledger the blob was last submitted in; unknown (0) makes the first poll submit it again.
+            submitted_at = None if prelim_result else 0
+            failures = 0
+
+            while True:
+                time.sleep(_POLL_INTERVAL)
+
+                try:
+                    latest_ledger_sequence = self._latest_validated_ledger_sequence()
+
+                    response = self._request(Tx(transaction=transaction_hash))
+                    if not response.is_successful() and response.result.get('error') != 'txnNotFound':
+                        raise XRPLRequestFailureException(response.result)
+                except Exception as e:
+                    failures += 1
+                    if not _is_transient(e) or failures > _MAX_POLL_FAILURES:
+                        raise
+                    continue
+                failures = 0
+
+                if response.is_successful() and response.result.get('validated'):
+                    return_code = response.result['meta']['TransactionResult']
+                    if return_code != 'tesSUCCESS':
+                        raise XRPLReliableSubmissionException(f'Transaction failed: {return_code}')
+                    return response
+
+                if latest_ledger_sequence >= last_ledger_sequence:
+                    raise XRPLReliableSubmissionException(
+                        f'The latest validated ledger sequence {latest_ledger_sequence} is greater than '
+                        f'LastLedgerSequence {last_ledger_sequence} in the transaction. Prelim result: {prelim_result}'
+                    )
+
+                if resubmit is not None:
+                    if submitted_at is not None and latest_ledger_sequence > submitted_at:
+                        self._count('resubmits', transaction_type=resubmit.transaction_type.value)
+                        self._try_submit(resubmit)
+                    submitted_at = latest_ledger_sequence
+
+    def _prepare_batch(
+            self, transactions: List[Transaction], from_wallet: Wallet, max_workers: int = None
+    ) -> List[Transaction]:
+        """
+        Give transactions consecutive Sequence numbers, fill in the fee and LastLedgerSequence once, and sign them.
+        Any Sequence already set on the transactions is replaced.
+
+        :param transactions: Unsigned transactions, in the order they must apply
+        :type transactions: List[Transaction]
+
+        :param from_wallet: Wallet to sign the transactions with
+        :type from_wallet: Wallet
+
+        :param max_workers: max number of signing threads
+        :type max_workers: int
+
+        :return: Signed transactions
+        :rtype: List[Transaction]
+        """
+
+        if not transactions:
+            return []
+
+        first_sequence = self._next_sequence(from_wallet.classic_address, len(transactions))
+        fee = self._fee()
+        last_ledger_sequence = self._latest_validated_ledger_sequence() + _LEDGER_OFFSET
 
-from xrpl.utils import xrp_to_drops
+        prepared = [
+            _replace(transaction, sequence=first_sequence + i, fee=fee, last_ledger_sequence=last_ledger_sequence)
+            for i, transaction in enumerate(transactions)
+        ]
 
-from xrpl.models.transactions import Payment, TrustSet, TrustSetFlag, OfferCreate, OfferCancel, OfferCreateFlag, \
-    Transaction, AccountDelete
-from xrpl.models.amounts import IssuedCurrencyAmount
-from xrpl.models.response import Response
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as thread_pool:
+            with self._span('sign', transactions=len(prepared)):
+                return list(thread_pool.map(lambda transaction: safe_sign_transaction(transaction, from_wallet, False),
+                                            prepared))
 
-from xrpl.models.requests import BookOffers, AccountLines, AccountOffers
-from xrpl.models.currencies import XRP
+    def _wait_for_outcomes(
+            self, account: str, hashes: List[str], last_ledger_sequence: int, submitted: List[Optional[Response]],
+            first_ledger: int = None
+    ) -> List[Response]:
+        """
+        Wait for a burst of submitted transactions with a single watcher.
 
-from xrpl.transaction import safe_sign_and_autofill_transaction, send_reliable_submission
+        Every validated ledger is fetched once and its transaction hashes are matched against the pending set, instead
+        of polling ``tx`` for every transaction. With a validation tracker set, the tracker's stream is used instead.
 
+        Transactions rejected at submit time, or not validated before their LastLedgerSequence, get an error Response
+        whose ``error`` is the preliminary engine result or ``'expired'``. Polls that fail transiently are retried; if
+        polling keeps failing, the transactions still pending get an ``'unknown'`` error Response instead.
 
-__version__ = '0.2.1'
+        :param account: Account that sent the transactions
+        :type account: str
 
+        :param hashes: Hashes of the submitted transactions
+        :type hashes: List[str]
 
-__all__ = [
-    'XRPY',
-    'JsonRpcClient',
-    'WebsocketClient',
-    'XRP',
-    'Wallet',
-]
+        :param last_ledger_sequence: LastLedgerSequence shared by the transactions
+        :type last_ledger_sequence: int
 
+        :param submitted: ``submit`` responses, in the same order. None for a transaction whose submit failed
+            transiently and may still apply, an error Response for one that was not submitted.
+        :type submitted: List[Optional[Response]]
 
-class XRPY:
-    """
-    XRPY is a wrapper for the XRPL API.
-    """
+        :param first_ledger: First ledger the transactions can be in (default: counted back from LastLedgerSequence)
+        :type first_ledger: int
 
-    def __init__(self, client: Optional[Union[JsonRpcClient, WebsocketClient, str]] = None, max_workers: int = None):
+        :return: One Response per transaction, in the same order
+        :rtype: List[Response]
         """
-        XRPY is a wrapper for the XRPL API.
 
-        You can initialize XRPY with a client, or you can initialize it with a url string.
+        with self._span('wait', transactions=len(hashes)):
+            outcomes: Dict[str, Response] = {}
+            pending: Dict[str, int] = {}
+
+            for transaction_hash, response in zip(hashes, submitted):
+                if response is None:
+                    self._sequences.invalidate(account)
+                    pending[transaction_hash] = last_ledger_sequence
+                    continue
+                if not response.is_successful():
+                    self._sequences.invalidate(account)
+                    outcomes[transaction_hash] = response
+                    continue
+
+                engine_result = response.result.get('engine_result', '')
+                if _consumes_sequence(engine_result):
+                    pending[transaction_hash] = last_ledger_sequence
+                else:
+                    self._sequences.invalidate(account)
+                    outcomes[transaction_hash] = _failure(
+                        transaction_hash, engine_result, response.result.get('engine_result_message')
+                    )
+
+            if self._tracker is not None:
+                tracked = [
+                    (transaction_hash, self._tracker.track(transaction_hash, last_ledger_sequence))
+                    for transaction_hash, last_ledger_sequence in pending.items()
+                ]
+                outcomes.update((transaction_hash, future.result()) for transaction_hash, future in tracked)
+                return [outcomes[transaction_hash] for transaction_hash in hashes]
+
+            # Every transaction was signed after the ledger its LastLedgerSequence was counted from.
+            next_ledger = first_ledger if first_ledger is not None else last_ledger_sequence - _LEDGER_OFFSET + 1
+
+            failures = 0
+
+            while pending:
+                time.sleep(_POLL_INTERVAL)
+
+                # Nothing is recorded until every request of the poll succeeded, so a failed poll is repeated from the
+                # same ledger.
+                try:
+                    latest_ledger_sequence = self._latest_validated_ledger_sequence()
+
+                    ledgers = self.request_many([
+                        Ledger(ledger_index=ledger_index, transactions=True)
+                        for ledger_index in range(next_ledger, latest_ledger_sequence + 1)
+                    ])
+
+                    validated = []
+                    for ledger in ledgers:
+                        if not ledger.is_successful():
+                            raise XRPLRequestFailureException(ledger.result)
+                        validated.extend(
+                            transaction_hash for transaction_hash in ledger.result['ledger'].get('transactions', [])
+                            if transaction_hash in pending
+                        )
+
+                    transactions = self.request_many([
+                        Tx(transaction=transaction_hash) for transaction_hash in validated
+                    ])
+                    for transaction in transactions:
+                        if not transaction.is_successful():
+                            raise XRPLRequestFailureException(transaction.result)
+                except Exception as e:
+                    failures += 1
+                    if _is_transient(e) and failures <= _MAX_POLL_FAILURES:
+                        continue
+                    # The whole batch was submitted: report what is known rather than drop every outcome.
+                    for transaction_hash, last_ledger_sequence in pending.items():
+                        outcomes[transaction_hash] = _failure(
+                            transaction_hash, 'unknown',
+                            f'Waiting failed ({e}); the transaction may still apply until ledger {last_ledger_sequence}'
+                        )
+                    break
+                failures = 0
+
+                for transaction_hash in validated:
+                    del pending[transaction_hash]
+                outcomes.update(zip(validated, transactions))
+
+                next_ledger = latest_ledger_sequence + 1
+
+                for transaction_hash, last_ledger_sequence in list(pending.items()):
+                    if latest_ledger_sequence >= last_ledger_sequence:
+                        del pending[transaction_hash]
+                        outcomes[transaction_hash] = _failure(
+                            transaction_hash, 'expired',
+                            f'Not validated before LastLedgerSequence {last_ledger_sequence}'
+                        )
+
+            return [outcomes[transaction_hash] for transaction_hash in hashes]
+
+    def _watch(self, address: str) -> None:
+        """
+        Have the validation tracker, if one is set, follow an account before it submits anything
 
-        :param client: XRPL client
-        :type client: Optional[Union[JsonRpcClient, WebsocketClient, str]]
+        :param address: Wallet address
+        :type address: str
 
-        :raises TypeError: If client is not a JsonRpcClient or WebsocketClient
+        :return: None
+        """
 
-        :return: XRPY
+        if self._tracker is not None:
+            self._tracker.watch(address)
+
+    def _autofill_and_sign(self, transaction: Transaction, from_wallet: Wallet) -> Transaction:
         """
+        Autofill and sign a transaction as two separately timed steps
 
-        if client is None:
-            client = JsonRpcClient('https://xrplcluster.com')
-        elif type(client) is str:
-            client = JsonRpcClient(client)
-        elif type(client) is JsonRpcClient or type(client) is WebsocketClient:
-            client = client
+        Same as xrpl-py's ``safe_sign_and_autofill_transaction``, except that the autofill requests go through
+        :meth:`_autofill` and a fee set beforehand is checked offline when signing instead of against a ``fee`` request.
+
+        :param transaction: Unsigned transaction
+        :type transaction: Transaction
+
+        :param from_wallet: Wallet to sign the transaction with
+        :type from_wallet: Wallet
+
+        :return: Signed transaction
+        :rtype: Transaction
+        """
+
+        transaction_type = transaction.transaction_type.value
+        with self._span('autofill', transaction_type=transaction_type):
+            autofilled = self._autofill(transaction)
+
+        with self._span('sign', transaction_type=transaction_type):
+            return safe_sign_transaction(
+                autofilled, from_wallet, check_fee=self._fees is None and transaction.fee is not None
+            )
+
+    def _submit(self, transaction: Union[Transaction, str]) -> Response:
+        """
+        Submit a signed transaction
+
+        :param transaction: Signed transaction, or its blob
+        :type transaction: Union[Transaction, str]
+
+        :raises XRPLRequestFailureException: If the submit request fails
+
+        :return: ``submit`` Response
+        :rtype: Response
+        """
+
+        if isinstance(transaction, str):
+            blob, transaction_type = transaction, decode(transaction)['TransactionType']
         else:
-            raise Exception(f'Invalid client type: {type(client)}')
+            blob, transaction_type = encode(transaction.to_xrpl()), transaction.transaction_type.value
 
-        self._client = client
-        self.max_workers = max_workers
+        with self._span('submit', transaction_type=transaction_type) as span:
+            response = self._request(SubmitOnly(tx_blob=blob))
+            if not response.is_successful():
+                raise XRPLRequestFailureException(response.result)
+            span['engine_result'] = response.result.get('engine_result', '')
 
-    def set_max_workers(self, max_workers: int) -> None:
+        return response
+
+    def _try_submit(self, transaction: Union[Transaction, str], attempts: int = 1) -> Optional[Response]:
         """
-        Set the maximum number of workers for the thread pool.
+        Submit a signed transaction, sending the same blob again up to ``attempts`` times after transient failures
 
-        :param max_workers: Maximum number of workers
-        :type max_workers: int
+        :param transaction: Signed transaction, or its blob
+        :type transaction: Union[Transaction, str]
 
-        :return: None
+        :param attempts: Submits before giving up
+        :type attempts: int
+
+        :raises XRPLRequestFailureException: If the first submit request fails for another reason
+
+        :return: ``submit`` Response, or None if every attempt failed transiently and the outcome is unknown
+        :rtype: Optional[Response]
         """
 
-        self.max_workers = max_workers
+        for attempt in range(attempts):
+            if attempt:
+                time.sleep(_POLL_INTERVAL)
+            try:
+                response = self._submit(transaction)
+            except Exception as e:
+                if not _is_transient(e):
+                    # An earlier attempt that failed transiently may still have applied.
+                    if attempt:
+                        return None
+                    raise
+                self._count('retries', reason=getattr(e, 'error', type(e).__name__))
+                continue
+
+            # tefPAST_SEQ or tefALREADY after a failed attempt may mean that attempt applied.
+            if attempt and response.result.get('engine_result', '')[:3] == 'tef':
+                return None
+            return response
 
-    def set_client(self, client: Union[JsonRpcClient, WebsocketClient]) -> None:
+        return None
+
+    def _outcome(self, transaction: Transaction, response: Optional[Response], wait_for_validation: bool) -> Response:
         """
-        Set the client for the XRPY instance.
+        Finish sending a signed transaction: return its ``submit`` response, or wait for its validated outcome while
+        resubmitting the same blob (see :meth:`_wait_for_outcome`)
 
-        :param client: XRPL client
-        :type client: Union[JsonRpcClient, WebsocketClient]
+        :param transaction: Signed transaction
+        :type transaction: Transaction
 
-        :return: None
+        :param response: ``submit`` Response, or None if the outcome of submitting it is unknown
+        :type response: Optional[Response]
+
+        :param wait_for_validation: If False, return the ``submit`` response without waiting for a validated ledger
+        :type wait_for_validation: bool
+
+        :raises XRPLRequestFailureException: If the outcome is unknown and not waited for
+        :raises XRPLReliableSubmissionException: If the transaction failed or expired
+
+        :return: Response
+        :rtype: Response
         """
 
-        self._client = client
+        if wait_for_validation is False:
+            if response is None:
+                raise XRPLRequestFailureException({
+                    'error': 'submitFailed',
+                    'error_message': f'Submitting {transaction.get_hash()} failed {_SUBMIT_ATTEMPTS} times; it may '
+                                     f'still apply until ledger {transaction.last_ledger_sequence}',
+                })
+            return response
+
+        engine_result = response.result.get('engine_result', '') if response is not None else ''
+        if engine_result[:3] in ('tem', 'tef'):
+            raise XRPLReliableSubmissionException(f'{engine_result}: {response.result.get("engine_result_message")}')
+
+        try:
+            return self._wait_for_outcome(
+                transaction.get_hash(), transaction.last_ledger_sequence, engine_result, transaction
+            )
+        finally:
+            self._discard_cached(transaction)
 
-    def _sign_and_send(self, transaction: Transaction, from_wallet: Wallet) -> Response:
+    def _sign_and_send(
+            self, transaction: Transaction, from_wallet: Wallet, wait_for_validation: bool = True
+    ) -> Response:
         """
         Sign and send a transaction
 
+        With local sequences enabled the Sequence comes from the local allocator, and a transaction rejected with
+        ``tefPAST_SEQ`` is re-signed with a fresh one after re-syncing. With a ticket pool set, payments, trust lines
+        and offer cancellations are sent with a Ticket instead (see :meth:`_sign_and_send_ticketed`).
+        With a validation tracker set, the outcome comes from the tracker's stream instead of polling ``tx``.
+
+        :param transaction: Transaction to sign and send
+        :type transaction: Transaction
+
+        :param from_wallet: Wallet to sign the transaction with
+        :type from_wallet: Wallet
+
+        :param wait_for_validation: If False, return the ``submit`` response without waiting for a validated ledger
+        :type wait_for_validation: bool
+
+        :return: Response
+        :rtype: Response
+        """
+
+        self._watch(from_wallet.classic_address)
+
+        if self._tickets is not None and transaction.transaction_type in _TICKET_TYPES and \
+                transaction.sequence is None and transaction.ticket_sequence is None:
+            return self._sign_and_send_ticketed(transaction, from_wallet, wait_for_validation)
+
+        if not self.local_sequences or transaction.sequence is not None:
+            safe_signed = self._autofill_and_sign(transaction, from_wallet)
+            response = self._try_submit(safe_signed, _SUBMIT_ATTEMPTS)
+            self._discard_cached(safe_signed)
+
+            return self._outcome(safe_signed, response, wait_for_validation)
+
+        address = from_wallet.classic_address
+
+        for _ in range(_MAX_RESYNCS + 1):
+            sequenced = _replace(transaction, sequence=self._next_sequence(address))
+            safe_signed = self._autofill_and_sign(sequenced, from_wallet)
+            response = self._try_submit(safe_signed, _SUBMIT_ATTEMPTS)
+            self._discard_cached(safe_signed)
+
+            # Whether a submit with an unknown outcome used its Sequence is only known once it validates or expires.
+            engine_result = response.result.get('engine_result', '') if response is not None else ''
+            if response is None or engine_result in RESYNC_RESULTS or not _consumes_sequence(engine_result):
+                self._sequences.invalidate(address)
+
+            # A tefPAST_SEQ transaction can never apply, so it is safe to sign again. Anything else (including a
+            # held terPRE_SEQ) might still make it into a ledger and is not re-signed.
+            if engine_result != 'tefPAST_SEQ':
+                break
+            self._count('retries', reason=engine_result)
+
+        return self._outcome(safe_signed, response, wait_for_validation)
+
+    def _sign_and_send_ticketed(
+            self, transaction: Transaction, from_wallet: Wallet, wait_for_validation: bool = True
+    ) -> Response:
+        """
+        Sign and send a transaction with a Ticket from the ticket pool instead of a Sequence
+
+        Transactions sent with Tickets do not depend on each other, so any number of them can be in flight at once
+        from parallel threads. A transaction rejected with ``tefNO_TICKET`` is re-signed with another Ticket after
+        re-syncing the pool; a Ticket whose transaction was rejected without using it is put back.
+
         :param transaction: Transaction to sign and send
         :type transaction: Transaction
 
         :param from_wallet: Wallet to sign the transaction with
         :type from_wallet: Wallet
 
+        :param wait_for_validation: If False, return the ``submit`` response without waiting for a validated ledger
+        :type wait_for_validation: bool
+
         :return: Response
         :rtype: Response
         """
 
-        safe_signed = safe_sign_and_autofill_transaction(transaction, from_wallet, self._client)
-        response = send_reliable_submission(safe_signed, self._client)
+        address = from_wallet.classic_address
+
+        for _ in range(_MAX_RESYNCS + 1):
+            ticket = self._take_ticket(from_wallet)
+            ticketed = _replace(transaction, sequence=0, ticket_sequence=ticket)
+            try:
+                safe_signed = self._autofill_and_sign(ticketed, from_wallet)
+                response = self._try_submit(safe_signed, _SUBMIT_ATTEMPTS)
+            except Exception:
+                self._tickets.done(address, ticket)
+                raise
+            finally:
+                self._discard_cached(ticketed)
+
+            engine_result = response.result.get('engine_result', '') if response is not None else ''
+            if engine_result == 'tefNO_TICKET':
+                # Someone else used the Ticket; the pool is out of date.
+                self._tickets.done(address, ticket)
+                self._sync_tickets(address)
+                self._count('retries', reason=engine_result)
+                continue
+
+            # A Ticket whose transaction may still apply is never handed out again.
+            if response is None or _consumes_sequence(engine_result):
+                self._tickets.done(address, ticket)
+            else:
+                self._tickets.release(address, ticket)
+            break
+
+        return self._outcome(safe_signed, response, wait_for_validation)
+
+    def _take_ticket(self, from_wallet: Wallet) -> int:
+        """
+        Take a Ticket from the pool. An empty pool is topped up before returning; a pool running low is topped up on a
+        background thread.
+
+        :param from_wallet: Wallet the Ticket is for
+        :type from_wallet: Wallet
+
+        :raises Exception: If no Ticket is available even after topping up
+
+        :return: TicketSequence
+        :rtype: int
+        """
+
+        address = from_wallet.classic_address
+
+        ticket = self._tickets.take(address)
+        if ticket is None:
+            self._top_up_tickets(from_wallet)
+            ticket = self._tickets.take(address)
+            if ticket is None:
+                raise Exception(f'No Ticket available for {address}')
+
+        if self._tickets.needs_top_up(address) and not self._ticket_lock.locked():
+            Thread(target=self._top_up_tickets, args=(from_wallet, False), daemon=True).start()
+
+        return ticket
+
+    def _top_up_tickets(self, from_wallet: Wallet, blocking: bool = True) -> None:
+        """
+        Create Tickets until the pool holds ``size`` available Tickets again, or the account owns the most it can.
+        Only one top-up runs at a time.
+
+        :param from_wallet: Wallet to create Tickets for
+        :type from_wallet: Wallet
+
+        :param blocking: If False, return at once when another top-up is running
+        :type blocking: bool
+
+        :return: None
+        """
+
+        if not self._ticket_lock.acquire(blocking=blocking):
+            return
+
+        try:
+            address = from_wallet.classic_address
+
+            # Another top-up may have filled the pool while this one waited for the lock.
+            if self._tickets.is_synced(address) and not self._tickets.needs_top_up(address):
+                return
+
+            on_ledger = self._sync_tickets(address)
+            available = self._tickets.available(address)
+            if available > 0 and not self._tickets.needs_top_up(address):
+                return
+
+            ticket_count = min(self._tickets.size - available, MAX_TICKETS - on_ledger)
+            if ticket_count > 0:
+                self.create_tickets(from_wallet, ticket_count)
+        finally:
+            self._ticket_lock.release()
+
+    def _sync_tickets(self, address: str) -> int:
+        """
+        Load the Tickets an account owns into the ticket pool
+
+        :param address: Wallet address
+        :type address: str
+
+        :return: Number of Tickets the account owns
+        :rtype: int
+        """
+
+        tickets = self.get_tickets(address)
+        self._tickets.sync(address, tickets)
+        return len(tickets)
+
+    def get_tickets(self, address: str) -> List[int]:
+        """
+        Get the TicketSequence of every Ticket an account owns, in the current ledger
+
+        :param address: Wallet address
+        :type address: str
+
+        :raises XRPLRequestFailureException: If a request fails
+
+        :return: TicketSequences, lowest first
+        :rtype: List[int]
+        """
+
+        account_objects = AccountObjects(
+            account=address,
+            type=AccountObjectType.TICKET,
+            ledger_index='current',
+        )
+
+        tickets = []
+        for page in self._iter_pages(account_objects):
+            tickets.extend(ticket['TicketSequence'] for ticket in page.result.get('account_objects', []))
+
+        return sorted(tickets)
+
+    def create_tickets(self, from_wallet: Wallet, ticket_count: int, wait_for_validation: bool = True) -> Response:
+        """
+        Create Tickets with a single TicketCreate. With a ticket pool set, the pool is re-synced afterwards.
+
+        Every Ticket counts towards the account's owner reserve until it is used.
+
+        :param from_wallet: XRPL Wallet
+        :type from_wallet: Wallet
+
+        :param ticket_count: Number of Tickets to create (1 to 250)
+        :type ticket_count: int
+
+        :param wait_for_validation: If False, return as soon as the transaction is submitted
+        :type wait_for_validation: bool
+
+        :return: Result of Ticket creation attempt
+        :rtype: Response
+        """
+
+        transaction = ticket_create(from_wallet.classic_address, ticket_count)
 
+        response = self._sign_and_send(transaction, from_wallet, wait_for_validation)
+        if self._tickets is not None:
+            self._sync_tickets(from_wallet.classic_address)
         return response
 
+    def _submit_batch(self, signed: List[Union[Transaction, str]], hashes: List[str]) -> List[Optional[Response]]:
+        """
+        Submit signed transactions in Sequence order without raising
+
+        A transaction whose submit failed transiently may still apply and gets None, like an unknown outcome of
+        :meth:`_try_submit`. Once a submit is rejected outright, the rest of the batch is not submitted, as their
+        Sequences could not apply; those transactions get a ``'notSubmitted'`` error Response.
+
+        :param signed: Signed transactions or their blobs, in Sequence order
+        :type signed: List[Union[Transaction, str]]
+
+        :param hashes: Their hashes, in the same order
+        :type hashes: List[str]
+
+        :return: ``submit`` Response, None or error Response per transaction, in the same order
+        :rtype: List[Optional[Response]]
+        """
+
+        submitted = []
+        rejected = False
+        for transaction, transaction_hash in zip(signed, hashes):
+            if rejected:
+                submitted.append(_failure(
+                    transaction_hash, 'notSubmitted', 'An earlier transaction of the batch failed to submit'
+                ))
+                continue
+
+            try:
+                submitted.append(self._try_submit(transaction, _SUBMIT_ATTEMPTS))
+            except Exception as e:
+                rejected = True
+                submitted.append(_failure(transaction_hash, getattr(e, 'error', type(e).__name__), str(e)))
+
+        return submitted
+
+    def submit_many(
+            self, transactions: List[Transaction], from_wallet: Wallet, batch_size: int = _BATCH_SIZE,
+            max_workers: int = None, wait_for_validation: bool = True
+    ) -> List[Response]:
+        """
+        Sign and send many transactions from one wallet.
+
+        Transactions are split into batches of ``batch_size``. Each batch gets consecutive Sequence numbers and is
+        signed locally, submitted back-to-back and, unless ``wait_for_validation`` is False, tracked by a single
+        validation watcher that matches hashes against every newly validated ledger.
+
+        Failures are not raised once a batch is signed. A transaction rejected at submit time, or not validated before
+        its LastLedgerSequence, gets an error Response whose ``error`` is the preliminary engine result, the request
+        error or ``'expired'``; the rest of a batch after a rejected submit is not sent and gets ``'notSubmitted'``.
+        Transactions already submitted are still waited for; if waiting keeps failing, they get ``'unknown'``. A
+        validated transaction gets its ``tx`` Response, whose ``meta`` holds the final result.
+
+        :param transactions: Unsigned transactions, in the order they must apply
+        :type transactions: List[Transaction]
+
+        :param from_wallet: Wallet to sign the transactions with
+        :type from_wallet: Wallet
+
+        :param batch_size: Transactions submitted before waiting for them to validate
+        :type batch_size: int
+
+        :param max_workers: max number of signing threads
+        :type max_workers: int
+
+        :param wait_for_validation: If False, return the ``submit`` responses without waiting for a validated ledger
+        :type wait_for_validation: bool
+
+        :return: One Response per transaction, in the same order
+        :rtype: List[Response]
+        """
+
+        from .ratelimit import request_priority, PRIORITY_BULK
+
+        if not self.local_sequences:
+            # Without local sequences nothing else keeps the allocator up to date, so start from the ledger's view.
+            self._sequences.invalidate(from_wallet.classic_address)
+
+        if wait_for_validation is True:
+            self._watch(from_wallet.classic_address)
+
+        with request_priority(PRIORITY_BULK):
+            responses = []
+            for start in range(0, len(transactions), batch_size):
+                signed = self._prepare_batch(transactions[start:start + batch_size], from_wallet, max_workers)
+                hashes = [transaction.get_hash() for transaction in signed]
+                submitted = self._submit_batch(signed, hashes)
+
+                if wait_for_validation is True:
+                    responses.extend(self._wait_for_outcomes(
+                        from_wallet.classic_address, hashes, signed[0].last_ledger_sequence, submitted
+                    ))
+                else:
+                    responses.extend(_unknown_if_missing(hashes, submitted))
+
+                for transaction in signed:
+                    self._discard_cached(transaction)
+
+        return responses
+
+    def prepare_signed(
+            self, transactions: List[Transaction], from_wallet: Wallet, ledger_offset: int = _LEDGER_OFFSET,
+            max_workers: int = None
+    ) -> List[Tuple[str, str]]:
+        """
+        Sign transactions offline with :func:`xrpy.signing.prepare_and_sign`, filling in consecutive Sequences, the fee
+        and a LastLedgerSequence shared by every blob, so :meth:`submit_signed` can wait for them
+
+        :param transactions: Unsigned transactions, in the order they must apply
+        :type transactions: List[Transaction]
+
+        :param from_wallet: Wallet to sign the transactions with
+        :type from_wallet: Wallet
+
+        :param ledger_offset: Ledgers after the latest validated one the blobs stay valid for
+        :type ledger_offset: int
+
+        :param max_workers: max number of signing processes (default: one per CPU)
+        :type max_workers: int
+
+        :raises XRPLRequestFailureException: If the account info, fee or ledger request fails
+
+        :return: (blob, hash) pairs, in the same order as the transactions
+        :rtype: List[Tuple[str, str]]
+        """
+
+        from .signing import prepare_and_sign
+
+        if not transactions:
+            return []
+
+        first_sequence = self._next_sequence(from_wallet.classic_address, len(transactions))
+        fee = self._fee()
+        last_ledger_sequence = self._latest_validated_ledger_sequence() + ledger_offset
+
+        return prepare_and_sign(transactions, from_wallet, first_sequence, fee, last_ledger_sequence, max_workers)
+
+    def submit_signed(self, signed: List[Tuple[str, str]], wait_for_validation: bool = True) -> List[Response]:
+        """
+        Submit blobs signed offline, e.g. by :func:`xrpy.signing.prepare_and_sign`, in order.
+
+        The blobs must come from one account and share a LastLedgerSequence when waiting for validation. They are
+        submitted and tracked like a batch of :meth:`submit_many`. Failures are not raised: a blob rejected at submit
+        time gets an error Response and the blobs after it get ``'notSubmitted'``. Blobs already submitted are still
+        waited for.
+
+        :param signed: (blob, hash) pairs, in Sequence order
+        :type signed: List[Tuple[str, str]]
+
+        :param wait_for_validation: If False, return the ``submit`` responses without waiting for a validated ledger
+        :type wait_for_validation: bool
+
+        :raises ValueError: If the blobs come from several accounts, or if waiting for blobs without one shared
+            LastLedgerSequence. Nothing is submitted then.
+
+        :return: One Response per blob, in the same order
+        :rtype: List[Response]
+        """
+
+        if not signed:
+            return []
+
+        decoded = [decode(blob) for blob, _ in signed]
+        account = decoded[0]['Account']
+        last_ledger_sequence = decoded[0].get('LastLedgerSequence')
+        if any(fields['Account'] != account for fields in decoded):
+            raise ValueError('Blobs submitted together must all come from one account')
+        if wait_for_validation is True and (
+                last_ledger_sequence is None or
+                any(fields.get('LastLedgerSequence') != last_ledger_sequence for fields in decoded)
+        ):
+            raise ValueError('Blobs without one shared LastLedgerSequence can not be waited for')
+
+        first_ledger = None
+        if wait_for_validation is True:
+            self._watch(account)
+            first_ledger = self._latest_validated_ledger_sequence() + 1
+
+        hashes = [transaction_hash for _, transaction_hash in signed]
+        submitted = self._submit_batch([blob for blob, _ in signed], hashes)
+
+        # The blobs were signed with Sequences this instance did not hand out.
+        self._sequences.invalidate(account)
+        if self._cache is not None:
+            self._cache.discard_account(account)
+
+        if wait_for_validation is False:
+            return _unknown_if_missing(hashes, submitted)
+
+        return self._wait_for_outcomes(account, hashes, last_ledger_sequence, submitted, first_ledger)
+
     def create_wallet(self, wallet: Optional[Wallet] = None, debug: bool = False) -> Wallet:
         """
         Create a wallet
@@ -126,7 +1944,7 @@ class XRPY:
         return _wallet
 
     def transfer_xrp(
-            self, from_wallet: Wallet, amount: Union[int, float], destination: str
+            self, from_wallet: Wallet, amount: Union[int, float], destination: str, wait_for_validation: bool = True
     ) -> Response:
         """
         Transfer XRP
@@ -140,21 +1958,21 @@ class XRPY:
         :param destination: Destination address
         :type destination: str
 
+        :param wait_for_validation: If False, return as soon as the transaction is submitted
+        :type wait_for_validation: bool
+
         :return: Result of transaction sending attempt
         :rtype: Response
         """
 
-        payment = Payment(
-            account=from_wallet.classic_address,
-            amount=xrp_to_drops(amount),
-            destination=destination,
-        )
+        payment = xrp_payment(from_wallet.classic_address, amount, destination)
 
-        response = self._sign_and_send(payment, from_wallet)
+        response = self._sign_and_send(payment, from_wallet, wait_for_validation)
         return response
     
     def transfer_token(
-            self, from_wallet: Wallet, currency: str, amount: Union[int, float], destination: str, issuer: str
+            self, from_wallet: Wallet, currency: str, amount: Union[int, float], destination: str, issuer: str,
+            wait_for_validation: bool = True
     ) -> Response:
         """
         Transfer XRP
@@ -174,24 +1992,86 @@ class XRPY:
         :param issuer: Issuer address
         :type issuer: str
 
+        :param wait_for_validation: If False, return as soon as the transaction is submitted
+        :type wait_for_validation: bool
+
         :return: Result of transaction sending attempt
         :rtype: Response
         """
 
-        payment = Payment(
-            account=from_wallet.classic_address,
-            amount=IssuedCurrencyAmount(
-                currency=currency,
-                value=amount,
-                issuer=issuer,
-            ),
-            destination=destination,
-        )
+        payment = token_payment(from_wallet.classic_address, currency, amount, destination, issuer)
 
-        response = self._sign_and_send(payment, from_wallet)
+        response = self._sign_and_send(payment, from_wallet, wait_for_validation)
         return response
 
-    def set_trust_line(self, from_wallet: Wallet, currency: str, value: str, issuer: str) -> Response:
+    def transfer_xrp_many(
+            self, from_wallet: Wallet, payments: List[Tuple[str, Union[int, float]]], batch_size: int = _BATCH_SIZE,
+            max_workers: int = None
+    ) -> List[Response]:
+        """
+        Transfer XRP to many destinations. See :meth:`submit_many`.
+
+        :param from_wallet: XRPL Wallet
+        :type from_wallet: Wallet
+
+        :param payments: (destination, amount) pairs
+        :type payments: List[Tuple[str, Union[int, float]]]
+
+        :param batch_size: Payments submitted before waiting for them to validate
+        :type batch_size: int
+
+        :param max_workers: max number of signing threads
+        :type max_workers: int
+
+        :return: One Response per payment, in the same order
+        :rtype: List[Response]
+        """
+
+        transactions = [
+            xrp_payment(from_wallet.classic_address, amount, destination) for destination, amount in payments
+        ]
+
+        return self.submit_many(transactions, from_wallet, batch_size, max_workers)
+
+    def transfer_token_many(
+            self, from_wallet: Wallet, currency: str, issuer: str, payments: List[Tuple[str, Union[int, float]]],
+            batch_size: int = _BATCH_SIZE, max_workers: int = None
+    ) -> List[Response]:
+        """
+        Transfer a token to many destinations. See :meth:`submit_many`.
+
+        :param from_wallet: XRPL Wallet
+        :type from_wallet: Wallet
+
+        :param currency: Currency to send
+        :type currency: str
+
+        :param issuer: Issuer address
+        :type issuer: str
+
+        :param payments: (destination, amount) pairs
+        :type payments: List[Tuple[str, Union[int, float]]]
+
+        :param batch_size: Payments submitted before waiting for them to validate
+        :type batch_size: int
+
+        :param max_workers: max number of signing threads
+        :type max_workers: int
+
+        :return: One Response per payment, in the same order
+        :rtype: List[Response]
+        """
+
+        transactions = [
+            token_payment(from_wallet.classic_address, currency, amount, destination, issuer)
+            for destination, amount in payments
+        ]
+
+        return self.submit_many(transactions, from_wallet, batch_size, max_workers)
+
+    def set_trust_line(
+            self, from_wallet: Wallet, currency: str, value: str, issuer: str, wait_for_validation: bool = True
+    ) -> Response:
         """
         Create a trust line
 
@@ -207,28 +2087,23 @@ class XRPY:
         :param issuer: Trust line issuer
         :type issuer: str
 
+        :param wait_for_validation: If False, return as soon as the transaction is submitted
+        :type wait_for_validation: bool
+
         :return: Result of Trust line creation attempt
         :rtype: Response
 
         """
 
-        trust_set = TrustSet(
-            account=from_wallet.classic_address,
-            limit_amount=IssuedCurrencyAmount(
-                currency=currency.upper(),
-                value=value,
-                issuer=issuer,
-            ),
-            flags=TrustSetFlag.TF_SET_NO_RIPPLE
-        )
+        transaction = trust_set(from_wallet.classic_address, currency, value, issuer)
 
-        response = self._sign_and_send(trust_set, from_wallet)
+        response = self._sign_and_send(transaction, from_wallet, wait_for_validation)
         return response
 
     def create_buy_offer(
             self, from_wallet: Wallet, taker_gets_xrp: Union[float, int],
             taker_pays_currency: str, taker_pays_value: str, taker_pays_issuer: str,
-            _type: str
+            _type: str, wait_for_validation: bool = True
     ) -> Response:
         """
         Place Order
@@ -251,28 +2126,26 @@ class XRPY:
         :param _type: Offer type (market or limit)
         :type _type: str
 
+        :param wait_for_validation: If False, return as soon as the transaction is submitted
+        :type wait_for_validation: bool
+
         :return: Result of order placing attempt
         :rtype: Response
         """
 
-        offer_create = OfferCreate(
-            account=from_wallet.classic_address,
-            taker_gets=xrp_to_drops(taker_gets_xrp),
-            taker_pays=IssuedCurrencyAmount(
-                currency=taker_pays_currency,
-                value=taker_pays_value,
-                issuer=taker_pays_issuer,
-            ),
-            flags=OfferCreateFlag.TF_SELL if _type.lower() == 'market' else 0
+        offer_create = buy_offer(
+            from_wallet.classic_address, taker_gets_xrp,
+            taker_pays_currency, taker_pays_value, taker_pays_issuer,
+            _type
         )
 
-        response = self._sign_and_send(offer_create, from_wallet)
+        response = self._sign_and_send(offer_create, from_wallet, wait_for_validation)
         return response
 
     def create_sell_offer(
             self, from_wallet: Wallet, taker_pays_xrp: Union[float, int],
             taker_gets_currency: str, taker_gets_value: str, taker_gets_issuer: str,
-            _type: str
+            _type: str, wait_for_validation: bool = True
     ) -> Response:
         """
         Place Order
@@ -295,25 +2168,23 @@ class XRPY:
         :param _type: Offer type (market or limit)
         :type _type: str
 
+        :param wait_for_validation: If False, return as soon as the transaction is submitted
+        :type wait_for_validation: bool
+
         :return: Result of order placing attempt
         :rtype: Response
         """
 
-        offer_create = OfferCreate(
-            account=from_wallet.classic_address,
-            taker_gets=IssuedCurrencyAmount(
-                currency=taker_gets_currency,
-                value=taker_gets_value,
-                issuer=taker_gets_issuer,
-            ),
-            taker_pays=xrp_to_drops(taker_pays_xrp),
-            flags=OfferCreateFlag.TF_SELL if _type.lower() == 'market' else 0
+        offer_create = sell_offer(
+            from_wallet.classic_address, taker_pays_xrp,
+            taker_gets_currency, taker_gets_value, taker_gets_issuer,
+            _type
         )
 
-        response = self._sign_and_send(offer_create, from_wallet)
+        response = self._sign_and_send(offer_create, from_wallet, wait_for_validation)
         return response
 
-    def cancel_offer(self, from_wallet: Wallet, offer_sequence: int) -> Response:
+    def cancel_offer(self, from_wallet: Wallet, offer_sequence: int, wait_for_validation: bool = True) -> Response:
         """
         Cancel order
 
@@ -323,16 +2194,16 @@ class XRPY:
         :param offer_sequence: The sequence number (or Ticket number) of a previous OfferCreate transaction.
         :type offer_sequence: int
 
+        :param wait_for_validation: If False, return as soon as the transaction is submitted
+        :type wait_for_validation: bool
+
         :return: Result of order canceling attempt
         :rtype: Response
         """
 
-        offer_create = OfferCancel(
-            account=from_wallet.classic_address,
-            offer_sequence=offer_sequence
-        )
+        transaction = offer_cancel(from_wallet.classic_address, offer_sequence)
 
-        response = self._sign_and_send(offer_create, from_wallet)
+        response = self._sign_and_send(transaction, from_wallet, wait_for_validation)
         return response
 
     def delete_account(self, from_wallet: Wallet, destination: str, destination_tag: Optional[int] = None) -> Response:
@@ -352,16 +2223,12 @@ class XRPY:
         :rtype: Response
         """
 
-        account_delete = AccountDelete(
-            account=from_wallet.classic_address,
-            destination=destination,
-            destination_tag=destination_tag
-        )
+        transaction = account_delete(from_wallet.classic_address, destination, destination_tag)
 
-        response = self._sign_and_send(account_delete, from_wallet)
+        response = self._sign_and_send(transaction, from_wallet)
         return response
 
-    def __sell_trustline_yolo(self, from_wallet: Wallet, trustline: Dict) -> Union[Response, None]:
+    def __sell_trustline_yolo(self, from_wallet: Wallet, trustline: TrustLine) -> Union[Response, None]:
         """
         Sell trustline
 
@@ -375,13 +2242,13 @@ class XRPY:
         :rtype: Response
         """
 
-        if trustline.get('balance') != '0':
+        if trustline.balance != 0:
             _ = self.create_sell_offer(
                 from_wallet,
                 0.00001,
-                trustline.get('currency'),
-                trustline.get('balance'),
-                trustline.get('account'),
+                trustline.currency,
+                str(trustline.balance),
+                trustline.account,
                 _type='market'
             )
             return _
@@ -397,6 +2264,10 @@ class XRPY:
         3) Remove All Trustlines
         4) Delete Account
 
+        In threaded mode steps 1-3 get consecutive Sequence numbers, are signed in parallel, submitted in one burst and
+        tracked by a single validation watcher, so they do not collide on the account Sequence. Their Responses are
+        not raised on failure; see :meth:`submit_many`.
+
         :param from_wallet: wallet you want to delete
         :type from_wallet: Wallet
 
@@ -406,18 +2277,16 @@ class XRPY:
         :param destination_tag: destination tag
         :type destination_tag: int
 
-        :param threaded: if True, will run all operations in separate threads
+        :param threaded: if True, sign and submit steps 1-3 as one parallel batch
         :type threaded: bool
 
-        :param max_workers: max number of threads
+        :param max_workers: max number of signing threads
         :type max_workers: int
 
         :return: Result of account deletion attempt
         :rtype: Response
         """
 
-        thread_pool = ThreadPoolExecutor(max_workers=max_workers)
-
         __data__ = {
             'CancelOffers': [],
             'SellAllTokens': [],
@@ -425,59 +2294,62 @@ class XRPY:
             'DeleteAccount': [],
         }
 
-        # Cancel all offers
-        all_offers_data = self.get_account_offers(from_wallet.classic_address)
-        offers = all_offers_data.result.get('offers', [])
+        address = from_wallet.classic_address
 
         if threaded is True:
-            __threads__ = [
-                thread_pool.submit(self.cancel_offer, from_wallet, offer['seq']) for offer in offers
+            with self.at_ledger() as snapshot:
+                offers = snapshot.get_account_offer_records(address)
+                trustlines = snapshot.get_account_trustline_records(address)
+            to_sell = [trustline for trustline in trustlines if trustline.balance != 0]
+
+            cancels = [offer_cancel(address, offer.seq) for offer in offers]
+            sells = [
+                sell_offer(
+                    address,
+                    0.00001,
+                    trustline.currency,
+                    str(trustline.balance),
+                    trustline.account,
+                    _type='market'
+                )
+                for trustline in to_sell
+            ]
+            removals = [
+                trust_set(address, trustline.currency, '0', trustline.account)
+                for trustline in trustlines
             ]
-            for thread in __threads__:
-                __data__['CancelOffers'].append(thread.result())
-        else:
-            for offer in offers:
-                _ = self.cancel_offer(from_wallet, offer.get('seq'))
-                __data__['CancelOffers'].append(_)
 
-        # Sell all tokens
-        all_account_trustlines = self.get_account_trustlines(from_wallet.classic_address)
-        trustlines = all_account_trustlines.result.get('lines', [])
+            results = self.submit_many(cancels + sells + removals, from_wallet, max_workers=max_workers)
 
-        if threaded is True:
-            __threads__ = [
-                thread_pool.submit(self.__sell_trustline_yolo, from_wallet, trustline) for trustline in trustlines
+            sold = iter(results[len(cancels):len(cancels) + len(sells)])
+            __data__['CancelOffers'] = results[:len(cancels)]
+            __data__['SellAllTokens'] = [
+                next(sold) if trustline.balance != 0 else None for trustline in trustlines
             ]
-            for thread in __threads__:
-                __data__['SellAllTokens'].append(thread.result())
+            __data__['RemoveTrustlines'] = results[len(cancels) + len(sells):]
 
         else:
+            # Cancel all offers
+            offers = self.get_account_offer_records(address)
+
+            for offer in offers:
+                _ = self.cancel_offer(from_wallet, offer.seq)
+                __data__['CancelOffers'].append(_)
+
+            # Sell all tokens
+            trustlines = self.get_account_trustline_records(address)
+
             for trustline in trustlines:
                 _ = self.__sell_trustline_yolo(from_wallet, trustline)
                 __data__['SellAllTokens'].append(_)
 
-        # Remove all trustlines
-        if threaded is True:
-            __threads__ = [
-                thread_pool.submit(
-                    self.set_trust_line,
-                    from_wallet,
-                    trustline.get('currency'),
-                    '0',
-                    trustline.get('account')
-                )
-                for trustline in trustlines
-            ]
-            for thread in __threads__:
-                __data__['RemoveTrustlines'].append(thread.result())
-
-        else:
+            # Remove all trustlines
             for trustline in trustlines:
                 _ = self.set_trust_line(
                     from_wallet,
-                    trustline.get('currency'),
+                    trustline.currency,
                     '0',
-                    trustline.get('account')
+                    trustline.account
                 )
                 __data__['RemoveTrustlines'].append(_)
 
@@ -487,24 +2359,421 @@ class XRPY:
 
         return __data__
 
-    def get_account_info(self, address: str) -> Response:
+    def get_account_info(self, address: str, ledger_index: Union[str, int] = 'validated') -> Response:
         """
         Get Account Info
 
-        :param address: Wallet address
+        :param address: Wallet address or X-address
         :type address: str
 
+        :param ledger_index: Ledger to read from: an index, or 'validated', 'current' or 'closed'
+        :type ledger_index: Union[str, int]
+
+        :raises XRPLRequestFailureException: If the request fails
+
         :return: Account info
         :rtype: Response
         """
 
-        acc_info = xrpl_get_account_info(address, self._client)
+        if is_valid_xaddress(address):
+            address, _, _ = xaddress_to_classic_address(address)
+
+        acc_info = self._request(AccountInfo(
+            account=address,
+            ledger_index=ledger_index,
+        ))
+        if not acc_info.is_successful():
+            raise XRPLRequestFailureException(acc_info.result)
 
         return acc_info
 
+    def _map_addresses(
+            self, function: Callable[[str], _Result], addresses: Iterable[str], max_workers: int = None
+    ) -> Iterator[Tuple[str, Union[_Result, Exception]]]:
+        """
+        Call ``function`` for every address on a bounded thread pool and yield the results as they complete.
+
+        At most ``max_workers`` calls are in flight and addresses are read lazily, so ``addresses`` can be a generator
+        over a very large list. An exception raised for one address is yielded as its result instead of being raised.
+
+        :param function: Function taking an address
+        :type function: Callable[[str], Any]
+
+        :param addresses: Addresses
+        :type addresses: Iterable[str]
+
+        :param max_workers: max number of threads
+        :type max_workers: int
+
+        :return: (address, result or exception) pairs, in completion order
+        :rtype: Iterator[Tuple[str, Any]]
+        """
+
+        from .ratelimit import request_priority, PRIORITY_BULK
+
+        def call(address: str) -> Tuple[str, Union[_Result, Exception]]:
+            try:
+                with request_priority(PRIORITY_BULK):
+                    return address, function(address)
+            except Exception as e:
+                return address, e
+
+        addresses = iter(addresses)
+        max_workers = max_workers or self.max_workers or _BULK_WORKERS
+
+        with ThreadPoolExecutor(max_workers=max_workers) as thread_pool:
+            pending = {thread_pool.submit(call, address) for address in islice(addresses, max_workers)}
+
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        for address in islice(addresses, 1):
+                            pending.add(thread_pool.submit(call, address))
+                        yield future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _pin_ledger_index(self, ledger_index: Union[str, int]) -> Union[str, int]:
+        """
+        Resolve 'validated' to the index of the latest validated ledger, so a batch of reads sees one ledger
+
+        :param ledger_index: Ledger index or shortcut
+        :type ledger_index: Union[str, int]
+
+        :return: Ledger index
+        :rtype: Union[str, int]
+        """
+
+        if ledger_index == 'validated':
+            if self._snapshot_index is not None:
+                return self._snapshot_index
+            return self._latest_validated_ledger_sequence()
+        return ledger_index
+
+    def get_account_infos(
+            self, addresses: Iterable[str], ledger_index: Union[str, int] = 'validated', max_workers: int = None
+    ) -> Iterator[Tuple[str, Union[Response, Exception]]]:
+        """
+        Get Account Info for many addresses, spread over a bounded thread pool.
+
+        Every request reads the same ledger: 'validated' is resolved to the latest validated ledger index once, before
+        the first request. Results are yielded as they arrive, and a failed lookup (e.g. an unfunded account) yields its
+        exception instead of stopping the batch.
+
+        :param addresses: Wallet addresses
+        :type addresses: Iterable[str]
+
+        :param ledger_index: Ledger to read from: an index, or 'validated', 'current' or 'closed'
+        :type ledger_index: Union[str, int]
+
+        :param max_workers: max number of concurrent requests
+        :type max_workers: int
+
+        :return: (address, account info or exception) pairs, in completion order
+        :rtype: Iterator[Tuple[str, Union[Response, Exception]]]
+        """
+
+        ledger_index = self._pin_ledger_index(ledger_index)
+
+        yield from self._map_addresses(
+            lambda address: self.get_account_info(address, ledger_index), addresses, max_workers
+        )
+
+    def _iter_pages(self, request: Request, prefetch: bool = False) -> Iterator[Response]:
+        """
+        Send a paginated request and follow its ``marker`` until the last page
+
+        :param request: First page request
+        :type request: Request
+
+        :param prefetch: If True, fetch the next page in the background while the caller processes the current one
+        :type prefetch: bool
+
+        :raises XRPLRequestFailureException: If a page request fails
+
+        :return: One Response per page
+        :rtype: Iterator[Response]
+        """
+
+        with ThreadPoolExecutor(max_workers=1) as thread_pool:
+            # Prefetches run with the caller's context, so they keep its request priority.
+            pending = thread_pool.submit(copy_context().run, self._request, request) if prefetch is True else None
+
+            while request is not None:
+                response = pending.result() if prefetch is True else self._request(request)
+                if not response.is_successful():
+                    raise XRPLRequestFailureException(response.result)
+
+                request = _next_page(request, response)
+                if prefetch is True and request is not None:
+                    pending = thread_pool.submit(copy_context().run, self._request, request)
+
+                yield response
+
+    def _request_all_pages(self, request: Request, key: str) -> Response:
+        """
+        Send a paginated request and merge every page into one Response
+
+        :param request: First page request
+        :type request: Request
+
+        :param key: Result field holding the paginated list
+        :type key: str
+
+        :raises XRPLRequestFailureException: If a request for a page after the first fails
+
+        :return: First page Response with ``key`` holding the items of every page and no ``marker``
+        :rtype: Response
+        """
+
+        first = self._request(request)
+        if not first.is_successful() or first.result.get('marker') is None:
+            return first
+
+        result = {**first.result, key: list(first.result.get(key, []))}
+        del result['marker']
+        for page in self._iter_pages(_next_page(request, first), prefetch=True):
+            result[key].extend(page.result.get(key, []))
+
+        return Response(status=first.status, result=result, id=first.id, type=first.type)
+
+    def iter_account_trustlines(self, address: str, limit: int = None, prefetch: bool = False) -> Iterator[Dict]:
+        """
+        Iterate over every trust line of an account, one page at a time, all from the latest validated ledger
+
+        :param address: Wallet address
+        :type address: str
+
+        :param limit: Trust lines per page (server default if None)
+        :type limit: int
+
+        :param prefetch: If True, fetch the next page while the caller processes the current one
+        :type prefetch: bool
+
+        :return: Trust lines
+        :rtype: Iterator[Dict]
+        """
+
+        account_lines = AccountLines(
+            account=address,
+            ledger_index='validated',
+            limit=limit,
+        )
+
+        for page in self._iter_pages(account_lines, prefetch):
+            yield from page.result.get('lines', [])
+
+    def iter_account_offers(self, address: str, limit: int = None, prefetch: bool = False) -> Iterator[Dict]:
+        """
+        Iterate over every offer of an account, one page at a time, all from the latest validated ledger
+
+        :param address: Wallet address
+        :type address: str
+
+        :param limit: Offers per page (server default if None)
+        :type limit: int
+
+        :param prefetch: If True, fetch the next page while the caller processes the current one
+        :type prefetch: bool
+
+        :return: Offers
+        :rtype: Iterator[Dict]
+        """
+
+        account_offers = AccountOffers(
+            account=address,
+            ledger_index='validated',
+            limit=limit,
+        )
+
+        for page in self._iter_pages(account_offers, prefetch):
+            yield from page.result.get('offers', [])
+
+    def get_account_trustline_records(self, address: str, prefetch: bool = False) -> List[TrustLine]:
+        """
+        Get every trust line of an account as slotted :class:`xrpy.records.TrustLine` records with parsed amounts.
+        Each page is converted as it arrives, so the raw dicts of only one page are held at a time.
+
+        :param address: Wallet address
+        :type address: str
+
+        :param prefetch: If True, fetch the next page while the current one is converted
+        :type prefetch: bool
+
+        :return: Trust lines
+        :rtype: List[TrustLine]
+        """
+
+        return [TrustLine.from_xrpl(line) for line in self.iter_account_trustlines(address, prefetch=prefetch)]
+
+    def get_account_offer_records(self, address: str, prefetch: bool = False) -> List[Offer]:
+        """
+        Get every offer of an account as slotted :class:`xrpy.records.Offer` records with parsed amounts
+
+        :param address: Wallet address
+        :type address: str
+
+        :param prefetch: If True, fetch the next page while the current one is converted
+        :type prefetch: bool
+
+        :return: Offers
+        :rtype: List[Offer]
+        """
+
+        return [Offer.from_xrpl(offer) for offer in self.iter_account_offers(address, prefetch=prefetch)]
+
+    def iter_account_transactions(
+            self, address: str, ledger_min: int = -1, ledger_max: int = -1, forward: bool = False, limit: int = None,
+            marker: Optional[Any] = None, prefetch: bool = True, on_page: Optional[Callable[[Any], None]] = None
+    ) -> Iterator[Dict]:
+        """
+        Iterate over the validated transactions of an account with ``account_tx``, one page at a time
+
+        Every page's transactions are yielded before ``on_page`` is called with the marker of the next page (None
+        after the last one). Saving that marker and passing it back as ``marker``, with the same ledger range and
+        direction, resumes after the last page that was fully processed.
+
+        :param address: Wallet address
+        :type address: str
+
+        :param ledger_min: Earliest ledger to include (-1 for the earliest the server has)
+        :type ledger_min: int
+
+        :param ledger_max: Latest ledger to include (-1 for the latest validated one)
+        :type ledger_max: int
+
+        :param forward: If True, oldest transactions first; newest first otherwise
+        :type forward: bool
+
+        :param limit: Transactions per page (server default if None)
+        :type limit: int
+
+        :param marker: Marker to resume from
+        :type marker: Optional[Any]
+
+        :param prefetch: If True, fetch the next page while the caller processes the current one
+        :type prefetch: bool
+
+        :param on_page: Called with the next page's marker after every page
+        :type on_page: Optional[Callable[[Any], None]]
+
+        :raises XRPLRequestFailureException: If a page request fails
+
+        :return: ``account_tx`` entries, with ``tx``, ``meta`` and ``validated``
+        :rtype: Iterator[Dict]
+        """
+
+        account_tx = AccountTx(
+            account=address,
+            ledger_index_min=ledger_min,
+            ledger_index_max=ledger_max,
+            forward=forward,
+            limit=limit,
+            marker=marker,
+        )
+
+        for page in self._iter_pages(account_tx, prefetch):
+            yield from page.result.get('transactions', [])
+            if on_page is not None:
+                on_page(page.result.get('marker'))
+
+    def export_account_transactions(
+            self, address: str, path: str, ledger_min: int = -1, ledger_max: int = -1, forward: bool = False,
+            marker: Optional[Any] = None, checkpoint: Optional[str] = None
+    ) -> int:
+        """
+        Stream the validated transactions of an account to a file, without holding them in memory
+
+        Paths ending in ``.parquet`` are written with :func:`xrpy.export.write_parquet` (needs pyarrow), anything else
+        as newline-delimited JSON, one ``account_tx`` entry per line.
+
+        With a ``checkpoint`` file (NDJSON only), the next page's marker and the size of the output are saved after
+        every page. Calling again with the same arguments after a crash truncates the output to the last saved page
+        and carries on from there; if the output is gone, the export starts over. The checkpoint is removed once the
+        export is complete.
+
+        :param address: Wallet address
+        :type address: str
+
+        :param path: Output file
+        :type path: str
+
+        :param ledger_min: Earliest ledger to include (-1 for the earliest the server has)
+        :type ledger_min: int
+
+        :param ledger_max: Latest ledger to include (-1 for the latest validated one)
+        :type ledger_max: int
+
+        :param forward: If True, oldest transactions first; newest first otherwise
+        :type forward: bool
+
+        :param marker: Marker to start from
+        :type marker: Optional[Any]
+
+        :param checkpoint: File to save progress to and resume from
+        :type checkpoint: Optional[str]
+
+        :raises ValueError: If a checkpoint is used with Parquet, belongs to another account, or is past the end of
+            the output
+        :raises XRPLRequestFailureException: If a page request fails
+
+        :return: Number of transactions written by this call
+        :rtype: int
+        """
+
+        from .export import write_ndjson, write_parquet, read_checkpoint, write_checkpoint
+        from .ratelimit import request_priority, PRIORITY_BULK
+
+        if path.endswith('.parquet'):
+            if checkpoint is not None:
+                raise ValueError('Checkpoints are only supported for NDJSON exports')
+            transactions = self.iter_account_transactions(address, ledger_min, ledger_max, forward, marker=marker)
+            with request_priority(PRIORITY_BULK):
+                return write_parquet(transactions, path)
+
+        saved = read_checkpoint(checkpoint) if checkpoint is not None else None
+        if saved is not None:
+            if saved['account'] != address:
+                raise ValueError(f'Checkpoint {checkpoint} belongs to {saved["account"]}')
+            if saved['marker'] is None:
+                # The last page was written; only removing the checkpoint was left.
+                os.remove(checkpoint)
+                return 0
+            if not os.path.exists(path):
+                # None of the saved pages are left to resume from; export them again.
+                saved = None
+            elif os.path.getsize(path) < saved['offset']:
+                raise ValueError(f'Checkpoint {checkpoint} is past the end of {path}; remove it to export again')
+            else:
+                marker = saved['marker']
+
+        with open(path, 'r+b' if saved is not None else 'wb') as file:
+            if saved is not None:
+                file.truncate(saved['offset'])
+                file.seek(saved['offset'])
+
+            def save(next_marker: Any) -> None:
+                file.flush()
+                os.fsync(file.fileno())
+                write_checkpoint(checkpoint, {'account': address, 'marker': next_marker, 'offset': file.tell()})
+
+            transactions = self.iter_account_transactions(
+                address, ledger_min, ledger_max, forward, marker=marker,
+                on_page=save if checkpoint is not None else None,
+            )
+            with request_priority(PRIORITY_BULK):
+                written = write_ndjson(transactions, file)
+
+        if checkpoint is not None:
+            os.remove(checkpoint)
+
+        return written
+
     def get_account_trustlines(self, address: str) -> Response:
         """
-        Get Account Trustlines
+        Get Account Trustlines as of the latest validated ledger. Follows ``marker`` so every page is included.
 
         :param address: Wallet address
         :type address: str
@@ -515,26 +2784,28 @@ class XRPY:
 
         account_lines = AccountLines(
             account=address,
+            ledger_index='validated',
         )
-        account_lines_req = self._client.request(account_lines)
+        account_lines_req = self._request_all_pages(account_lines, 'lines')
 
         return account_lines_req
 
     def get_account_offers(self, address: str) -> Response:
         """
-        Get Account Trustlines
+        Get Account Offers as of the latest validated ledger. Follows ``marker`` so every page is included.
 
         :param address: Wallet address
         :type address: str
 
-        :return: Account Trustlines
+        :return: Account Offers
         :rtype: Response
         """
 
         account_offers = AccountOffers(
             account=address,
+            ledger_index='validated',
         )
-        account_offers_req = self._client.request(account_offers)
+        account_offers_req = self._request_all_pages(account_offers, 'offers')
 
         return account_offers_req
 
@@ -558,17 +2829,9 @@ class XRPY:
 
         """
 
-        book_offers = BookOffers(
-            taker=classic_address,
-            taker_gets=IssuedCurrencyAmount(
-                currency=taker_pays_currency,
-                value='0',
-                issuer=taker_pays_issuer,
-            ),
-            taker_pays=XRP(),
-        )
+        book_offers = _sell_book(classic_address, taker_pays_currency, taker_pays_issuer)
 
-        book_offers_req = self._client.request(book_offers)
+        book_offers_req = self._request(book_offers)
 
         return book_offers_req
 
@@ -591,65 +2854,241 @@ class XRPY:
         :rtype: Response
         """
 
-        book_offers = BookOffers(
-            taker=classic_address,
-            taker_gets=XRP(),
-            taker_pays=IssuedCurrencyAmount(
-                currency=taker_pays_currency,
-                value='0',
-                issuer=taker_pays_issuer,
-            ),
-        )
+        book_offers = _buy_book(classic_address, taker_pays_currency, taker_pays_issuer)
 
-        book_offers_req = self._client.request(book_offers)
+        book_offers_req = self._request(book_offers)
 
         return book_offers_req
 
-    def get_reserved_balance(self, address: str, include_wallet_reserve: bool = False) -> int:
+    def order_books(
+            self, classic_address: str, taker_pays_currency: Union[str, XRP], taker_pays_issuer: str
+    ) -> Tuple[Response, Response]:
+        """
+        Get both sides of an Orderbook with one :meth:`request_many` round trip
+
+        :param classic_address: Wallet address
+        :type classic_address: str
+
+        :param taker_pays_currency: Currency
+        :type taker_pays_currency: str
+
+        :param taker_pays_issuer: Issuer
+        :type taker_pays_issuer: str
+
+        :return: The :meth:`order_book_sell` and :meth:`order_book_buy` responses
+        :rtype: Tuple[Response, Response]
+        """
+
+        sell, buy = self.request_many([
+            _sell_book(classic_address, taker_pays_currency, taker_pays_issuer),
+            _buy_book(classic_address, taker_pays_currency, taker_pays_issuer),
+        ])
+
+        return sell, buy
+
+    def live_order_book(self, currency: str, issuer: str, url: Optional[str] = None) -> 'OrderBook':
+        """
+        Open a live order book of a token against XRP, kept up to date over its own WebSocket connection.
+        The caller should close it when done.
+
+        :param currency: Token currency
+        :type currency: str
+
+        :param issuer: Token issuer
+        :type issuer: str
+
+        :param url: WebSocket url (default: the url of this instance's WebsocketClient)
+        :type url: Optional[str]
+
+        :raises ValueError: If no url is given and the client is not a WebsocketClient
+
+        :return: Opened OrderBook
+        :rtype: OrderBook
         """
-        Get Reserved Balance
+
+        from .orderbook import OrderBook
+
+        if url is None:
+            if type(self._client) is not WebsocketClient:
+                raise ValueError('A live order book needs a WebSocket url')
+            url = self._client.url
+
+        order_book = OrderBook(url, IssuedCurrency(currency=currency, issuer=issuer), XRP())
+        order_book.open()
+
+        return order_book
+
+    def get_reserves(self, refresh: bool = False) -> Tuple[int, int]:
+        """
+        Get the network's base and owner reserves, read from ``server_state`` and cached for about a flag ledger
+        interval
+
+        :param refresh: Request them even if the cached ones are still valid
+        :type refresh: bool
+
+        :raises XRPLRequestFailureException: If the server_state request fails
+
+        :return: (base reserve, owner reserve per object) in drops
+        :rtype: Tuple[int, int]
+        """
+
+        if refresh:
+            self._reserves.invalidate()
+
+        reserves = self._reserves.get()
+        if reserves is not None:
+            return reserves
+
+        with self._reserve_lock:
+            reserves = self._reserves.get()
+            if reserves is None:
+                response = self._request(ServerState())
+                if not response.is_successful():
+                    raise XRPLRequestFailureException(response.result)
+                reserves = self._reserves.update(response.result)
+
+        return reserves
+
+    def _balance_and_reserve(
+            self, address: str, include_wallet_reserve: bool, ledger_index: Union[str, int]
+    ) -> Tuple[int, int]:
+        """
+        Balance and reserve of an account from one ``account_info`` and the cached reserves
 
         :param address: Wallet address
         :type address: str
 
-        :param include_wallet_reserve: Include Wallet Reserve (+10 for wallet reserve) (default: False)
+        :param include_wallet_reserve: Include the base reserve
         :type include_wallet_reserve: bool
 
-        :return: Reserved Balance
-        :rtype: Response
+        :param ledger_index: Ledger to read the account from
+        :type ledger_index: Union[str, int]
+
+        :return: (balance, reserved) in drops
+        :rtype: Tuple[int, int]
+        """
+
+        account_data = self.get_account_info(address, ledger_index).result.get('account_data', {})
+        reserved = Reserves.reserved(self.get_reserves(), account_data.get('OwnerCount', 0), include_wallet_reserve)
+
+        return int(account_data.get('Balance', 0)), reserved
+
+    def get_reserved_drops(
+            self, address: str, include_wallet_reserve: bool = False, ledger_index: Union[str, int] = 'validated'
+    ) -> int:
+        """
+        Get Reserved Balance in drops: the owner reserve of every object the account owns (trust lines, offers,
+        escrows, tickets, ...), from its ``OwnerCount``
+
+        :param address: Wallet address
+        :type address: str
+
+        :param include_wallet_reserve: Include the base reserve every account holds (default: False)
+        :type include_wallet_reserve: bool
+
+        :param ledger_index: Ledger to read the account from
+        :type ledger_index: Union[str, int]
+
+        :return: Reserved Balance in drops
+        :rtype: int
+        """
+
+        return self._balance_and_reserve(address, include_wallet_reserve, ledger_index)[1]
+
+    def get_reserved_balance(
+            self, address: str, include_wallet_reserve: bool = False, ledger_index: Union[str, int] = 'validated'
+    ) -> float:
+        """
+        Get Reserved Balance in XRP. See :meth:`get_reserved_drops` for the same figure in drops.
+
+        :param address: Wallet address
+        :type address: str
+
+        :param include_wallet_reserve: Include the base reserve every account holds (default: False)
+        :type include_wallet_reserve: bool
+
+        :param ledger_index: Ledger to read the account from
+        :type ledger_index: Union[str, int]
+
+        :return: Reserved Balance in XRP
+        :rtype: float
+        """
+
+        return float(drops_to_xrp(str(self.get_reserved_drops(address, include_wallet_reserve, ledger_index))))
+
+    def get_spendable_balance(self, address: str, ledger_index: Union[str, int] = 'validated') -> int:
         """
+        Get Spendable Balance in drops: the balance less the base and owner reserves, read with one ``account_info``
+
+        :param address: Wallet address
+        :type address: str
+
+        :param ledger_index: Ledger to read the account from
+        :type ledger_index: Union[str, int]
 
-        trust_lines = self.get_account_trustlines(address)
+        :return: Spendable Balance in drops, 0 if the balance does not cover the reserve
+        :rtype: int
+        """
 
-        result = 2 * len(trust_lines.result.get('lines', 0))
-        if include_wallet_reserve is True:
-            result += 10
+        balance, reserved = self._balance_and_reserve(address, True, ledger_index)
 
-        return result
+        return max(balance - reserved, 0)
 
-    def get_balance(self, address: str, include_wallet_reserve: bool = True) -> Union[float, int]:
+    def get_balance(
+            self, address: str, include_wallet_reserve: bool = True, ledger_index: Union[str, int] = 'validated'
+    ) -> Union[float, int]:
         """
         Get Balance in drops
 
         :param address: Wallet address
         :type address: str
 
-        :param include_wallet_reserve: Include Wallet Reserve (+10 for wallet reserve) (default: False)
+        :param include_wallet_reserve: Include the reserved drops; False gives :meth:`get_spendable_balance`
+            (default: True)
         :type include_wallet_reserve: bool
 
+        :param ledger_index: Ledger to read the balance from
+        :type ledger_index: Union[str, int]
+
         :return: Balance in drops
         :rtype: Response
         """
 
-        account_info = xrpl_get_account_info(address, self._client)
+        if include_wallet_reserve is False:
+            return float(self.get_spendable_balance(address, ledger_index))
 
-        result = float(account_info.result.get('account_data', {}).get('Balance', 0)) or 0
+        account_info = self.get_account_info(address, ledger_index)
 
-        if include_wallet_reserve is False:
-            reserved = self.get_reserved_balance(address, True)
-            result -= reserved
+        return float(account_info.result.get('account_data', {}).get('Balance', 0)) or 0.0
+
+    def get_balances(
+            self, addresses: Iterable[str], include_wallet_reserve: bool = True,
+            ledger_index: Union[str, int] = 'validated', max_workers: int = None
+    ) -> Iterator[Tuple[str, Union[float, Exception]]]:
+        """
+        Get Balance in drops for many addresses. See :meth:`get_account_infos` for how the batch runs.
+
+        :param addresses: Wallet addresses
+        :type addresses: Iterable[str]
+
+        :param include_wallet_reserve: Include the reserved drops; False gives spendable balances (default: True)
+        :type include_wallet_reserve: bool
+
+        :param ledger_index: Ledger to read from: an index, or 'validated', 'current' or 'closed'
+        :type ledger_index: Union[str, int]
+
+        :param max_workers: max number of concurrent requests
+        :type max_workers: int
 
-        return float(result)
+        :return: (address, balance or exception) pairs, in completion order
+        :rtype: Iterator[Tuple[str, Union[float, Exception]]]
+        """
+
+        ledger_index = self._pin_ledger_index(ledger_index)
+
+        yield from self._map_addresses(
+            lambda address: self.get_balance(address, include_wallet_reserve, ledger_index), addresses, max_workers
+        )
 
     def __str__(self):
         return f'XRPY Client: {self._client}, Version: {__version__}'
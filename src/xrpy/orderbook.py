@@ -0,0 +1,498 @@
+from decimal import Decimal
+from heapq import heapify, heappop, heappush
+from threading import Lock, Thread
+
+
+from typing import Optional, Dict, Iterator, List, Set, Tuple, Union
+
+
+from xrpl.clients import WebsocketClient, XRPLRequestFailureException
+from xrpl.models.currencies import Currency, XRP
+from xrpl.models.requests import Subscribe, Unsubscribe, SubscribeBook
+from xrpl.utils import drops_to_xrp
+
+
+__all__ = [
+    'OrderBook',
+]
+
+
+# Seconds the listener waits for a message before checking whether the book was closed.
+_LISTEN_TIMEOUT = 1.0
+
+# Seconds close() waits for the listener thread to stop.
+_CLOSE_TIMEOUT = 5.0
+
+# Type of the message close() puts on a caller's client to wake a listener blocked without a timeout.
+_WAKE = '_xrpy_close'
+
+# Taker used for the book subscription when none is given (ACCOUNT_ONE, owns nothing).
+_TAKER = 'rrrrrrrrrrrrrrrrrrrrBZbvji'
+
+
+class _BookSide:
+    """
+    One side of an order book: offers keyed by ledger index, aggregated into price levels on a heap with the best
+    price on top.
+
+    Emptied levels stay on the heap until they reach the top or outnumber the live ones, so the best price is the
+    first entry, adding or removing an offer is O(log n) amortized, and walking the best k levels is O(k log k).
+    """
+
+    def __init__(self, descending: bool):
+        """
+        One side of an order book.
+
+        :param descending: True for bids (best price is the highest), False for asks (best price is the lowest)
+        :type descending: bool
+        """
+
+        self.descending = descending
+
+        # Heap of prices for asks and of negated prices for bids, one entry per price, emptied levels included.
+        self._heap: List[Decimal] = []
+        self._levels: Dict[Decimal, List] = {}
+        self._stale: Set[Decimal] = set()
+        self._offers: Dict[str, Tuple[Decimal, Decimal]] = {}
+
+    def _key(self, price: Decimal) -> Decimal:
+        return -price if self.descending else price
+
+    def set(self, index: str, price: Decimal, quantity: Decimal) -> None:
+        """
+        Add, change or (with a zero quantity) remove an offer
+
+        :param index: Ledger index of the Offer object
+        :type index: str
+
+        :param price: Price in quote currency per unit of base currency
+        :type price: Decimal
+
+        :param quantity: Base currency amount
+        :type quantity: Decimal
+
+        :return: None
+        """
+
+        self.remove(index)
+        if quantity <= 0:
+            return
+
+        level = self._levels.get(price)
+        if level is None:
+            self._levels[price] = [quantity, 1]
+            if price in self._stale:
+                self._stale.discard(price)
+            else:
+                heappush(self._heap, self._key(price))
+        else:
+            level[0] += quantity
+            level[1] += 1
+
+        self._offers[index] = (price, quantity)
+
+    def remove(self, index: str) -> None:
+        """
+        Remove an offer if it is on this side
+
+        :param index: Ledger index of the Offer object
+        :type index: str
+
+        :return: None
+        """
+
+        offer = self._offers.pop(index, None)
+        if offer is None:
+            return
+
+        price, quantity = offer
+        level = self._levels[price]
+        level[0] -= quantity
+        level[1] -= 1
+
+        if level[1] == 0:
+            del self._levels[price]
+            self._stale.add(price)
+            if len(self._stale) > len(self._levels):
+                self._heap = [self._key(price) for price in self._levels]
+                heapify(self._heap)
+                self._stale.clear()
+
+            # Keep a live level on top, so the best price is always the first entry.
+            while self._heap and self._key(self._heap[0]) in self._stale:
+                self._stale.discard(self._key(heappop(self._heap)))
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._levels.clear()
+        self._stale.clear()
+        self._offers.clear()
+
+    def _prices(self) -> Iterator[Decimal]:
+        """
+        Prices of the live levels from the best price outwards, found by walking the heap from the top down
+
+        :return: Prices
+        :rtype: Iterator[Decimal]
+        """
+
+        heap = self._heap
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier:
+            key, position = heappop(frontier)
+            price = self._key(key)
+            if price not in self._stale:
+                yield price
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(heap):
+                    heappush(frontier, (heap[child], child))
+
+    def best(self) -> Optional[Tuple[Decimal, Decimal]]:
+        if not self._heap:
+            return None
+
+        price = self._key(self._heap[0])
+        return price, self._levels[price][0]
+
+    def levels(self, count: Optional[int] = None) -> List[Tuple[Decimal, Decimal]]:
+        """
+        Price levels from the best price outwards
+
+        :param count: Number of levels, all of them if None
+        :type count: Optional[int]
+
+        :return: (price, quantity) pairs
+        :rtype: List[Tuple[Decimal, Decimal]]
+        """
+
+        result = []
+        for price in self._prices():
+            if count is not None and len(result) >= count:
+                break
+            result.append((price, self._levels[price][0]))
+
+        return result
+
+    def vwap(self, size: Decimal) -> Optional[Decimal]:
+        """
+        Average price of filling ``size`` against this side, walking levels from the best price outwards
+
+        :param size: Base currency amount
+        :type size: Decimal
+
+        :return: Volume-weighted average price, or None if the side is too thin to fill ``size``
+        :rtype: Optional[Decimal]
+        """
+
+        remaining, cost = size, Decimal(0)
+
+        for price in self._prices():
+            filled = min(remaining, self._levels[price][0])
+            cost += filled * price
+            remaining -= filled
+            if remaining <= 0:
+                return cost / size
+
+        return None
+
+    def __len__(self):
+        return len(self._offers)
+
+
+class OrderBook:
+    """
+    A local copy of one order book, kept up to date from a WebSocket ``books`` subscription.
+
+    On :meth:`open` the book subscribes with ``snapshot`` and ``both`` set, loads both sides from the snapshot, and
+    then applies the Offer changes of every validated transaction the server streams. Offers are aggregated into
+    price levels kept on a heap per side, so best bid/ask are O(1), updates are O(log n) amortized, and depth and VWAP
+    queries only walk the levels they need, in O(k log k) for k levels. No query makes a network call.
+
+    Prices are in quote currency per unit of base currency, quantities in base currency; XRP amounts are converted
+    from drops. Quantities are the offers' stated amounts; offers that are only partially funded are not scaled down.
+
+    The book reads every message of its client, so it needs a client of its own: pass a url, or a WebsocketClient not
+    used for anything else.
+    """
+
+    def __init__(self, client: Union[WebsocketClient, str], base: Currency, quote: Currency = XRP(),
+                 taker: str = _TAKER):
+        """
+        A local copy of one order book, kept up to date from a WebSocket subscription.
+
+        :param client: WebSocket url, or a dedicated WebsocketClient
+        :type client: Union[WebsocketClient, str]
+
+        :param base: Currency being bought and sold
+        :type base: Currency
+
+        :param quote: Currency prices are expressed in
+        :type quote: Currency
+
+        :param taker: Account the book is seen from
+        :type taker: str
+        """
+
+        self._owns_client = type(client) is str
+        self._client = WebsocketClient(client, timeout=_LISTEN_TIMEOUT) if self._owns_client else client
+
+        self.base = base
+        self.quote = quote
+        self.taker = taker
+
+        self.ledger_index: Optional[int] = None
+
+        self._bids = _BookSide(descending=True)
+        self._asks = _BookSide(descending=False)
+        self._lock = Lock()
+        self._thread: Optional[Thread] = None
+        self._running = False
+
+    @property
+    def _book(self) -> SubscribeBook:
+        return SubscribeBook(
+            taker_gets=self.base,
+            taker_pays=self.quote,
+            taker=self.taker,
+            snapshot=True,
+            both=True,
+        )
+
+    def open(self) -> None:
+        """
+        Subscribe, load the snapshot and start applying updates on a background thread.
+
+        :raises XRPLRequestFailureException: If the subscription fails
+
+        :return: None
+        """
+
+        if self._running:
+            return
+
+        self._client.open()
+
+        response = self._client.request(Subscribe(books=[self._book]))
+        if not response.is_successful():
+            raise XRPLRequestFailureException(response.result)
+
+        with self._lock:
+            self._bids.clear()
+            self._asks.clear()
+            for offer in response.result.get('bids', []) + response.result.get('asks', []):
+                self._apply(offer['index'], offer)
+
+        self._running = True
+        self._thread = Thread(target=self._listen, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """
+        Stop applying updates. The client is closed if the book opened it, otherwise it is unsubscribed and left open.
+        Either way the listener thread is stopped and joined.
+
+        :return: None
+        """
+
+        if not self._running:
+            return
+
+        self._running = False
+        if not self._owns_client and self._client.is_open():
+            self._client.send(Unsubscribe(books=[self._book]))
+            self._wake()
+        self._thread.join(_CLOSE_TIMEOUT)
+        if self._owns_client:
+            self._client.close()
+
+        self._thread = None
+
+    def __enter__(self) -> 'OrderBook':
+        self.open()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _wake(self) -> None:
+        # A caller's client may have no timeout, leaving the listener blocked until the next message: hand it one.
+        self._client._loop.call_soon_threadsafe(self._client._messages.put_nowait, {'type': _WAKE})
+
+    def _listen(self) -> None:
+        # Iteration ends when the client's timeout passes without a message; keep listening until closed.
+        while self._running and self._client.is_open():
+            for message in self._client:
+                if not self._running:
+                    return
+                if message.get('type') == 'transaction' and message.get('validated') is not False:
+                    self.apply_transaction(message)
+
+    @staticmethod
+    def _matches(amount: Union[str, Dict], currency: Currency) -> bool:
+        if isinstance(amount, str):
+            return isinstance(currency, XRP)
+        return not isinstance(currency, XRP) and \
+            amount.get('currency') == currency.currency and amount.get('issuer') == currency.issuer
+
+    @staticmethod
+    def _value(amount: Union[str, Dict]) -> Decimal:
+        if isinstance(amount, str):
+            return drops_to_xrp(amount)
+        return Decimal(amount['value'])
+
+    def _apply(self, index: str, fields: Dict) -> None:
+        """
+        Put an Offer on the side it belongs to. Must be called with the lock held.
+
+        :param index: Ledger index of the Offer object
+        :type index: str
+
+        :param fields: Offer fields (TakerGets and TakerPays)
+        :type fields: Dict
+
+        :return: None
+        """
+
+        taker_gets, taker_pays = fields.get('TakerGets'), fields.get('TakerPays')
+        if taker_gets is None or taker_pays is None:
+            return
+
+        if self._matches(taker_gets, self.base) and self._matches(taker_pays, self.quote):
+            # Ask: the owner sells base for quote.
+            quantity = self._value(taker_gets)
+            if quantity > 0:
+                self._asks.set(index, self._value(taker_pays) / quantity, quantity)
+            else:
+                self._asks.remove(index)
+        elif self._matches(taker_gets, self.quote) and self._matches(taker_pays, self.base):
+            # Bid: the owner buys base with quote.
+            quantity = self._value(taker_pays)
+            if quantity > 0:
+                self._bids.set(index, self._value(taker_gets) / quantity, quantity)
+            else:
+                self._bids.remove(index)
+
+    def apply_transaction(self, message: Dict) -> None:
+        """
+        Apply the Offer changes of a streamed transaction. Called by the listener thread for every message.
+
+        :param message: ``transaction`` stream message
+        :type message: Dict
+
+        :return: None
+        """
+
+        nodes = message.get('meta', {}).get('AffectedNodes', [])
+
+        with self._lock:
+            for wrapper in nodes:
+                node_type, node = next(iter(wrapper.items()))
+                if node.get('LedgerEntryType') != 'Offer':
+                    continue
+
+                index = node['LedgerIndex']
+                if node_type == 'DeletedNode':
+                    self._bids.remove(index)
+                    self._asks.remove(index)
+                else:
+                    self._apply(index, node.get('NewFields') or node.get('FinalFields') or {})
+
+            if message.get('ledger_index') is not None:
+                self.ledger_index = message['ledger_index']
+
+    def best_bid(self) -> Optional[Tuple[Decimal, Decimal]]:
+        """
+        Highest bid
+
+        :return: (price, quantity at that price), or None if there are no bids
+        :rtype: Optional[Tuple[Decimal, Decimal]]
+        """
+
+        with self._lock:
+            return self._bids.best()
+
+    def best_ask(self) -> Optional[Tuple[Decimal, Decimal]]:
+        """
+        Lowest ask
+
+        :return: (price, quantity at that price), or None if there are no asks
+        :rtype: Optional[Tuple[Decimal, Decimal]]
+        """
+
+        with self._lock:
+            return self._asks.best()
+
+    def spread(self) -> Optional[Decimal]:
+        """
+        Lowest ask minus highest bid
+
+        :return: Spread, or None if a side is empty
+        :rtype: Optional[Decimal]
+        """
+
+        with self._lock:
+            bid, ask = self._bids.best(), self._asks.best()
+
+        if bid is None or ask is None:
+            return None
+        return ask[0] - bid[0]
+
+    def depth(self, side: str, levels: Optional[int] = None) -> List[Tuple[Decimal, Decimal]]:
+        """
+        Price levels of one side, best price first
+
+        :param side: 'bids' or 'asks'
+        :type side: str
+
+        :param levels: Number of levels, all of them if None
+        :type levels: Optional[int]
+
+        :raises ValueError: If side is not 'bids' or 'asks'
+
+        :return: (price, quantity) pairs
+        :rtype: List[Tuple[Decimal, Decimal]]
+        """
+
+        with self._lock:
+            return self._side(side).levels(levels)
+
+    def vwap(self, side: str, size: Union[Decimal, int, float, str]) -> Optional[Decimal]:
+        """
+        Average price of filling ``size`` units of base currency against one side of the book
+
+        Buying walks the asks, selling walks the bids.
+
+        :param side: 'buy' or 'sell'
+        :type side: str
+
+        :param size: Base currency amount
+        :type size: Union[Decimal, int, float, str]
+
+        :raises ValueError: If side is not 'buy' or 'sell', or size is not positive
+
+        :return: Volume-weighted average price, or None if the book is too thin to fill ``size``
+        :rtype: Optional[Decimal]
+        """
+
+        if side not in ('buy', 'sell'):
+            raise ValueError(f'Invalid side: {side}')
+
+        size = Decimal(str(size))
+        if size <= 0:
+            raise ValueError(f'Invalid size: {size}')
+
+        with self._lock:
+            return (self._asks if side == 'buy' else self._bids).vwap(size)
+
+    def _side(self, side: str) -> _BookSide:
+        if side == 'bids':
+            return self._bids
+        if side == 'asks':
+            return self._asks
+        raise ValueError(f'Invalid side: {side}')
+
+    def __len__(self):
+        return len(self._bids) + len(self._asks)
+
+    def __repr__(self):
+        return f'OrderBook({self.base.currency}/{self.quote.currency}, bids={len(self._bids)}, asks={len(self._asks)})'
@@ -0,0 +1,396 @@
+import asyncio
+import time
+
+from asyncio import AbstractEventLoop, run_coroutine_threadsafe
+from collections import deque
+from json import JSONDecodeError
+from threading import Lock, Thread
+
+
+from typing import Optional, Dict, List, Union
+
+
+from httpx import AsyncClient
+
+from xrpl.asyncio.clients import AsyncWebsocketClient
+from xrpl.clients import json_to_response, request_to_json_rpc, XRPLRequestFailureException
+from xrpl.clients.sync_client import SyncClient
+from xrpl.models.requests.request import Request
+from xrpl.models.response import Response
+
+from .constants import JsonRPCURLs, WebsocketURLs
+from .ratelimit import RateLimiter, current_priority
+
+
+__all__ = [
+    'Endpoint',
+    'ClientPool',
+]
+
+
+# Seconds a single request may take before the endpoint is considered stalled.
+_TIMEOUT = 10.0
+
+# Seconds a failed endpoint is skipped before it gets traffic again.
+_COOLDOWN = 30.0
+
+# Latency samples and outcomes kept per endpoint.
+_WINDOW = 100
+
+# rippled errors that mean the node, not the request, is the problem.
+_FAILOVER_ERRORS = frozenset({'noNetwork', 'noCurrent', 'noClosed', 'tooBusy', 'slowDown', 'amendmentBlocked'})
+
+
+async def post_json_rpc(http_client: AsyncClient, url: str, request: Request) -> Response:
+    """
+    Send a JSON-RPC request over an open HTTP session
+
+    :param http_client: HTTP session
+    :type http_client: AsyncClient
+
+    :param url: JSON-RPC url
+    :type url: str
+
+    :param request: Request to send
+    :type request: Request
+
+    :raises XRPLRequestFailureException: If the response can't be decoded
+
+    :return: Response
+    :rtype: Response
+    """
+
+    response = await http_client.post(url, json=request_to_json_rpc(request))
+    try:
+        return json_to_response(response.json())
+    except JSONDecodeError:
+        raise XRPLRequestFailureException({
+            'error': response.status_code,
+            'error_message': response.text,
+        })
+
+
+class Endpoint:
+    """
+    One rippled server in a :class:`ClientPool`, with its persistent connection and health statistics.
+
+    JSON-RPC endpoints keep an HTTP keep-alive session, WebSocket endpoints keep their socket open. Both live on the
+    pool's event loop.
+    """
+
+    def __init__(self, url: str, window: int = _WINDOW):
+        """
+        One rippled server in a ClientPool.
+
+        :param url: JSON-RPC (http/https) or WebSocket (ws/wss) url
+        :type url: str
+
+        :param window: Number of recent requests the statistics are computed over
+        :type window: int
+        """
+
+        self.url = url
+        self.unhealthy_until = 0.0
+
+        self._latencies = deque(maxlen=window)
+        self._failures = deque(maxlen=window)
+        self._connection: Optional[Union[AsyncClient, AsyncWebsocketClient]] = None
+
+    @property
+    def is_websocket(self) -> bool:
+        return self.url.startswith(('ws://', 'wss://'))
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.unhealthy_until
+
+    def latency(self, percentile: float) -> Optional[float]:
+        """
+        Latency percentile over the recent successful requests
+
+        :param percentile: Percentile between 0 and 100
+        :type percentile: float
+
+        :return: Latency in seconds, or None if nothing was measured yet
+        :rtype: Optional[float]
+        """
+
+        if not self._latencies:
+            return None
+
+        samples = sorted(self._latencies)
+        return samples[min(len(samples) - 1, int(len(samples) * percentile / 100))]
+
+    @property
+    def error_rate(self) -> float:
+        return sum(self._failures) / len(self._failures) if self._failures else 0.0
+
+    def record_success(self, latency: float) -> None:
+        self._latencies.append(latency)
+        self._failures.append(False)
+
+    def record_failure(self, cooldown: float) -> None:
+        self._failures.append(True)
+        self.unhealthy_until = time.monotonic() + cooldown
+
+    def stats(self) -> Dict:
+        """
+        Snapshot of the endpoint statistics
+
+        :return: p50/p99 latency in seconds, error rate, health and sample count
+        :rtype: Dict
+        """
+
+        return {
+            'p50': self.latency(50),
+            'p99': self.latency(99),
+            'error_rate': self.error_rate,
+            'healthy': self.healthy,
+            'requests': len(self._failures),
+        }
+
+    async def request(self, request: Request) -> Response:
+        """
+        Send a request over the persistent connection, opening it first if needed. Must run on the pool's loop.
+
+        :param request: Request to send
+        :type request: Request
+
+        :raises XRPLRequestFailureException: If a JSON-RPC response can't be decoded
+
+        :return: Response
+        :rtype: Response
+        """
+
+        if self.is_websocket:
+            if self._connection is None or not self._connection.is_open():
+                self._connection = AsyncWebsocketClient(self.url)
+                await self._connection.open()
+            return await self._connection.request(request)
+
+        if self._connection is None:
+            self._connection = AsyncClient(timeout=None)
+
+        return await post_json_rpc(self._connection, self.url, request)
+
+    async def close(self) -> None:
+        if self._connection is None:
+            return
+
+        if self.is_websocket:
+            if self._connection.is_open():
+                await self._connection.close()
+        else:
+            await self._connection.aclose()
+
+        self._connection = None
+
+    def __repr__(self):
+        return f'Endpoint({self.url!r}, p50={self.latency(50)}, error_rate={self.error_rate:.2f})'
+
+
+class ClientPool(SyncClient):
+    """
+    A client that spreads requests over several rippled servers.
+
+    Every request goes to the healthy endpoint with the lowest p50 latency (endpoints without measurements are tried
+    first, so every node gets probed). An endpoint that times out, fails to connect or answers with a node-level error
+    such as ``tooBusy`` is put in cooldown and the request fails over to the next one.
+
+    Connections are persistent and live on a background event loop owned by the pool, so the pool can be shared by
+    many threads. It can be passed anywhere a JsonRpcClient is accepted.
+
+    With a :class:`xrpy.RateLimiter`, every request waits for a token of the endpoint it is sent to, and throttling
+    answers slow that endpoint down as well as failing over.
+    """
+
+    def __init__(self, urls: List[str], timeout: float = _TIMEOUT, cooldown: float = _COOLDOWN,
+                 window: int = _WINDOW, rate_limiter: Optional[RateLimiter] = None):
+        """
+        A client that spreads requests over several rippled servers.
+
+        :param urls: JSON-RPC and/or WebSocket urls
+        :type urls: List[str]
+
+        :param timeout: Seconds before a request to one endpoint is abandoned
+        :type timeout: float
+
+        :param cooldown: Seconds a failed endpoint is skipped
+        :type cooldown: float
+
+        :param window: Number of recent requests the endpoint statistics are computed over
+        :type window: int
+
+        :param rate_limiter: Limit the requests sent to every endpoint with this
+        :type rate_limiter: Optional[RateLimiter]
+
+        :raises ValueError: If no urls are given
+        """
+
+        if not urls:
+            raise ValueError('ClientPool needs at least one url')
+
+        super().__init__(urls[0])
+
+        self.timeout = timeout
+        self.cooldown = cooldown
+        self.endpoints = [Endpoint(url, window) for url in urls]
+        self.rate_limiter = rate_limiter
+
+        self._lock = Lock()
+        self._loop: Optional[AbstractEventLoop] = None
+        self._thread: Optional[Thread] = None
+
+    @classmethod
+    def mainnet(cls, websocket: bool = False, **kwargs) -> 'ClientPool':
+        """
+        Pool over every mainnet server listed in :mod:`xrpy.constants`
+
+        :param websocket: Use the WebSocket urls instead of the JSON-RPC ones
+        :type websocket: bool
+
+        :return: ClientPool
+        :rtype: ClientPool
+        """
+
+        urls = WebsocketURLs if websocket is True else JsonRPCURLs
+        return cls([value for name, value in vars(urls).items() if 'MAINNET' in name], **kwargs)
+
+    def open(self) -> None:
+        """
+        Start the background event loop. Called automatically by the first request.
+
+        :return: None
+        """
+
+        with self._lock:
+            if self._loop is not None:
+                return
+
+            self._loop = asyncio.new_event_loop()
+            self._thread = Thread(target=self._loop.run_forever, daemon=True)
+            self._thread.start()
+
+    def close(self) -> None:
+        """
+        Close every connection and stop the background event loop.
+
+        :return: None
+        """
+
+        with self._lock:
+            if self._loop is None:
+                return
+
+            run_coroutine_threadsafe(self._close_endpoints(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+            self._loop = None
+            self._thread = None
+
+    def __enter__(self) -> 'ClientPool':
+        self.open()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def stats(self) -> Dict[str, Dict]:
+        """
+        Per-endpoint latency, error rate and health
+
+        :return: Statistics keyed by url
+        :rtype: Dict[str, Dict]
+        """
+
+        return {endpoint.url: endpoint.stats() for endpoint in self.endpoints}
+
+    def _ranked(self) -> List[Endpoint]:
+        """
+        Endpoints in the order they should be tried: healthy ones by p50 latency, then the ones in cooldown.
+
+        :return: Endpoints
+        :rtype: List[Endpoint]
+        """
+
+        def key(endpoint: Endpoint):
+            p50 = endpoint.latency(50)
+            return not endpoint.healthy, p50 is not None, p50 or 0.0
+
+        return sorted(self.endpoints, key=key)
+
+    async def _close_endpoints(self) -> None:
+        await asyncio.gather(*(endpoint.close() for endpoint in self.endpoints), return_exceptions=True)
+
+    async def _route(self, request: Request, priority: int) -> Response:
+        """
+        Send a request to the best endpoint, failing over to the others. Runs on the pool's loop.
+
+        :param request: Request to send
+        :type request: Request
+
+        :param priority: Priority of the request in the rate limiter's queue
+        :type priority: int
+
+        :raises XRPLRequestFailureException: If every endpoint failed
+
+        :return: Response
+        :rtype: Response
+        """
+
+        errors = {}
+
+        for endpoint in self._ranked():
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(endpoint.url, priority)
+
+            started = time.monotonic()
+            try:
+                response = await asyncio.wait_for(endpoint.request(request), self.timeout)
+            except Exception as e:
+                endpoint.record_failure(self.cooldown)
+                errors[endpoint.url] = repr(e)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.report(endpoint.url, None)
+                continue
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.report(endpoint.url, response)
+
+            if not response.is_successful() and response.result.get('error') in _FAILOVER_ERRORS:
+                endpoint.record_failure(self.cooldown)
+                errors[endpoint.url] = response.result.get('error')
+                continue
+
+            endpoint.record_success(time.monotonic() - started)
+            return response
+
+        raise XRPLRequestFailureException({
+            'error': 'allEndpointsFailed',
+            'error_message': f'Every endpoint failed: {errors}',
+        })
+
+    def request(self, request: Request) -> Response:
+        """
+        Makes a request with this pool and returns the response.
+
+        :param request: Request to send
+        :type request: Request
+
+        :return: Response
+        :rtype: Response
+        """
+
+        self.open()
+        return run_coroutine_threadsafe(self._route(request, current_priority()), self._loop).result()
+
+    async def _request_impl(self, request: Request) -> Response:
+        self.open()
+        return await asyncio.wrap_future(
+            run_coroutine_threadsafe(self._route(request, current_priority()), self._loop)
+        )
+
+    def __repr__(self):
+        return f'ClientPool({[endpoint.url for endpoint in self.endpoints]})'
@@ -0,0 +1,333 @@
+import asyncio
+import heapq
+import time
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import count
+from threading import Condition
+
+
+from typing import Optional, Dict, List, Tuple, Iterator
+
+
+from xrpl.models.response import Response
+
+
+__all__ = [
+    'RateLimiter',
+    'request_priority',
+    'current_priority',
+    'PRIORITY_INTERACTIVE',
+    'PRIORITY_BULK',
+    'THROTTLE_ERRORS',
+]
+
+
+# Priority of single calls; waiting requests with a lower number go first.
+PRIORITY_INTERACTIVE = 0
+
+# Priority of the bulk methods (get_balances, get_account_infos, submit_many, exports).
+PRIORITY_BULK = 10
+
+# rippled errors that mean the client is sending too much.
+THROTTLE_ERRORS = frozenset({'slowDown', 'tooBusy'})
+
+# Default requests per second per endpoint, well under the limits public servers enforce.
+_RATE = 10.0
+
+# Default number of requests that can be sent at once after a quiet period.
+_BURST = 20
+
+# Lowest rate backoff can bring an endpoint down to, in requests per second.
+_MIN_RATE = 0.5
+
+# Rate multiplier applied when an endpoint throttles, and share of the configured rate won back per success.
+_DECREASE = 0.5
+_INCREASE = 0.05
+
+# Seconds an endpoint is paused after it throttles; doubled while it keeps throttling, up to the maximum.
+_BACKOFF = 1.0
+_MAX_BACKOFF = 30.0
+
+# Times a throttled read is sent again after backing off.
+_MAX_RETRIES = 3
+
+# Longest sleep of an asyncio waiter between two checks of its bucket.
+_POLL = 0.05
+
+
+_priority: ContextVar[int] = ContextVar('xrpy_request_priority', default=PRIORITY_INTERACTIVE)
+
+
+def current_priority() -> int:
+    """
+    Priority of the requests made in the current context
+
+    :return: Priority, lower first
+    :rtype: int
+    """
+
+    return _priority.get()
+
+
+@contextmanager
+def request_priority(priority: int) -> Iterator[int]:
+    """
+    Give the requests made inside the block (in this thread or task) a priority in the :class:`RateLimiter` queue,
+    e.g. ``with request_priority(PRIORITY_BULK):`` around a batch job so interactive calls are sent first
+
+    :param priority: Priority, lower first
+    :type priority: int
+
+    :return: The priority
+    :rtype: Iterator[int]
+    """
+
+    token = _priority.set(priority)
+    try:
+        yield priority
+    finally:
+        _priority.reset(token)
+
+
+class _Bucket:
+    """
+    Token bucket and waiting queue of one endpoint.
+    """
+
+    __slots__ = ('rate', 'tokens', 'updated', 'paused_until', 'backoff', 'waiting', 'throttled', 'sent')
+
+    def __init__(self, rate: float, burst: int, backoff: float):
+        self.rate = rate
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.backoff = backoff
+        self.waiting: List[Tuple[int, int]] = []
+        self.throttled = 0
+        self.sent = 0
+
+
+class RateLimiter:
+    """
+    Client-side token bucket rate limiter, one bucket per endpoint url, with adaptive backoff and a priority queue.
+
+    Every request takes a token from its endpoint's bucket, which refills at ``rate`` tokens per second up to
+    ``burst``. Requests waiting for a token are served by priority (see :func:`request_priority`), then in arrival
+    order, so interactive calls are not stuck behind a bulk job.
+
+    When an endpoint answers ``slowDown`` or ``tooBusy``, or drops the connection, its bucket is paused for a backoff
+    that doubles while the endpoint keeps throttling, and its rate is halved. Every successful request wins back a
+    little of the configured rate. The limiter does no network I/O itself; the client calls :meth:`acquire` before a
+    request and :meth:`report` after it. It is thread-safe and can be shared by several clients and event loops.
+    """
+
+    def __init__(self, rate: float = _RATE, burst: int = _BURST, min_rate: float = _MIN_RATE,
+                 backoff: float = _BACKOFF, max_backoff: float = _MAX_BACKOFF, max_retries: int = _MAX_RETRIES):
+        """
+        Client-side token bucket rate limiter.
+
+        :param rate: Requests per second per endpoint
+        :type rate: float
+
+        :param burst: Requests that can be sent at once after a quiet period
+        :type burst: int
+
+        :param min_rate: Lowest rate backoff can bring an endpoint down to
+        :type min_rate: float
+
+        :param backoff: Seconds an endpoint is paused the first time it throttles
+        :type backoff: float
+
+        :param max_backoff: Longest pause
+        :type max_backoff: float
+
+        :param max_retries: Times a throttled read is sent again
+        :type max_retries: int
+
+        :raises ValueError: If rate or burst is not positive
+        """
+
+        if rate <= 0 or burst < 1:
+            raise ValueError('The rate and burst of a RateLimiter must be positive')
+
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retries = max_retries
+
+        self._condition = Condition()
+        self._buckets: Dict[str, _Bucket] = {}
+        self._tickets = count()
+
+    def _bucket(self, url: str) -> _Bucket:
+        bucket = self._buckets.get(url)
+        if bucket is None:
+            bucket = self._buckets[url] = _Bucket(self.rate, self.burst, self.backoff)
+        return bucket
+
+    def _take(self, bucket: _Bucket, ticket: Tuple[int, int]) -> Optional[float]:
+        """
+        Give ``ticket`` a token if it is first in line and one is available. Must hold the condition.
+
+        :param bucket: Endpoint bucket
+        :type bucket: _Bucket
+
+        :param ticket: (priority, arrival) of the waiting request
+        :type ticket: Tuple[int, int]
+
+        :return: 0 if the token was taken, seconds until it is worth checking again, or None to wait until the requests
+            ahead of it are served
+        :rtype: Optional[float]
+        """
+
+        now = time.monotonic()
+        bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * bucket.rate)
+        bucket.updated = now
+
+        if now < bucket.paused_until:
+            return bucket.paused_until - now
+        if bucket.waiting[0] != ticket:
+            return None
+        if bucket.tokens < 1:
+            return (1 - bucket.tokens) / bucket.rate
+
+        bucket.tokens -= 1
+        bucket.sent += 1
+        heapq.heappop(bucket.waiting)
+        self._condition.notify_all()
+        return 0.0
+
+    def _leave(self, bucket: _Bucket, ticket: Tuple[int, int]) -> None:
+        if ticket in bucket.waiting:
+            bucket.waiting.remove(ticket)
+            heapq.heapify(bucket.waiting)
+            self._condition.notify_all()
+
+    def acquire(self, url: str, priority: Optional[int] = None) -> float:
+        """
+        Wait for a token of an endpoint, blocking the calling thread
+
+        :param url: Endpoint url
+        :type url: str
+
+        :param priority: Priority in the queue (default: :func:`current_priority`)
+        :type priority: Optional[int]
+
+        :return: Seconds waited
+        :rtype: float
+        """
+
+        started = time.monotonic()
+        priority = current_priority() if priority is None else priority
+
+        with self._condition:
+            bucket = self._bucket(url)
+            ticket = (priority, next(self._tickets))
+            heapq.heappush(bucket.waiting, ticket)
+
+            try:
+                delay = self._take(bucket, ticket)
+                while delay != 0:
+                    self._condition.wait(delay)
+                    delay = self._take(bucket, ticket)
+            finally:
+                self._leave(bucket, ticket)
+
+        return time.monotonic() - started
+
+    async def acquire_async(self, url: str, priority: Optional[int] = None) -> float:
+        """
+        Wait for a token of an endpoint without blocking the event loop
+
+        :param url: Endpoint url
+        :type url: str
+
+        :param priority: Priority in the queue (default: :func:`current_priority`)
+        :type priority: Optional[int]
+
+        :return: Seconds waited
+        :rtype: float
+        """
+
+        started = time.monotonic()
+        priority = current_priority() if priority is None else priority
+
+        with self._condition:
+            bucket = self._bucket(url)
+            ticket = (priority, next(self._tickets))
+            heapq.heappush(bucket.waiting, ticket)
+
+        try:
+            while True:
+                with self._condition:
+                    delay = self._take(bucket, ticket)
+                if delay == 0:
+                    break
+                await asyncio.sleep(_POLL if delay is None else min(delay, _POLL))
+        finally:
+            with self._condition:
+                self._leave(bucket, ticket)
+
+        return time.monotonic() - started
+
+    def report(self, url: str, response: Optional[Response]) -> bool:
+        """
+        Report the outcome of a request to an endpoint, to back off when it throttles
+
+        :param url: Endpoint url
+        :type url: str
+
+        :param response: Response, or None if the request failed without one (e.g. a dropped connection)
+        :type response: Optional[Response]
+
+        :return: True if the endpoint throttled the request
+        :rtype: bool
+        """
+
+        throttled = response is None or \
+            (not response.is_successful() and response.result.get('error') in THROTTLE_ERRORS)
+
+        with self._condition:
+            bucket = self._bucket(url)
+            if throttled and time.monotonic() < bucket.paused_until:
+                # Another request of the same burst was throttled already; back off once per burst.
+                bucket.throttled += 1
+            elif throttled:
+                bucket.rate = max(self.min_rate, bucket.rate * _DECREASE)
+                bucket.tokens = 0.0
+                bucket.paused_until = time.monotonic() + bucket.backoff
+                bucket.backoff = min(self.max_backoff, bucket.backoff * 2)
+                bucket.throttled += 1
+            else:
+                bucket.rate = min(self.rate, bucket.rate + self.rate * _INCREASE)
+                bucket.backoff = self.backoff
+
+        return throttled
+
+    def stats(self) -> Dict[str, Dict]:
+        """
+        Per-endpoint rate, queue length and counters
+
+        :return: Current rate, waiting requests, paused seconds left, sent and throttled requests, keyed by url
+        :rtype: Dict[str, Dict]
+        """
+
+        now = time.monotonic()
+        with self._condition:
+            return {
+                url: {
+                    'rate': bucket.rate,
+                    'waiting': len(bucket.waiting),
+                    'paused': max(0.0, bucket.paused_until - now),
+                    'sent': bucket.sent,
+                    'throttled': bucket.throttled,
+                }
+                for url, bucket in self._buckets.items()
+            }
+
+    def __repr__(self):
+        return f'RateLimiter(rate={self.rate}, burst={self.burst}, endpoints={len(self._buckets)})'
@@ -0,0 +1,272 @@
+import sys
+
+from decimal import Decimal
+from functools import lru_cache
+
+
+from typing import Optional, Dict, Union
+
+
+__all__ = [
+    'Amount',
+    'TrustLine',
+    'Offer',
+]
+
+
+# Distinct amount strings whose parsed Decimal is shared between records. Limits and zero balances repeat across
+# most trust lines, so sharing them saves a Decimal per field.
+_SHARED_DECIMALS = 4096
+
+
+@lru_cache(maxsize=_SHARED_DECIMALS)
+def _decimal(value: str) -> Decimal:
+    return Decimal(value)
+
+
+class Amount:
+    """
+    A parsed currency amount: drops as an int for XRP, a Decimal for tokens.
+    """
+
+    __slots__ = ('currency', 'issuer', 'value')
+
+    def __init__(self, currency: str, issuer: Optional[str], value: Union[int, Decimal]):
+        """
+        A parsed currency amount.
+
+        :param currency: Currency code, ``'XRP'`` for XRP
+        :type currency: str
+
+        :param issuer: Issuer address, None for XRP
+        :type issuer: Optional[str]
+
+        :param value: Drops for XRP, token amount otherwise
+        :type value: Union[int, Decimal]
+        """
+
+        self.currency = currency
+        self.issuer = issuer
+        self.value = value
+
+    @classmethod
+    def from_xrpl(cls, amount: Union[str, Dict]) -> 'Amount':
+        """
+        Parse an amount as rippled returns it: a string of drops, or a currency/issuer/value dict
+
+        :param amount: Amount
+        :type amount: Union[str, Dict]
+
+        :return: Amount
+        :rtype: Amount
+        """
+
+        if type(amount) is str:
+            return cls('XRP', None, int(amount))
+        return cls(sys.intern(amount['currency']), sys.intern(amount['issuer']), _decimal(amount['value']))
+
+    @property
+    def is_xrp(self) -> bool:
+        return self.issuer is None
+
+    def to_xrpl(self) -> Union[str, Dict]:
+        """
+        The amount as rippled takes it
+
+        :return: String of drops, or a currency/issuer/value dict
+        :rtype: Union[str, Dict]
+        """
+
+        if self.issuer is None:
+            return str(self.value)
+        return {'currency': self.currency, 'issuer': self.issuer, 'value': str(self.value)}
+
+    def __eq__(self, other):
+        if not isinstance(other, Amount):
+            return NotImplemented
+        return (self.currency, self.issuer, self.value) == (other.currency, other.issuer, other.value)
+
+    def __repr__(self):
+        if self.issuer is None:
+            return f'Amount({self.value} drops)'
+        return f'Amount({self.value} {self.currency}.{self.issuer})'
+
+
+class TrustLine:
+    """
+    One trust line of ``account_lines``, with amounts parsed once into Decimals. Records are slotted and share
+    repeated amounts, currencies and addresses, so one takes about a third of the memory of the dict it is built from.
+    """
+
+    __slots__ = (
+        'account', 'currency', 'balance', 'limit', 'limit_peer', 'quality_in', 'quality_out', 'no_ripple',
+        'no_ripple_peer', 'authorized', 'peer_authorized', 'freeze', 'freeze_peer',
+    )
+
+    def __init__(
+            self, account: str, currency: str, balance: Decimal, limit: Decimal, limit_peer: Decimal,
+            quality_in: int = 0, quality_out: int = 0, no_ripple: bool = False, no_ripple_peer: bool = False,
+            authorized: bool = False, peer_authorized: bool = False, freeze: bool = False, freeze_peer: bool = False
+    ):
+        """
+        One trust line of an account.
+
+        :param account: Address of the other side of the line (the issuer, for tokens held)
+        :type account: str
+
+        :param currency: Currency code
+        :type currency: str
+
+        :param balance: Balance from the account's point of view, negative if the account owes it
+        :type balance: Decimal
+
+        :param limit: Most the account is willing to hold
+        :type limit: Decimal
+
+        :param limit_peer: Most the other side is willing to hold
+        :type limit_peer: Decimal
+
+        :param quality_in: Incoming quality, 0 for par
+        :type quality_in: int
+
+        :param quality_out: Outgoing quality, 0 for par
+        :type quality_out: int
+
+        :param no_ripple: No Ripple is set by the account
+        :type no_ripple: bool
+
+        :param no_ripple_peer: No Ripple is set by the other side
+        :type no_ripple_peer: bool
+
+        :param authorized: The account authorized the other side
+        :type authorized: bool
+
+        :param peer_authorized: The other side authorized the account
+        :type peer_authorized: bool
+
+        :param freeze: The account froze the line
+        :type freeze: bool
+
+        :param freeze_peer: The other side froze the line
+        :type freeze_peer: bool
+        """
+
+        self.account = account
+        self.currency = currency
+        self.balance = balance
+        self.limit = limit
+        self.limit_peer = limit_peer
+        self.quality_in = quality_in
+        self.quality_out = quality_out
+        self.no_ripple = no_ripple
+        self.no_ripple_peer = no_ripple_peer
+        self.authorized = authorized
+        self.peer_authorized = peer_authorized
+        self.freeze = freeze
+        self.freeze_peer = freeze_peer
+
+    @classmethod
+    def from_xrpl(cls, line: Dict) -> 'TrustLine':
+        """
+        Build a record from an ``account_lines`` entry
+
+        :param line: Entry of ``account_lines``'s ``lines``
+        :type line: Dict
+
+        :return: TrustLine
+        :rtype: TrustLine
+        """
+
+        return cls(
+            sys.intern(line['account']),
+            sys.intern(line['currency']),
+            _decimal(line['balance']),
+            _decimal(line['limit']),
+            _decimal(line['limit_peer']),
+            line.get('quality_in', 0),
+            line.get('quality_out', 0),
+            line.get('no_ripple', False),
+            line.get('no_ripple_peer', False),
+            line.get('authorized', False),
+            line.get('peer_authorized', False),
+            line.get('freeze', False),
+            line.get('freeze_peer', False),
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, TrustLine):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return f'TrustLine({self.currency}.{self.account}, balance={self.balance}, limit={self.limit})'
+
+
+class Offer:
+    """
+    One offer of ``account_offers``, with amounts parsed once. Slotted like :class:`TrustLine`.
+    """
+
+    __slots__ = ('seq', 'flags', 'taker_gets', 'taker_pays', 'quality', 'expiration')
+
+    def __init__(
+            self, seq: int, flags: int, taker_gets: Amount, taker_pays: Amount, quality: Decimal,
+            expiration: Optional[int] = None
+    ):
+        """
+        One offer of an account.
+
+        :param seq: Sequence of the OfferCreate that placed it, used to cancel it
+        :type seq: int
+
+        :param flags: Offer flags
+        :type flags: int
+
+        :param taker_gets: Amount the account sells
+        :type taker_gets: Amount
+
+        :param taker_pays: Amount the account buys
+        :type taker_pays: Amount
+
+        :param quality: Exchange rate, taker_pays per taker_gets
+        :type quality: Decimal
+
+        :param expiration: Expiration in seconds since the Ripple epoch, if any
+        :type expiration: Optional[int]
+        """
+
+        self.seq = seq
+        self.flags = flags
+        self.taker_gets = taker_gets
+        self.taker_pays = taker_pays
+        self.quality = quality
+        self.expiration = expiration
+
+    @classmethod
+    def from_xrpl(cls, offer: Dict) -> 'Offer':
+        """
+        Build a record from an ``account_offers`` entry
+
+        :param offer: Entry of ``account_offers``'s ``offers``
+        :type offer: Dict
+
+        :return: Offer
+        :rtype: Offer
+        """
+
+        return cls(
+            offer['seq'],
+            offer.get('flags', 0),
+            Amount.from_xrpl(offer['taker_gets']),
+            Amount.from_xrpl(offer['taker_pays']),
+            _decimal(offer['quality']),
+            offer.get('expiration'),
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, Offer):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return f'Offer(seq={self.seq}, taker_gets={self.taker_gets!r}, taker_pays={self.taker_pays!r})'
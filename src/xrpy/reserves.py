@@ -0,0 +1,126 @@
+import time
+
+from threading import Lock
+
+
+from typing import Optional, Dict, Tuple
+
+
+from xrpl.utils import xrp_to_drops
+
+
+__all__ = [
+    'Reserves',
+]
+
+
+# Seconds the reserves stay valid. They only change through fee voting, which takes effect on flag ledgers (every
+# 256 ledgers, about 15 minutes).
+_MAX_AGE = 900.0
+
+
+class Reserves:
+    """
+    The network's base and owner reserves, shared by every balance lookup and refreshed at most every ``max_age``
+    seconds.
+
+    Like :class:`xrpy.FeeOracle` it does no network I/O itself. The client asks :meth:`get` for the reserves and, when
+    they are stale, requests ``server_state`` (or ``server_info``) and hands the result to :meth:`update`.
+    """
+
+    def __init__(self, max_age: float = _MAX_AGE):
+        """
+        The network's base and owner reserves.
+
+        :param max_age: Seconds the reserves stay valid
+        :type max_age: float
+        """
+
+        self.max_age = max_age
+
+        self.refreshes = 0
+
+        self._lock = Lock()
+        self._reserves: Optional[Tuple[int, int]] = None
+        self._expires_at = 0.0
+
+    def get(self) -> Optional[Tuple[int, int]]:
+        """
+        Current reserves
+
+        :return: (base reserve, owner reserve per object) in drops, or None if they have to be refreshed with
+            :meth:`update`
+        :rtype: Optional[Tuple[int, int]]
+        """
+
+        with self._lock:
+            if self._reserves is None or time.monotonic() >= self._expires_at:
+                return None
+            return self._reserves
+
+    def update(self, result: Dict) -> Tuple[int, int]:
+        """
+        Refresh the reserves from a ``server_state`` or ``server_info`` response
+
+        :param result: ``server_state`` or ``server_info`` response result
+        :type result: Dict
+
+        :raises ValueError: If the result has no validated ledger to read the reserves from
+
+        :return: (base reserve, owner reserve per object) in drops
+        :rtype: Tuple[int, int]
+        """
+
+        if 'state' in result:
+            ledger = result['state'].get('validated_ledger') or {}
+            reserves = (int(ledger.get('reserve_base', 0)), int(ledger.get('reserve_inc', 0)))
+        else:
+            ledger = result.get('info', {}).get('validated_ledger') or {}
+            reserves = (
+                int(xrp_to_drops(ledger.get('reserve_base_xrp', 0))),
+                int(xrp_to_drops(ledger.get('reserve_inc_xrp', 0))),
+            )
+
+        if not ledger:
+            raise ValueError('The server has no validated ledger to read the reserves from')
+
+        with self._lock:
+            self._reserves = reserves
+            self._expires_at = time.monotonic() + self.max_age
+            self.refreshes += 1
+
+        return reserves
+
+    def invalidate(self) -> None:
+        """
+        Make the reserves stale, so the next lookup refreshes them
+
+        :return: None
+        """
+
+        with self._lock:
+            self._expires_at = 0.0
+
+    @staticmethod
+    def reserved(reserves: Tuple[int, int], owner_count: int, include_wallet_reserve: bool = True) -> int:
+        """
+        Drops an account holds back for its reserve
+
+        :param reserves: (base reserve, owner reserve per object) in drops, as :meth:`get` returns them
+        :type reserves: Tuple[int, int]
+
+        :param owner_count: The account's ``OwnerCount``: trust lines, offers, escrows, tickets and other owned objects
+        :type owner_count: int
+
+        :param include_wallet_reserve: Include the base reserve every account holds
+        :type include_wallet_reserve: bool
+
+        :return: Reserved drops
+        :rtype: int
+        """
+
+        base, increment = reserves
+        return owner_count * increment + (base if include_wallet_reserve else 0)
+
+    def __repr__(self):
+        return f'Reserves(reserves={self._reserves}, refreshes={self.refreshes})'
@@ -0,0 +1,95 @@
+from threading import Lock
+
+from typing import Dict, Optional
+
+
+__all__ = [
+    'SequenceManager',
+    'RESYNC_RESULTS',
+]
+
+
+# Engine results that mean our local view of the account Sequence is out of date.
+RESYNC_RESULTS = frozenset({'tefPAST_SEQ', 'terPRE_SEQ'})
+
+
+class SequenceManager:
+    """
+    Hands out account Sequence numbers locally.
+
+    The manager does no network I/O itself. The owner reads the account's Sequence once
+    (``account_info``), stores it with :meth:`sync`, and from then on every :meth:`allocate`
+    returns the next free number without asking the server again. When the server reports
+    that the local view is wrong, the owner calls :meth:`invalidate` and re-syncs.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._next: Dict[str, int] = {}
+
+    def is_synced(self, address: str) -> bool:
+        """
+        Check whether a Sequence is known for an address
+
+        :param address: Wallet address
+        :type address: str
+
+        :return: True if :meth:`allocate` can be called without syncing first
+        :rtype: bool
+        """
+
+        with self._lock:
+            return address in self._next
+
+    def sync(self, address: str, sequence: int) -> None:
+        """
+        Store the next valid Sequence of an address, as read from the ledger
+
+        :param address: Wallet address
+        :type address: str
+
+        :param sequence: The account's current ``Sequence`` field
+        :type sequence: int
+
+        :return: None
+        """
+
+        with self._lock:
+            self._next[address] = sequence
+
+    def allocate(self, address: str, count: int = 1) -> Optional[int]:
+        """
+        Reserve ``count`` consecutive Sequence numbers
+
+        :param address: Wallet address
+        :type address: str
+
+        :param count: How many numbers to reserve
+        :type count: int
+
+        :return: The first reserved Sequence, or None if the address is not synced
+        :rtype: Optional[int]
+        """
+
+        with self._lock:
+            first = self._next.get(address)
+            if first is None:
+                return None
+            self._next[address] = first + count
+            return first
+
+    def invalidate(self, address: str) -> None:
+        """
+        Forget the local Sequence of an address so the next allocation re-syncs
+
+        :param address: Wallet address
+        :type address: str
+
+        :return: None
+        """
+
+        with self._lock:
+            self._next.pop(address, None)
+
+    def __repr__(self):
+        return f'SequenceManager(accounts={len(self._next)})'
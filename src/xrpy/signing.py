@@ -0,0 +1,142 @@
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha512
+from itertools import repeat
+
+
+from typing import Optional, List, Tuple, Union, Sequence
+
+
+from xrpl.core.binarycodec import encode, encode_for_signing
+from xrpl.core.keypairs import sign
+from xrpl.models.transactions import Transaction
+from xrpl.wallet import Wallet
+
+
+__all__ = [
+    'prepare_and_sign',
+    'transaction_hash',
+]
+
+
+# Prefix of the data hashed into a transaction id ("TXN\0").
+_HASH_PREFIX = '54584E00'
+
+# Transactions sent to a worker process at a time.
+_CHUNK_SIZE = 500
+
+
+def transaction_hash(blob: str) -> str:
+    """
+    Hash of a signed transaction blob, as the ledger computes it
+
+    :param blob: Signed transaction blob (hex)
+    :type blob: str
+
+    :return: Transaction hash
+    :rtype: str
+    """
+
+    return sha512(bytes.fromhex(_HASH_PREFIX + blob)).hexdigest()[:64].upper()
+
+
+def _sign_chunk(
+        transactions: List[Tuple[Transaction, int]], fee: str, last_ledger_sequence: Optional[int],
+        private_key: str, public_key: str
+) -> List[Tuple[str, str]]:
+    """
+    Fill in and sign a chunk of transactions. Runs in a worker process.
+
+    :param transactions: (transaction, Sequence) pairs
+    :type transactions: List[Tuple[Transaction, int]]
+
+    :param fee: Fee in drops
+    :type fee: str
+
+    :param last_ledger_sequence: LastLedgerSequence, left out if None
+    :type last_ledger_sequence: Optional[int]
+
+    :param private_key: Signing private key
+    :type private_key: str
+
+    :param public_key: Signing public key
+    :type public_key: str
+
+    :return: (blob, hash) pairs
+    :rtype: List[Tuple[str, str]]
+    """
+
+    signed = []
+    for transaction, sequence in transactions:
+        transaction_json = transaction.to_xrpl()
+        transaction_json['Sequence'] = sequence
+        transaction_json['Fee'] = fee
+        transaction_json['SigningPubKey'] = public_key
+        if last_ledger_sequence is not None:
+            transaction_json['LastLedgerSequence'] = last_ledger_sequence
+
+        transaction_json['TxnSignature'] = sign(bytes.fromhex(encode_for_signing(transaction_json)), private_key)
+
+        blob = encode(transaction_json)
+        signed.append((blob, transaction_hash(blob)))
+
+    return signed
+
+
+def prepare_and_sign(
+        transactions: List[Transaction], wallet: Wallet, sequences: Union[int, Sequence[int]], fee: Union[str, int],
+        last_ledger_sequence: Optional[int], max_workers: int = None, chunk_size: int = _CHUNK_SIZE
+) -> List[Tuple[str, str]]:
+    """
+    Fill in and sign transactions without any network access, spreading the work over a process pool.
+
+    Serializing, hashing and signing are CPU-bound, so separate processes sign in parallel where threads would not.
+    Transactions are sent to the workers in chunks of ``chunk_size``; a single chunk is signed in the calling process.
+    Any Sequence, Fee or LastLedgerSequence already set on the transactions is replaced. Addresses must be classic
+    addresses.
+
+    The blobs can be submitted with :meth:`xrpy.XRPY.submit_signed`, in order. :meth:`xrpy.XRPY.prepare_signed`
+    fetches the Sequence, fee and LastLedgerSequence and calls this function.
+
+    :param transactions: Unsigned transactions, all from ``wallet``
+    :type transactions: List[Transaction]
+
+    :param wallet: Wallet to sign with
+    :type wallet: Wallet
+
+    :param sequences: First Sequence (the rest follow consecutively), or one Sequence per transaction
+    :type sequences: Union[int, Sequence[int]]
+
+    :param fee: Fee in drops for every transaction
+    :type fee: Union[str, int]
+
+    :param last_ledger_sequence: LastLedgerSequence for every transaction. None leaves it out, so the blobs can apply
+        at any later time and :meth:`xrpy.XRPY.submit_signed` can not wait for them.
+    :type last_ledger_sequence: Optional[int]
+
+    :param max_workers: max number of processes (default: one per CPU)
+    :type max_workers: int
+
+    :param chunk_size: Transactions per worker task
+    :type chunk_size: int
+
+    :raises ValueError: If the number of sequences does not match the number of transactions
+
+    :return: (blob, hash) pairs, in the same order as the transactions
+    :rtype: List[Tuple[str, str]]
+    """
+
+    if isinstance(sequences, int):
+        sequences = range(sequences, sequences + len(transactions))
+    if len(sequences) != len(transactions):
+        raise ValueError(f'Got {len(sequences)} sequences for {len(transactions)} transactions')
+
+    pairs = list(zip(transactions, sequences))
+    chunks = [pairs[i:i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+    keys = (str(fee), last_ledger_sequence, wallet.private_key, wallet.public_key)
+
+    if len(chunks) <= 1 or max_workers == 1:
+        return _sign_chunk(pairs, *keys)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as process_pool:
+        results = process_pool.map(_sign_chunk, chunks, *(repeat(key) for key in keys))
+        return [signed for chunk in results for signed in chunk]
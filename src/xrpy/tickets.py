@@ -0,0 +1,173 @@
+from threading import Lock
+
+
+from typing import Optional, Dict, Set, Iterable
+
+
+__all__ = [
+    'TicketPool',
+    'MAX_TICKETS',
+]
+
+
+# Most Tickets an account can own at once.
+MAX_TICKETS = 250
+
+# Default number of Tickets a pool keeps per account.
+_SIZE = 50
+
+# Default number of available Tickets below which the pool is topped up.
+_LOW_WATER = 10
+
+
+class TicketPool:
+    """
+    Per-account pool of Ticket sequences.
+
+    Every Ticket is either available or in use by a submitted transaction. The pool does no network I/O itself:
+    :meth:`sync` loads the Tickets an account owns on the ledger, :meth:`take` hands one out, and a Ticket goes back
+    with :meth:`release` if its transaction never made it into a ledger, or is dropped with :meth:`done` otherwise.
+    """
+
+    def __init__(self, size: int = _SIZE, low_water: int = _LOW_WATER):
+        """
+        Per-account pool of Ticket sequences.
+
+        :param size: Tickets to keep per account when topping up (at most 250)
+        :type size: int
+
+        :param low_water: Top up once fewer Tickets than this are available
+        :type low_water: int
+
+        :raises ValueError: If size is not between 1 and 250
+        """
+
+        if not 0 < size <= MAX_TICKETS:
+            raise ValueError(f'Ticket pool size must be between 1 and {MAX_TICKETS}')
+
+        self.size = size
+        self.low_water = low_water
+
+        self._lock = Lock()
+        self._available: Dict[str, Set[int]] = {}
+        self._in_use: Dict[str, Set[int]] = {}
+
+    def is_synced(self, address: str) -> bool:
+        """
+        Check whether the Tickets of an address have been loaded
+
+        :param address: Wallet address
+        :type address: str
+
+        :return: True if :meth:`sync` was called for the address
+        :rtype: bool
+        """
+
+        with self._lock:
+            return address in self._available
+
+    def sync(self, address: str, tickets: Iterable[int]) -> None:
+        """
+        Replace the available Tickets of an account with the ones it owns on the ledger, minus those in use
+
+        :param address: Wallet address
+        :type address: str
+
+        :param tickets: TicketSequence of every Ticket the account owns
+        :type tickets: Iterable[int]
+
+        :return: None
+        """
+
+        with self._lock:
+            self._available[address] = set(tickets) - self._in_use.get(address, set())
+
+    def take(self, address: str) -> Optional[int]:
+        """
+        Hand out the lowest available Ticket
+
+        :param address: Wallet address
+        :type address: str
+
+        :return: TicketSequence, or None if none is available
+        :rtype: Optional[int]
+        """
+
+        with self._lock:
+            available = self._available.get(address)
+            if not available:
+                return None
+
+            ticket = min(available)
+            available.remove(ticket)
+            self._in_use.setdefault(address, set()).add(ticket)
+
+        return ticket
+
+    def release(self, address: str, ticket: int) -> None:
+        """
+        Make a Ticket available again because its transaction can no longer use it up
+
+        :param address: Wallet address
+        :type address: str
+
+        :param ticket: TicketSequence
+        :type ticket: int
+
+        :return: None
+        """
+
+        with self._lock:
+            self._in_use.get(address, set()).discard(ticket)
+            self._available.setdefault(address, set()).add(ticket)
+
+    def done(self, address: str, ticket: int) -> None:
+        """
+        Forget a Ticket that was used up, or whose transaction has an unknown outcome. A later :meth:`sync` brings it
+        back if it is still on the ledger.
+
+        :param address: Wallet address
+        :type address: str
+
+        :param ticket: TicketSequence
+        :type ticket: int
+
+        :return: None
+        """
+
+        with self._lock:
+            self._in_use.get(address, set()).discard(ticket)
+
+    def available(self, address: str) -> int:
+        """
+        Number of Tickets ready to hand out
+
+        :param address: Wallet address
+        :type address: str
+
+        :return: Available Tickets
+        :rtype: int
+        """
+
+        with self._lock:
+            return len(self._available.get(address, ()))
+
+    def in_use(self, address: str) -> int:
+        with self._lock:
+            return len(self._in_use.get(address, ()))
+
+    def needs_top_up(self, address: str) -> bool:
+        """
+        Check whether fewer than ``low_water`` Tickets are available
+
+        :param address: Wallet address
+        :type address: str
+
+        :return: True if the account should create more Tickets
+        :rtype: bool
+        """
+
+        return self.available(address) < self.low_water
+
+    def __repr__(self):
+        return f'TicketPool(size={self.size}, low_water={self.low_water})'
@@ -0,0 +1,258 @@
+from typing import Union, Optional
+
+from xrpl.utils import xrp_to_drops
+
+from xrpl.models.transactions import Payment, TrustSet, TrustSetFlag, OfferCreate, OfferCancel, OfferCreateFlag, \
+    AccountDelete, TicketCreate
+from xrpl.models.amounts import IssuedCurrencyAmount
+
+
+__all__ = [
+    'xrp_payment',
+    'token_payment',
+    'trust_set',
+    'buy_offer',
+    'sell_offer',
+    'offer_cancel',
+    'account_delete',
+    'ticket_create',
+]
+
+
+def xrp_payment(account: str, amount: Union[int, float], destination: str) -> Payment:
+    """
+    Build an XRP payment
+
+    :param account: Sender address
+    :type account: str
+
+    :param amount: Amount to send in XRP
+    :type amount: Union[int, float]
+
+    :param destination: Destination address
+    :type destination: str
+
+    :return: Unsigned payment
+    :rtype: Payment
+    """
+
+    return Payment(
+        account=account,
+        amount=xrp_to_drops(amount),
+        destination=destination,
+    )
+
+
+def token_payment(
+        account: str, currency: str, amount: Union[int, float], destination: str, issuer: str
+) -> Payment:
+    """
+    Build a token payment
+
+    :param account: Sender address
+    :type account: str
+
+    :param currency: Currency to send
+    :type currency: str
+
+    :param amount: Amount to send
+    :type amount: Union[int, float]
+
+    :param destination: Destination address
+    :type destination: str
+
+    :param issuer: Issuer address
+    :type issuer: str
+
+    :return: Unsigned payment
+    :rtype: Payment
+    """
+
+    return Payment(
+        account=account,
+        amount=IssuedCurrencyAmount(
+            currency=currency,
+            value=amount,
+            issuer=issuer,
+        ),
+        destination=destination,
+    )
+
+
+def trust_set(account: str, currency: str, value: str, issuer: str) -> TrustSet:
+    """
+    Build a trust line change
+
+    :param account: Wallet address
+    :type account: str
+
+    :param currency: Trust line currency
+    :type currency: str
+
+    :param value: Trust line value
+    :type value: str
+
+    :param issuer: Trust line issuer
+    :type issuer: str
+
+    :return: Unsigned TrustSet
+    :rtype: TrustSet
+    """
+
+    return TrustSet(
+        account=account,
+        limit_amount=IssuedCurrencyAmount(
+            currency=currency.upper(),
+            value=value,
+            issuer=issuer,
+        ),
+        flags=TrustSetFlag.TF_SET_NO_RIPPLE
+    )
+
+
+def buy_offer(
+        account: str, taker_gets_xrp: Union[float, int],
+        taker_pays_currency: str, taker_pays_value: str, taker_pays_issuer: str,
+        _type: str
+) -> OfferCreate:
+    """
+    Build an offer paying XRP for a token
+
+    :param account: Wallet address
+    :type account: str
+
+    :param taker_gets_xrp: amount in xrp for taker gets
+    :type taker_gets_xrp: int
+
+    :param taker_pays_currency: Currency
+    :type taker_pays_currency: str
+
+    :param taker_pays_value: Value
+    :type taker_pays_value: str
+
+    :param taker_pays_issuer: Issuer
+    :type taker_pays_issuer: str
+
+    :param _type: Offer type (market or limit)
+    :type _type: str
+
+    :return: Unsigned OfferCreate
+    :rtype: OfferCreate
+    """
+
+    return OfferCreate(
+        account=account,
+        taker_gets=xrp_to_drops(taker_gets_xrp),
+        taker_pays=IssuedCurrencyAmount(
+            currency=taker_pays_currency,
+            value=taker_pays_value,
+            issuer=taker_pays_issuer,
+        ),
+        flags=OfferCreateFlag.TF_SELL if _type.lower() == 'market' else 0
+    )
+
+
+def sell_offer(
+        account: str, taker_pays_xrp: Union[float, int],
+        taker_gets_currency: str, taker_gets_value: str, taker_gets_issuer: str,
+        _type: str
+) -> OfferCreate:
+    """
+    Build an offer selling a token for XRP
+
+    :param account: Wallet address
+    :type account: str
+
+    :param taker_pays_xrp: amount in xrp for taker pays
+    :type taker_pays_xrp: int
+
+    :param taker_gets_currency: Currency
+    :type taker_gets_currency: str
+
+    :param taker_gets_value: Value
+    :type taker_gets_value: str
+
+    :param taker_gets_issuer: Issuer
+    :type taker_gets_issuer: str
+
+    :param _type: Offer type (market or limit)
+    :type _type: str
+
+    :return: Unsigned OfferCreate
+    :rtype: OfferCreate
+    """
+
+    return OfferCreate(
+        account=account,
+        taker_gets=IssuedCurrencyAmount(
+            currency=taker_gets_currency,
+            value=taker_gets_value,
+            issuer=taker_gets_issuer,
+        ),
+        taker_pays=xrp_to_drops(taker_pays_xrp),
+        flags=OfferCreateFlag.TF_SELL if _type.lower() == 'market' else 0
+    )
+
+
+def offer_cancel(account: str, offer_sequence: int) -> OfferCancel:
+    """
+    Build an offer cancellation
+
+    :param account: Wallet address
+    :type account: str
+
+    :param offer_sequence: The sequence number (or Ticket number) of a previous OfferCreate transaction.
+    :type offer_sequence: int
+
+    :return: Unsigned OfferCancel
+    :rtype: OfferCancel
+    """
+
+    return OfferCancel(
+        account=account,
+        offer_sequence=offer_sequence
+    )
+
+
+def account_delete(account: str, destination: str, destination_tag: Optional[int] = None) -> AccountDelete:
+    """
+    Build an account deletion
+
+    :param account: Address of the account to delete
+    :type account: str
+
+    :param destination: destination address
+    :type destination: str
+
+    :param destination_tag: destination tag
+    :type destination_tag: int
+
+    :return: Unsigned AccountDelete
+    :rtype: AccountDelete
+    """
+
+    return AccountDelete(
+        account=account,
+        destination=destination,
+        destination_tag=destination_tag
+    )
+
+
+def ticket_create(account: str, ticket_count: int) -> TicketCreate:
+    """
+    Build a Ticket creation
+
+    :param account: Wallet address
+    :type account: str
+
+    :param ticket_count: Number of Tickets to create (1 to 250)
+    :type ticket_count: int
+
+    :return: Unsigned TicketCreate
+    :rtype: TicketCreate
+    """
+
+    return TicketCreate(
+        account=account,
+        ticket_count=ticket_count
+    )
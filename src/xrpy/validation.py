@@ -0,0 +1,312 @@
+from asyncio import run_coroutine_threadsafe
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import Lock, Thread
+
+
+from typing import Optional, Dict, Set, Tuple, Union, Callable
+
+
+from xrpl.clients import WebsocketClient, XRPLRequestFailureException
+from xrpl.models.requests import Subscribe, Unsubscribe, StreamParameter, Request
+from xrpl.models.response import Response, ResponseStatus
+from xrpl.transaction import XRPLReliableSubmissionException
+
+
+__all__ = [
+    'ValidationTracker',
+]
+
+
+# Seconds the listener waits for a message before checking whether the tracker was closed.
+_LISTEN_TIMEOUT = 1.0
+
+# Seconds close() waits for the listener thread to stop.
+_CLOSE_TIMEOUT = 5.0
+
+# Type of the message close() puts on a caller's client to wake a listener blocked without a timeout.
+_WAKE = '_xrpy_close'
+
+# Validated transactions of watched accounts kept for hashes that are tracked after they validated.
+_RECENT = 10_000
+
+
+class ValidationTracker:
+    """
+    Tracks submitted transactions from a single WebSocket subscription instead of polling ``tx`` for each of them.
+
+    The tracker subscribes to the ``ledger`` stream and to the ``accounts`` stream of every watched account. Each
+    validated transaction of a watched account is matched against the pending set and resolves its future; every
+    closed ledger expires the pending transactions whose LastLedgerSequence it passed. A transaction is reported as
+    soon as the ledger holding it is validated, with no request per transaction.
+
+    An account must be watched (:meth:`watch`) before its transactions are submitted, so none of them is missed.
+    Transactions that validate before they are tracked are kept for a while and resolve at once.
+
+    The tracker reads every message of its client, so it needs a client of its own: pass a url, or a WebsocketClient
+    not used for anything else.
+    """
+
+    def __init__(self, client: Union[WebsocketClient, str], recent: int = _RECENT):
+        """
+        Tracks submitted transactions from a single WebSocket subscription.
+
+        :param client: WebSocket url, or a dedicated WebsocketClient
+        :type client: Union[WebsocketClient, str]
+
+        :param recent: Validated transactions kept for hashes tracked late
+        :type recent: int
+        """
+
+        self._owns_client = type(client) is str
+        self._client = WebsocketClient(client, timeout=_LISTEN_TIMEOUT) if self._owns_client else client
+
+        self.recent = recent
+        self.ledger_index: Optional[int] = None
+
+        self._lock = Lock()
+        self._accounts: Set[str] = set()
+        self._pending: Dict[str, Tuple[Future, int]] = {}
+        self._validated: Dict[str, Response] = OrderedDict()
+        self._thread: Optional[Thread] = None
+        self._running = False
+
+    def open(self) -> None:
+        """
+        Subscribe to the ledger stream and start listening on a background thread.
+
+        :raises XRPLRequestFailureException: If the subscription fails
+
+        :return: None
+        """
+
+        if self._running:
+            return
+
+        self._client.open()
+
+        response = self._request(Subscribe(streams=[StreamParameter.LEDGER]))
+        if not response.is_successful():
+            raise XRPLRequestFailureException(response.result)
+        self.ledger_index = response.result.get('ledger_index')
+
+        self._running = True
+        self._thread = Thread(target=self._listen, daemon=True)
+        self._thread.start()
+
+        with self._lock:
+            accounts, self._accounts = list(self._accounts), set()
+        for account in accounts:
+            self.watch(account)
+
+    def close(self) -> None:
+        """
+        Stop listening and fail every pending transaction. The client is closed if the tracker opened it, otherwise it
+        is unsubscribed and left open. Either way the listener thread is stopped and joined.
+
+        :return: None
+        """
+
+        if not self._running:
+            return
+
+        self._running = False
+        if not self._owns_client and self._client.is_open():
+            self._client.send(Unsubscribe(streams=[StreamParameter.LEDGER], accounts=list(self._accounts) or None))
+            self._wake()
+        self._thread.join(_CLOSE_TIMEOUT)
+        if self._owns_client:
+            self._client.close()
+
+        self._thread = None
+        self._fail_pending('The validation tracker was closed')
+
+    def __enter__(self) -> 'ValidationTracker':
+        self.open()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _request(self, request: Request) -> Response:
+        """
+        Send a request on the client's own loop thread
+
+        ``WebsocketClient.request`` starts an event loop of its own, which fails when called from a coroutine; this
+        works from both, so the tracker can serve :class:`xrpy.AsyncXRPY` too.
+
+        :param request: Request to send
+        :type request: Request
+
+        :return: Response
+        :rtype: Response
+        """
+
+        return run_coroutine_threadsafe(self._client._do_request_impl(request), self._client._loop).result()
+
+    def watch(self, account: str) -> None:
+        """
+        Subscribe to the transactions of an account. Does nothing if it is already watched.
+
+        :param account: Account address
+        :type account: str
+
+        :raises XRPLRequestFailureException: If the subscription fails
+
+        :return: None
+        """
+
+        with self._lock:
+            if account in self._accounts:
+                return
+            self._accounts.add(account)
+
+        if not self._running:
+            return
+
+        response = self._request(Subscribe(accounts=[account]))
+        if not response.is_successful():
+            with self._lock:
+                self._accounts.discard(account)
+            raise XRPLRequestFailureException(response.result)
+
+    def track(self, transaction_hash: str, last_ledger_sequence: int,
+              callback: Optional[Callable[[Response], None]] = None) -> Future:
+        """
+        Track a submitted transaction of a watched account
+
+        The future resolves to the validated transaction, shaped like a ``tx`` Response (``meta`` holds the final
+        result), or to an error Response whose ``error`` is ``'expired'`` once a ledger past ``last_ledger_sequence``
+        closes without it.
+
+        :param transaction_hash: Hash of the submitted transaction
+        :type transaction_hash: str
+
+        :param last_ledger_sequence: LastLedgerSequence of the submitted transaction
+        :type last_ledger_sequence: int
+
+        :param callback: Called with the Response once the outcome is known
+        :type callback: Optional[Callable[[Response], None]]
+
+        :return: Future of the Response
+        :rtype: Future
+        """
+
+        future = Future()
+        if callback is not None:
+            future.add_done_callback(lambda done: callback(done.result()) if done.exception() is None else None)
+
+        with self._lock:
+            response = self._validated.get(transaction_hash)
+            if response is None:
+                self._pending[transaction_hash] = (future, last_ledger_sequence)
+
+        if response is not None:
+            future.set_result(response)
+
+        return future
+
+    def wait(self, transaction_hash: str, last_ledger_sequence: int, timeout: Optional[float] = None) -> Response:
+        """
+        Block until the outcome of a submitted transaction is known. See :meth:`track`.
+
+        :param transaction_hash: Hash of the submitted transaction
+        :type transaction_hash: str
+
+        :param last_ledger_sequence: LastLedgerSequence of the submitted transaction
+        :type last_ledger_sequence: int
+
+        :param timeout: Seconds to wait, forever if None
+        :type timeout: Optional[float]
+
+        :return: Response
+        :rtype: Response
+        """
+
+        return self.track(transaction_hash, last_ledger_sequence).result(timeout)
+
+    def _wake(self) -> None:
+        # A caller's client may have no timeout, leaving the listener blocked until the next message: hand it one.
+        self._client._loop.call_soon_threadsafe(self._client._messages.put_nowait, {'type': _WAKE})
+
+    def _listen(self) -> None:
+        # Iteration ends when the client's timeout passes without a message; keep listening until closed.
+        while self._running and self._client.is_open():
+            for message in self._client:
+                if not self._running:
+                    return
+
+                message_type = message.get('type')
+                if message_type == 'transaction' and message.get('validated') is True:
+                    self._transaction_validated(message)
+                elif message_type == 'ledgerClosed':
+                    self._ledger_closed(message['ledger_index'])
+
+        if self._running:
+            self._fail_pending('The validation stream was closed')
+
+    def _transaction_validated(self, message: Dict) -> None:
+        """
+        Resolve the future of a validated transaction, or keep it in case it is tracked later
+
+        :param message: ``transaction`` stream message
+        :type message: Dict
+
+        :return: None
+        """
+
+        transaction_hash = message['transaction']['hash']
+        response = Response(status=ResponseStatus.SUCCESS, result=dict(
+            message['transaction'], meta=message['meta'], ledger_index=message['ledger_index'], validated=True
+        ))
+
+        with self._lock:
+            pending = self._pending.pop(transaction_hash, None)
+            if pending is None:
+                self._validated[transaction_hash] = response
+                while len(self._validated) > self.recent:
+                    self._validated.popitem(last=False)
+
+        if pending is not None:
+            pending[0].set_result(response)
+
+    def _ledger_closed(self, ledger_index: int) -> None:
+        """
+        Expire the pending transactions whose LastLedgerSequence is before a newly closed ledger
+
+        Transactions of a ledger are streamed after its ``ledgerClosed`` message, so a transaction is only given up on
+        once the ledger after its LastLedgerSequence closes.
+
+        :param ledger_index: Index of the closed ledger
+        :type ledger_index: int
+
+        :return: None
+        """
+
+        with self._lock:
+            self.ledger_index = ledger_index
+            expired = [
+                (transaction_hash, self._pending.pop(transaction_hash))
+                for transaction_hash, (_, last_ledger_sequence) in list(self._pending.items())
+                if last_ledger_sequence < ledger_index
+            ]
+
+        for transaction_hash, (future, last_ledger_sequence) in expired:
+            future.set_result(Response(status=ResponseStatus.ERROR, result={
+                'error': 'expired',
+                'error_message': f'Not validated before LastLedgerSequence {last_ledger_sequence}',
+                'hash': transaction_hash,
+            }))
+
+    def _fail_pending(self, reason: str) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        for future, _ in pending.values():
+            future.set_exception(XRPLReliableSubmissionException(reason))
+
+    def __len__(self):
+        return len(self._pending)
+
+    def __repr__(self):
+        return f'ValidationTracker(accounts={len(self._accounts)}, pending={len(self._pending)})'